@@ -1,21 +1,71 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Optional, Dict, Any
+import threading
+import uuid
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from typing import Optional, Dict, Any, List
 from app.indexing.engine import HybridSearchEngine
 from app.indexing.schemas import SearchRequest, SearchResponse, MaterialResponse
 from app.core.logging_factory import LoggerFactory
+from app.core.cache import LRUCache
 from app.core.config import settings
-import psycopg
+from app.core.db import PostgresClient, get_db
+from app.core.registry import Registry
 
 router = APIRouter(prefix="/search", tags=["search"])
 logger = LoggerFactory.get_logger(__name__)
 
 _engine_singleton: Optional[HybridSearchEngine] = None
+_engine_lock = threading.Lock()
+
+# Keyed on Registry.documents_version so a new ingest invalidates it in-process;
+# the TTL bounds staleness across workers.
+_meta_cache: LRUCache[int, Dict[str, Any]] = LRUCache(
+    maxsize=1, ttl=settings.METADATA_CACHE_TTL
+)
+# Documents are insert-only (ON CONFLICT DO NOTHING), so entries never go stale.
+_material_cache: LRUCache[str, MaterialResponse] = LRUCache(
+    maxsize=settings.MATERIAL_CACHE_SIZE
+)
+
+# Kept as constants so the pooled connections reuse the prepared plans.
+MATERIAL_SQL = """
+    SELECT id, metadata
+    FROM documents
+    WHERE id = %s
+"""
 
+MATERIALS_BATCH_SQL = """
+    SELECT id, metadata
+    FROM documents
+    WHERE id = ANY(%s::uuid[])
+"""
+
+# Single pass over documents: both aggregates share one scan via FILTER.
+METADATA_FIELDS_SQL = """
+  SELECT
+    json_build_object(
+      'years', COALESCE(array_agg(DISTINCT year ORDER BY year) FILTER (WHERE year IS NOT NULL), ARRAY[]::int[]),
+      'methods', COALESCE(array_agg(DISTINCT method ORDER BY method) FILTER (WHERE method IS NOT NULL), ARRAY[]::text[])
+    ) AS payload
+  FROM documents
+  WHERE year IS NOT NULL OR method IS NOT NULL
+"""
+
+
+def get_engine(request: Request) -> HybridSearchEngine:
+    """
+    Return the engine preloaded by the app lifespan (app.state.engine), or
+    lazily build a process-wide one when the router runs without it.
+    """
+    engine = getattr(request.app.state, "engine", None)
+    if engine is not None:
+        return engine
 
-def get_engine() -> HybridSearchEngine:
     global _engine_singleton
     if _engine_singleton is None:
-        _engine_singleton = HybridSearchEngine()
+        with _engine_lock:
+            if _engine_singleton is None:
+                _engine_singleton = HybridSearchEngine()
     return _engine_singleton
 
 
@@ -36,39 +86,78 @@ def search(
         raise HTTPException(status_code=500, detail="search failed")
 
 
+@router.get("/materials", response_model=List[MaterialResponse])
+async def get_materials(
+    ids: List[str] = Query(..., min_length=1),
+    db: PostgresClient = Depends(get_db),
+) -> List[MaterialResponse]:
+    """
+    Fetch several documents' metadata in one query (`?ids=a&ids=b`).
+    Results follow the requested order; unknown ids are skipped.
+    """
+    try:
+        wanted = [str(uuid.UUID(i)) for i in ids]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be UUIDs")
+
+    found: Dict[str, MaterialResponse] = {}
+    missing: List[str] = []
+    for doc_id in dict.fromkeys(wanted):
+        cached = _material_cache.get(doc_id)
+        if cached is not None:
+            found[doc_id] = cached
+        else:
+            missing.append(doc_id)
+
+    if missing:
+        for row in await db.afetchall(MATERIALS_BATCH_SQL, (missing,)):
+            resp = MaterialResponse(doc_id=str(row["id"]), metadata=row["metadata"])
+            found[resp.doc_id] = resp
+            _material_cache.set(resp.doc_id, resp)
+
+    return [found[i] for i in wanted if i in found]
+
+
 @router.get("/materials/{doc_id}", response_model=MaterialResponse)
-def get_material(doc_id: str) -> MaterialResponse:
+async def get_material(
+    doc_id: str, db: PostgresClient = Depends(get_db)
+) -> MaterialResponse:
     """
     Fetch a single document's metadata by id from Postgres.
+    Hot documents are served from an in-process LRU cache, keyed (like
+    `/materials?ids=`) on the canonical lower-case UUID so both routes share entries.
     """
-    sql = """
-        SELECT id, metadata
-        FROM documents
-        WHERE id = %s
-    """
-    with psycopg.connect(settings.POSTGRES_URI) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, (doc_id,))
-            row = cur.fetchone()
-            if not row:
-                raise HTTPException(status_code=404, detail="not found")
-            return MaterialResponse(doc_id=row[0], metadata=row[1])
+    try:
+        doc_id = str(uuid.UUID(doc_id))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="doc_id must be a UUID")
+
+    cached = _material_cache.get(doc_id)
+    if cached is not None:
+        return cached
+
+    row = await db.afetchone(MATERIAL_SQL, (doc_id,))
+    if not row:
+        raise HTTPException(status_code=404, detail="not found")
+    resp = MaterialResponse(doc_id=str(row["id"]), metadata=row["metadata"])
+    _material_cache.set(doc_id, resp)
+    return resp
 
 
 @router.get("/metadata")
-def list_metadata_fields() -> Dict[str, Any]:
+async def list_metadata_fields(
+    db: PostgresClient = Depends(get_db),
+) -> Dict[str, Any]:
     """
     Return simple aggregations to help clients build filters (MVP).
+    Results are cached for MRS_METADATA_CACHE_TTL seconds.
     """
-    sql = """
-      SELECT
-        json_build_object(
-          'years', COALESCE((SELECT array_agg(DISTINCT year ORDER BY year) FROM documents WHERE year IS NOT NULL), ARRAY[]::int[]),
-          'methods', COALESCE((SELECT array_agg(DISTINCT method ORDER BY method) FROM documents WHERE method IS NOT NULL), ARRAY[]::text[])
-        )
-    """
-    with psycopg.connect(settings.POSTGRES_URI) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql)
-            (payload,) = cur.fetchone()
-            return payload or {"years": [], "methods": []}
+    version = Registry.documents_version
+    cached = _meta_cache.get(version)
+    if cached is not None:
+        return cached
+
+    row = await db.afetchone(METADATA_FIELDS_SQL)
+    payload = (row or {}).get("payload") or {"years": [], "methods": []}
+    _meta_cache.set(version, payload)
+    return payload
@@ -1,12 +1,15 @@
 import asyncio
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+import httpx
+from fastapi import APIRouter, HTTPException, Request
 
+from app.core.config import settings
 from app.core.logging_factory import LoggerFactory
 from app.ingestion.simulation_ingestor import MaterialsProjectIngestor
 from app.ingestion.text_ingestor import EuropePMCIngestor
 from app.ingestion.timeseries_ingestor import TimeSeriesIngestor
-from app.core.db import PostgresClient
+from app.core.db import get_db
 from app.core.s3 import S3Client
 from app.core.registry import Registry
 
@@ -19,18 +22,20 @@ INGESTORS = {
     "experimental": TimeSeriesIngestor,
 }
 
-db = PostgresClient()
+db = get_db()
 s3 = S3Client()
 registry = Registry(db, s3)
-registry.bootstrap()
+_ingest_sem = asyncio.Semaphore(settings.INGEST_CONCURRENCY)
 
 
-async def run_one(source: str) -> dict:
+async def run_one(source: str, http: Optional[httpx.AsyncClient] = None) -> dict:
     """
     Instantiate the appropriate ingestor and run the asynchronous fetch and parse sequence.
+    At most MRS_INGEST_CONCURRENCY sources run at the same time.
 
     Args:
         source (str): The source type to ingest from. Must be one of 'text', 'simulation', or 'experimental'.
+        http (Optional[httpx.AsyncClient]): Shared HTTP client reused across ingestors.
 
     Returns:
         dict: A dictionary containing the number of rows ingested.
@@ -38,24 +43,25 @@ async def run_one(source: str) -> dict:
     Raises:
         HTTPException: If the source is invalid.
     """
-    if source == "text":
-        ing = EuropePMCIngestor(registry=registry)
-        raw = await ing.run_async(query="materials science", page=1, page_size=25)
-        return {"rows": len(raw)}
-    elif source == "simulation":
-        ing = MaterialsProjectIngestor(registry=registry)
-        raw = await ing.run_async(formula="Si", per_page=10)
-        return {"rows": len(raw)}
-    elif source == "experimental":
-        ing = TimeSeriesIngestor(registry=registry)
-        raw = await ing.run_async(path="data/raw/example_timeseries.csv")
-        return {"rows": len(raw)}
-    else:
-        raise HTTPException(status_code=400, detail=f"Invalid source: {source}")
+    async with _ingest_sem:
+        if source == "text":
+            ing = EuropePMCIngestor(registry=registry, http_client=http)
+            raw = await ing.run_async(query="materials science", page=1, page_size=25)
+            return {"rows": len(raw)}
+        elif source == "simulation":
+            ing = MaterialsProjectIngestor(registry=registry, http_client=http)
+            raw = await ing.run_async(formula="Si", per_page=10)
+            return {"rows": len(raw)}
+        elif source == "experimental":
+            ing = TimeSeriesIngestor(registry=registry, http_client=http)
+            raw = await ing.run_async(path="data/raw/example_timeseries.csv")
+            return {"rows": len(raw)}
+        else:
+            raise HTTPException(status_code=400, detail=f"Invalid source: {source}")
 
 
 @router.post("/{source}")
-async def ingest_source(source: str):
+async def ingest_source(source: str, request: Request):
     """
     Trigger ingestion for a given source or for all sources.
 
@@ -69,11 +75,12 @@ async def ingest_source(source: str):
         HTTPException: For invalid source or internal ingestion errors.
     """
     logger.info("Ingestion request received", extra={"source": source})
+    http = getattr(request.app.state, "http", None)
 
     try:
         if source == "all":
             names = list(INGESTORS.keys())
-            coros = [run_one(n) for n in names]
+            coros = [run_one(n, http) for n in names]
             results = await asyncio.gather(*coros, return_exceptions=True)
 
             summary = {}
@@ -90,7 +97,7 @@ async def ingest_source(source: str):
         if source not in INGESTORS:
             raise HTTPException(status_code=400, detail=f"Invalid source: {source}")
 
-        result = await run_one(source)
+        result = await run_one(source, http)
         return {"status": "success", "source": source, "result": result}
 
     except HTTPException:
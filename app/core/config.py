@@ -51,6 +51,45 @@ class Settings(BaseSettings):
         description="Postgres connection URI.",
         validation_alias="MRS_POSTGRES_URI",
     )
+    PG_POOL_MIN: int = Field(
+        default=4,
+        description="Minimum number of pooled Postgres connections.",
+        validation_alias="MRS_PG_POOL_MIN",
+    )
+    PG_POOL_MAX: int = Field(
+        default=10,
+        description="Maximum number of pooled Postgres connections.",
+        validation_alias="MRS_PG_POOL_MAX",
+    )
+    PG_POOL_TIMEOUT: float = Field(
+        default=10.0,
+        description="Seconds to wait for a pooled Postgres connection before failing.",
+        validation_alias="MRS_PG_POOL_TIMEOUT",
+    )
+
+    # --- Cache ---
+    METADATA_CACHE_TTL: float = Field(
+        default=60.0,
+        description="Seconds /search/metadata aggregations are served from cache.",
+        validation_alias="MRS_METADATA_CACHE_TTL",
+    )
+
+    MATERIAL_CACHE_SIZE: int = Field(
+        default=10_000,
+        description="Max /search/materials/{doc_id} responses kept in memory.",
+        validation_alias="MRS_MATERIAL_CACHE_SIZE",
+    )
+
+    SEARCH_CACHE_SIZE: int = Field(
+        default=1024,
+        description="Max /search responses (and query vectors) kept in memory.",
+        validation_alias="MRS_SEARCH_CACHE_SIZE",
+    )
+    SEARCH_CACHE_TTL: float = Field(
+        default=60.0,
+        description="Seconds a cached /search response stays valid.",
+        validation_alias="MRS_SEARCH_CACHE_TTL",
+    )
 
     # --- S3 / Minio ---
     S3_ENDPOINT_URL: str = Field(
@@ -100,6 +139,41 @@ class Settings(BaseSettings):
         description="Path of the log file (when enabled).",
         validation_alias="MRS_LOG_FILE",
     )
+    LOG_QUEUE_ENABLED: bool = Field(
+        default=True,
+        description="If true, format and write logs on a background thread.",
+        validation_alias="MRS_LOG_QUEUE_ENABLED",
+    )
+
+    # --- Ingestion ---
+    INGEST_CONCURRENCY: int = Field(
+        default=3,
+        description="Max ingestion sources run concurrently.",
+        validation_alias="MRS_INGEST_CONCURRENCY",
+    )
+
+    # --- Embedding ---
+    TEXT_BACKEND: Literal["torch", "onnx", "openvino"] = Field(
+        default="torch",
+        description="sentence-transformers inference backend for text embeddings.",
+        validation_alias="MRS_TEXT_BACKEND",
+    )
+    TEXT_MODEL_FILE: str = Field(
+        default="",
+        description='ONNX/OpenVINO file inside the model repo, e.g. "onnx/model_qint8_avx512_vnni.onnx".',
+        validation_alias="MRS_TEXT_MODEL_FILE",
+    )
+    TEXT_BATCH_SIZE: int = Field(
+        default=64,
+        description="Texts per forward pass in SbertTextEngine (encode length-sorts each call).",
+        validation_alias="MRS_TEXT_BATCH_SIZE",
+    )
+
+    FAISS_OMP_THREADS: int = Field(
+        default=0,
+        description="OpenMP threads used by FAISS search (0 keeps the FAISS default).",
+        validation_alias="MRS_FAISS_OMP_THREADS",
+    )
 
     # --- Api URL ---
     EUROPEPMC_API_URL: str = Field(
@@ -135,3 +209,6 @@ def get_settings() -> Settings:
 
 
 settings = get_settings()
+
+# Serialized once: AnyUrl.__str__ rebuilds the URL on every call.
+POSTGRES_DSN: str = str(settings.POSTGRES_URI)
@@ -1,69 +1,174 @@
-from contextlib import contextmanager
-from typing import Any, Iterable, Iterator, Sequence
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable, Iterator, Sequence
 
 import psycopg
-from psycopg import Connection, Cursor
+from psycopg import AsyncConnection, Connection, Cursor
 from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
-from app.core.config import settings
+from app.core.config import POSTGRES_DSN, settings
 
 
 class PostgresClient:
     """
     PostgreSQL client.
 
-    - Connection factory with dict_row for convenient results
+    - Pooled connections (psycopg_pool) with dict_row for convenient results
     - Helpers for execute/executemany/fetchone/fetchall
+    - Async read helpers (afetchone/afetchall) backed by an AsyncConnectionPool
     - Transaction context manager
     """
 
-    def __init__(self, dsn: str | None = None, autocommit: bool = True) -> None:
-        self._dsn = dsn or str(settings.POSTGRES_URI)
+    def __init__(
+        self,
+        dsn: str | None = None,
+        autocommit: bool = True,
+        min_size: int | None = None,
+        max_size: int | None = None,
+    ) -> None:
+        self._dsn = dsn or POSTGRES_DSN
         self._autocommit = autocommit
+        self._min_size = min_size or settings.PG_POOL_MIN
+        self._max_size = max(max_size or settings.PG_POOL_MAX, self._min_size)
+        self._timeout = settings.PG_POOL_TIMEOUT
+        self._pool: ConnectionPool | None = None
+        self._async_pool: AsyncConnectionPool | None = None
+        self._async_pool_lock = asyncio.Lock()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """
+        Lazily open the connection pool on first use so that importing a module
+        holding a client does not hit the database.
+        """
+        if self._pool is None:
+            self._pool = ConnectionPool(
+                self._dsn,
+                min_size=self._min_size,
+                max_size=self._max_size,
+                timeout=self._timeout,
+                kwargs={"autocommit": self._autocommit, "row_factory": dict_row},
+                open=True,
+            )
+        return self._pool
+
+    async def get_async_pool(self) -> AsyncConnectionPool:
+        """
+        Lazily open the async pool from within the running event loop. Waits until
+        `min_size` connections are up (at most MRS_PG_POOL_TIMEOUT seconds), so a
+        bad DSN fails here rather than on the first query.
+        """
+        if self._async_pool is None:
+            async with self._async_pool_lock:
+                if self._async_pool is None:
+                    pool = AsyncConnectionPool(
+                        self._dsn,
+                        min_size=self._min_size,
+                        max_size=self._max_size,
+                        timeout=self._timeout,
+                        kwargs={
+                            "autocommit": self._autocommit,
+                            "row_factory": dict_row,
+                        },
+                        open=False,
+                    )
+                    try:
+                        await pool.open(wait=True, timeout=self._timeout)
+                    except BaseException:
+                        await pool.close()
+                        raise
+                    self._async_pool = pool
+        return self._async_pool
 
     def connect(self) -> Connection:
+        """Open a standalone (non-pooled) connection."""
         return psycopg.connect(
             self._dsn, autocommit=self._autocommit, row_factory=dict_row
         )
 
     @contextmanager
     def connection(self) -> Iterator[Connection]:
-        conn = self.connect()
-        try:
+        """Borrow a connection from the pool and return it on exit."""
+        with self.pool.connection() as conn:
             yield conn
-        finally:
-            conn.close()
 
     @contextmanager
     def transaction(self) -> Iterator[Connection]:
         """
-        Open a connection with autocommit disabled and yield it within a transaction.
+        Borrow a pooled connection and yield it within a transaction.
         Commits on successful exit, rolls back on exception.
         """
-        conn = psycopg.connect(self._dsn, autocommit=False, row_factory=dict_row)
-        try:
+        with self.connection() as conn, conn.transaction():
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+
+    @asynccontextmanager
+    async def aconnection(self) -> AsyncIterator[AsyncConnection]:
+        """Borrow a connection from the async pool and return it on exit."""
+        pool = await self.get_async_pool()
+        async with pool.connection() as conn:
+            yield conn
+
+    def close(self) -> None:
+        """Close the pool (if opened). Safe to call multiple times."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    async def aclose(self) -> None:
+        """Close the async pool (if opened). Safe to call multiple times."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
 
     def execute(self, sql: str, params: Sequence[Any] | None = None) -> None:
         with self.connection() as conn, conn.cursor() as cur:
             cur.execute(sql, params or ())
 
     def executemany(self, sql: str, seq_of_params: Iterable[Sequence[Any]]) -> None:
-        with self.connection() as conn, conn.cursor() as cur:
+        """
+        Execute `sql` for each parameter set in pipeline mode: statements are
+        sent back-to-back and results are synced once, instead of one
+        round-trip per row.
+        """
+        with self.connection() as conn, conn.pipeline(), conn.cursor() as cur:
             cur.executemany(sql, seq_of_params)
 
     def fetchone(self, sql: str, params: Sequence[Any] | None = None) -> dict | None:
-        with self.connection() as conn, conn.cursor() as cur:
-            cur.execute(sql, params or ())
+        """
+        Run a read query and return the first row. The statement is prepared
+        server-side so repeated reads on a pooled connection reuse the plan, and
+        results use the binary protocol (no text encoding of uuid/jsonb columns).
+        """
+        with self.connection() as conn, conn.cursor(binary=True) as cur:
+            cur.execute(sql, params or (), prepare=True)
             return cur.fetchone()
 
     def fetchall(self, sql: str, params: Sequence[Any] | None = None) -> list[dict]:
-        with self.connection() as conn, conn.cursor() as cur:
-            cur.execute(sql, params or ())
+        """Run a (prepared, binary) read query and return all rows."""
+        with self.connection() as conn, conn.cursor(binary=True) as cur:
+            cur.execute(sql, params or (), prepare=True)
             return cur.fetchall()
+
+    async def afetchone(
+        self, sql: str, params: Sequence[Any] | None = None
+    ) -> dict | None:
+        """Async counterpart of fetchone(), releasing the event loop during I/O."""
+        async with self.aconnection() as conn, conn.cursor(binary=True) as cur:
+            await cur.execute(sql, params or (), prepare=True)
+            return await cur.fetchone()
+
+    async def afetchall(
+        self, sql: str, params: Sequence[Any] | None = None
+    ) -> list[dict]:
+        """Async counterpart of fetchall()."""
+        async with self.aconnection() as conn, conn.cursor(binary=True) as cur:
+            await cur.execute(sql, params or (), prepare=True)
+            return await cur.fetchall()
+
+
+@lru_cache(maxsize=1)
+def get_db() -> PostgresClient:
+    """Process-wide shared PostgresClient (one pool per process)."""
+    return PostgresClient()
@@ -1,46 +1,61 @@
-import json
+import atexit
+import copy
 import logging
 import os
-from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
-from typing import Any, Dict
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
 
 from app.core.config import settings
 
-_STD_KEYS = {
-    "name",
-    "msg",
-    "args",
-    "levelname",
-    "levelno",
-    "pathname",
-    "filename",
-    "module",
-    "exc_info",
-    "exc_text",
-    "stack_info",
-    "lineno",
-    "funcName",
-    "created",
-    "msecs",
-    "relativeCreated",
-    "thread",
-    "threadName",
-    "processName",
-    "process",
-    "message",
-    "asctime",
-}
+_STD_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "asctime",
+        "taskName",
+    }
+)
 """Set of standard LogRecord attribute names to exclude from extra fields."""
 
 
 class JsonFormatter(logging.Formatter):
     """Formatter that outputs logs as JSON with support for custom extra fields and UTC timestamps."""
 
+    _time_cache: Tuple[int, str] = (-1, "")
+    """Last formatted whole second as (epoch_seconds, "YYYY-MM-DDTHH:MM:SS")."""
+
     def formatTime(self, record, datefmt=None):
-        """Format the time of the log record as an ISO-8601 UTC timestamp with milliseconds precision."""
-        dt = datetime.fromtimestamp(record.created, tz=timezone.utc)
-        return dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        """Format the time of the log record as an ISO-8601 UTC timestamp with milliseconds precision.
+        The seconds prefix is reused across records emitted within the same second."""
+        sec = int(record.created)
+        cached_sec, prefix = JsonFormatter._time_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            JsonFormatter._time_cache = (sec, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
 
     def format(self, record: logging.LogRecord) -> str:
         """Build a JSON structure containing standard log fields and any extra fields,
@@ -71,12 +86,34 @@ class JsonFormatter(logging.Formatter):
         if record.stack_info:
             log_record["stack"] = self.formatStack(record.stack_info)
 
-        return json.dumps(log_record, ensure_ascii=False)
+        return orjson.dumps(
+            log_record, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+
+class _LogSettings(NamedTuple):
+    """Plain snapshot of the logging-related settings, read once per configuration."""
+
+    fmt: str
+    level: str
+    file_enabled: bool
+    file: str
+    queue_enabled: bool
+
+
+def _snapshot_settings() -> _LogSettings:
+    """Copy the logging settings into plain values so handlers never touch `settings`."""
+    return _LogSettings(
+        fmt=(settings.LOG_FORMAT or "json").lower(),
+        level=(settings.LOG_LEVEL or "INFO").upper(),
+        file_enabled=bool(settings.LOG_FILE_ENABLED),
+        file=settings.LOG_FILE or "logs/app.log",
+        queue_enabled=bool(settings.LOG_QUEUE_ENABLED),
+    )
 
 
-def _make_formatter() -> logging.Formatter:
-    """Select and return a JSON or plain-text formatter based on the LOG_FORMAT setting."""
-    fmt = (settings.LOG_FORMAT or "json").lower()
+def _make_formatter(fmt: str) -> logging.Formatter:
+    """Select and return a JSON or plain-text formatter for the given LOG_FORMAT value."""
     if fmt == "json":
         return JsonFormatter()
     return logging.Formatter(
@@ -85,45 +122,81 @@ def _make_formatter() -> logging.Formatter:
     )
 
 
+class _RecordQueueHandler(QueueHandler):
+    """QueueHandler that only merges the message args before enqueueing, keeping
+    extras, exc_info and stack_info intact for the formatter on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class LoggerFactory:
     """Factory class responsible for configuring the root logger and providing logger instances."""
 
     _configured = False
+    _listener: Optional[QueueListener] = None
 
     @classmethod
     def _configure(cls) -> None:
         """Configure the root logger with console and optional rotating file handlers,
-        avoiding duplicate handlers on reload."""
+        avoiding duplicate handlers on reload. When LOG_QUEUE_ENABLED is set, the root
+        logger only enqueues records and a background QueueListener formats and writes them.
+        """
         if cls._configured:
             return
 
-        level = (settings.LOG_LEVEL or "INFO").upper()
-        formatter = _make_formatter()
+        conf = _snapshot_settings()
+        formatter = _make_formatter(conf.fmt)
 
         root = logging.getLogger()
-        root.setLevel(level)
+        root.setLevel(conf.level)
         root.handlers.clear()
 
         console = logging.StreamHandler()
         console.setFormatter(formatter)
-        root.addHandler(console)
+        handlers: List[logging.Handler] = [console]
 
-        if bool(settings.LOG_FILE_ENABLED):
-            log_file = settings.LOG_FILE or "logs/app.log"
+        if conf.file_enabled:
+            log_file = conf.file
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
             file_handler = RotatingFileHandler(
                 log_file, maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8"
             )
             file_handler.setFormatter(formatter)
-            root.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        cls.shutdown()
+        if conf.queue_enabled:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            root.addHandler(_RecordQueueHandler(log_queue))
+            cls._listener = QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            cls._listener.start()
+        else:
+            for handler in handlers:
+                root.addHandler(handler)
 
         for noisy in ("uvicorn", "uvicorn.access"):
             logging.getLogger(noisy).propagate = True
 
         cls._configured = True
 
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the background listener (if any) after draining queued records."""
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
+
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """Ensure logging is configured and return a logger instance by name."""
         cls._configure()
         return logging.getLogger(name)
+
+
+atexit.register(LoggerFactory.shutdown)
@@ -1,19 +1,36 @@
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, Any, Optional
+from typing import Iterable, Any, Optional, Sequence
 import uuid
-import json
 from pathlib import Path
 
+import orjson
+
 from app.core.db import PostgresClient
 from app.core.s3 import S3Client
 from app.core.logging_factory import LoggerFactory
 
 logger = LoggerFactory.get_logger(__name__)
 
+_UTC = timezone.utc
+
+
+@dataclass(frozen=True)
+class RawAssetSpec:
+    """A local raw file to upload and register in `raw_assets`."""
+
+    source: str
+    local_path: str
+    source_id: Optional[str] = None
+    run_id: Optional[str] = None
+
 
 class Registry:
     """High-level persistence orchestrator (DB + S3)."""
 
+    # Bumped whenever documents are written; read-side caches key on it.
+    documents_version: int = 0
+
     DDL = """
     CREATE TABLE IF NOT EXISTS ingest_runs (
       id UUID PRIMARY KEY,
@@ -54,21 +71,36 @@ class Registry:
         self.db = db
         self.s3 = s3
 
+    TABLES = ("ingest_runs", "raw_assets", "documents")
+
+    def is_bootstrapped(self) -> bool:
+        """Cheap catalog lookup telling whether all registry tables exist."""
+        row = self.db.fetchone(
+            "SELECT bool_and(to_regclass(t) IS NOT NULL) AS ready "
+            "FROM unnest(%s::text[]) AS t",
+            (list(self.TABLES),),
+        )
+        return bool(row and row["ready"])
+
     def bootstrap(self) -> None:
+        if self.is_bootstrapped():
+            logger.info("Registry tables already present, skipping DDL")
+            return
         logger.info("Bootstrapping registry tables")
         self.db.execute(self.DDL)
 
     def start_run(self, source: str, extra: Optional[dict] = None) -> str:
-        run_id = str(uuid.uuid4())
+        run_uuid = uuid.uuid4()
+        run_id = str(run_uuid)
         logger.info("Starting ingestion run for source=%s with id=%s", source, run_id)
         self.db.execute(
             "INSERT INTO ingest_runs (id, source, started_at, status, extra) VALUES (%s,%s,%s,%s,%s)",
             (
-                run_id,
+                run_uuid,
                 source,
-                datetime.now(timezone.utc),
+                datetime.now(_UTC),
                 "running",
-                json.dumps(extra or {}),
+                orjson.dumps(extra or {}).decode(),
             ),
         )
         return run_id
@@ -77,83 +109,137 @@ class Registry:
         logger.info("Ending run %s with status=%s", run_id, status)
         self.db.execute(
             "UPDATE ingest_runs SET ended_at=%s, status=%s WHERE id=%s",
-            (datetime.now(timezone.utc), status, run_id),
+            (datetime.now(_UTC), status, run_id),
         )
 
+    RAW_INSERT = (
+        "INSERT INTO raw_assets (id, run_id, source, source_id, s3_uri, bytes, created_at) "
+        "VALUES (%s,%s,%s,%s,%s,%s,%s)"
+    )
+
     def record_raw(
         self, *, run_id: str | None, source: str, source_id: str | None, local_path: str
     ) -> str:
-        logger.info(
-            "Recording raw asset for source=%s, source_id=%s, path=%s",
-            source,
-            source_id,
-            local_path,
+        spec = RawAssetSpec(
+            source=source, local_path=local_path, source_id=source_id, run_id=run_id
         )
-        size = Path(local_path).stat().st_size
-        key = self.s3.make_key(f"raw/{source}")
-        uri = self.s3.upload_file(local_path, key)
-        self.db.execute(
-            "INSERT INTO raw_assets (id, run_id, source, source_id, s3_uri, bytes, created_at) "
-            "VALUES (%s,%s,%s,%s,%s,%s,%s)",
-            (
-                str(uuid.uuid4()),
-                run_id,
-                source,
-                source_id,
+        return self.record_raw_many([spec])[0]
+
+    def record_raw_many(
+        self, specs: Sequence["RawAssetSpec"], *, max_workers: int = 8
+    ) -> list[str]:
+        """
+        Upload several raw files and register them with a single batched INSERT.
+        Uploads go through `S3Client.upload_many` (concurrent, order kept).
+        Returns the S3 URIs in the order of `specs`.
+        """
+        if not specs:
+            return []
+        for spec in specs:
+            logger.info(
+                "Recording raw asset for source=%s, source_id=%s, path=%s",
+                spec.source,
+                spec.source_id,
+                spec.local_path,
+            )
+
+        sizes = [Path(spec.local_path).stat().st_size for spec in specs]
+        uris = self.s3.upload_many(
+            [
+                (spec.local_path, self.s3.make_key(f"raw/{spec.source}"))
+                for spec in specs
+            ],
+            max_workers=max_workers,
+        )
+
+        now = datetime.now(_UTC)
+        rows = [
+            (uuid.uuid4(), spec.run_id, spec.source, spec.source_id, uri, size, now)
+            for spec, size, uri in zip(specs, sizes, uris)
+        ]
+        if len(rows) == 1:
+            self.db.execute(self.RAW_INSERT, rows[0])
+        else:
+            self.db.executemany(self.RAW_INSERT, rows)
+        return uris
+
+    DOC_COLUMNS = (
+        "id, kind, source, source_id, material_hash, year, method, s3_uri, "
+        "created_at, metadata"
+    )
+
+    @staticmethod
+    def _doc_row(d: Any, uri: str) -> tuple:
+        """Build one `documents` row from a pydantic model or plain mapping."""
+        if hasattr(d, "__pydantic_serializer__"):
+            # One pydantic-core JSON pass for the metadata; the row columns are read
+            # from the field dict (filled alike by validation and model_construct)
+            # rather than from a second, full model_dump().
+            fields = d.__dict__
+            uid = fields["uid"]
+            material = fields.get("material")
+            return (
+                uid if isinstance(uid, uuid.UUID) else uuid.UUID(str(uid)),
+                fields["kind"],
+                fields["source"],
+                fields.get("source_id"),
+                getattr(material, "material_hash", None),
+                fields.get("year"),
+                fields.get("method"),
                 uri,
-                size,
-                datetime.now(timezone.utc),
-            ),
+                fields.get("created_at"),
+                d.__pydantic_serializer__.to_json(d).decode("utf-8"),
+            )
+
+        payload = d.model_dump() if hasattr(d, "model_dump") else dict(d)
+        metadata_json = orjson.dumps(
+            payload, default=str, option=orjson.OPT_NAIVE_UTC
+        ).decode("utf-8")
+        uid = payload["uid"]
+        return (
+            uid if isinstance(uid, uuid.UUID) else uuid.UUID(str(uid)),
+            payload["kind"],
+            payload["source"],
+            payload.get("source_id"),
+            (payload.get("material") or {}).get("material_hash"),
+            payload.get("year"),
+            payload.get("method"),
+            uri,
+            payload.get("created_at"),
+            metadata_json,
         )
-        return uri
 
     def record_docs(self, docs: Iterable[Any], *, local_jsonl: str) -> str:
-        docs = list(docs)
-        logger.info(
-            "Recording %d standardized documents from %s", len(docs), local_jsonl
-        )
+        """
+        Upload the standardized JSONL and register its documents.
+
+        Rows are streamed with COPY into a transaction-scoped staging table, then
+        merged with `ON CONFLICT (id) DO NOTHING`, so `docs` is never materialized.
+        """
+        logger.info("Recording standardized documents from %s", local_jsonl)
         key = self.s3.make_key("standardized")
         uri = self.s3.upload_file(local_jsonl, key)
 
-        def _json_default(o):
-            from datetime import datetime as _dt
-
-            return o.isoformat() if isinstance(o, _dt) else str(o)
-
-        rows = []
-        for d in docs:
-            if hasattr(d, "model_dump_json"):
-                metadata_json = d.model_dump_json()
-                payload = d.model_dump()
-                created_at = getattr(d, "created_at", payload.get("created_at"))
-            elif hasattr(d, "model_dump"):
-                payload = d.model_dump()
-                metadata_json = json.dumps(payload, default=_json_default)
-                created_at = payload.get("created_at")
-            else:
-                payload = dict(d)
-                metadata_json = json.dumps(payload, default=_json_default)
-                created_at = payload.get("created_at")
-
-            rows.append(
-                (
-                    payload["uid"],
-                    payload["kind"],
-                    payload["source"],
-                    payload.get("source_id"),
-                    (payload.get("material") or {}).get("material_hash"),
-                    payload.get("year"),
-                    payload.get("method"),
-                    uri,
-                    created_at,
-                    metadata_json,
-                )
+        count = 0
+        with self.db.transaction() as conn, conn.cursor() as cur:
+            cur.execute(
+                "CREATE TEMP TABLE documents_stage "
+                "(LIKE documents INCLUDING DEFAULTS) ON COMMIT DROP"
             )
+            with cur.copy(
+                f"COPY documents_stage ({self.DOC_COLUMNS}) FROM STDIN"
+            ) as copy:
+                for d in docs:
+                    copy.write_row(self._doc_row(d, uri))
+                    count += 1
+            if count:
+                cur.execute(
+                    f"INSERT INTO documents ({self.DOC_COLUMNS}) "
+                    f"SELECT {self.DOC_COLUMNS} FROM documents_stage "
+                    "ON CONFLICT (id) DO NOTHING"
+                )
 
-        if rows:
-            self.db.executemany(
-                "INSERT INTO documents (id, kind, source, source_id, material_hash, year, method, s3_uri, created_at, metadata) "
-                "VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s) ON CONFLICT (id) DO NOTHING",
-                rows,
-            )
+        if count:
+            Registry.documents_version += 1
+        logger.info("Recorded %d standardized documents from %s", count, local_jsonl)
         return uri
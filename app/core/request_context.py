@@ -1,7 +1,6 @@
 import time
 import uuid
 
-from fastapi import Request
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.logging_factory import LoggerFactory
@@ -30,11 +29,17 @@ class RequestLoggingMiddleware:
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
 
-        request = Request(scope, receive=receive)
-        request_id = request.headers.get("x-request-id", str(uuid.uuid4()))
-        method = request.method
+        # Read the header straight from the scope (no Request object per call).
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None:
+            request_id = str(uuid.uuid4())
+        method = scope["method"]
         path = scope.get("path", "-")
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
 
         status_code_holder = {"value": 500}  # par défaut si exception
 
@@ -53,7 +58,7 @@ class RequestLoggingMiddleware:
         try:
             await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            duration_ms = int((time.perf_counter() - start) * 1000)
+            duration_ms = (time.perf_counter_ns() - start) // 1_000_000
             self.logger.error(
                 "unhandled exception",
                 extra={
@@ -67,7 +72,7 @@ class RequestLoggingMiddleware:
             )
             raise
         else:
-            duration_ms = int((time.perf_counter() - start) * 1000)
+            duration_ms = (time.perf_counter_ns() - start) // 1_000_000
             self.logger.info(
                 "request handled",
                 extra={
@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 import uuid
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 from botocore.exceptions import ClientError
 
@@ -12,7 +14,8 @@ class S3Client:
     """
     Minimal S3/MinIO client.
 
-    - Upload/download files and bytes
+    - Upload/download files and bytes (multipart + concurrent parts above 8 MiB)
+    - Upload many files concurrently
     - Build stable object keys
     - Existence check, delete, presigned URLs
     """
@@ -34,7 +37,13 @@ class S3Client:
         self._s3 = self._session.client(
             "s3",
             endpoint_url=endpoint_url or settings.S3_ENDPOINT_URL,
-            config=Config(signature_version="s3v4"),
+            config=Config(signature_version="s3v4", max_pool_connections=32),
+        )
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=16,
+            use_threads=True,
         )
 
     @staticmethod
@@ -48,9 +57,21 @@ class S3Client:
 
     def upload_file(self, local_path: str | Path, key: str) -> str:
         p = Path(local_path)
-        self._s3.upload_file(str(p), self.bucket, key)
+        self._s3.upload_file(str(p), self.bucket, key, Config=self._transfer_config)
         return self.to_uri(self.bucket, key)
 
+    def upload_many(
+        self, items: Sequence[tuple[str | Path, str]], *, max_workers: int = 8
+    ) -> list[str]:
+        """
+        Upload (local_path, key) pairs concurrently (the boto3 client is
+        thread-safe). Returns the S3 URIs in input order.
+        """
+        if len(items) <= 1:
+            return [self.upload_file(p, k) for p, k in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+            return list(ex.map(lambda item: self.upload_file(*item), items))
+
     def upload_bytes(
         self, data: bytes, key: str, content_type: Optional[str] = None
     ) -> str:
@@ -63,7 +84,7 @@ class S3Client:
     def download_file(self, key: str, local_path: str | Path) -> Path:
         p = Path(local_path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        self._s3.download_file(self.bucket, key, str(p))
+        self._s3.download_file(self.bucket, key, str(p), Config=self._transfer_config)
         return p
 
     def get_object_bytes(self, key: str) -> bytes:
@@ -0,0 +1,209 @@
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional, Sequence
+
+from app.embedding.jsonl import embed_jsonl
+from app.embedding.store import EmbeddingStore
+
+# Engines built in this process, keyed by (engine class, device); lets a pool
+# worker reuse one loaded model across all the shards it is handed.
+_engines: dict[tuple[type, Optional[str]], Any] = {}
+# Torch intra-op threads of a pool worker (set by `_init_worker`): N workers share
+# the cores instead of each running one thread per core.
+_worker_threads: Optional[int] = None
+
+
+def _init_worker(threads: int) -> None:
+    global _worker_threads
+    _worker_threads = threads
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+
+
+def _pool_context():
+    """forkserver (spawn where unavailable): no fork of a parent that loaded torch."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def _get_engine(engine_cls: type, engine_kwargs: dict, device: Optional[str]):
+    key = (engine_cls, device)
+    if key not in _engines:
+        kwargs = dict(engine_kwargs)
+        if device is not None:
+            kwargs["device"] = device
+        _engines[key] = engine_cls(**kwargs)
+        if _worker_threads is not None and "torch" in sys.modules:
+            sys.modules["torch"].set_num_threads(_worker_threads)
+    return _engines[key]
+
+
+def _embed_shard(
+    engine_cls: type,
+    engine_kwargs: dict,
+    device: Optional[str],
+    jsonl_path: str,
+    *,
+    filter_kind: Optional[str],
+):
+    """Embed one JSONL shard; returns (engine name, ids, vectors, docs read)."""
+    engine = _get_engine(engine_cls, engine_kwargs, device)
+    ids, vecs, seen = embed_jsonl(engine, jsonl_path, kind=filter_kind)
+    return engine.name, ids, vecs, seen
+
+
+def _write_shard(
+    store: EmbeddingStore,
+    jsonl_path: str,
+    embedded: tuple,
+    *,
+    kind: str,
+    part: str,
+    filter_kind: Optional[str],
+) -> tuple[str, Optional[dict]]:
+    """
+    Write the part file of an embedded shard (manifest left to the caller).
+    Returns (log line, manifest entry or None when the shard was skipped).
+    """
+    model, ids, vecs, seen = embedded
+    if not seen or (filter_kind is None and not ids):
+        return f"[skip] no items in {jsonl_path}", None
+    if not ids:
+        return f"[skip] no {filter_kind} docs in {jsonl_path}", None
+
+    out = store.save_part(
+        kind=kind,
+        model=model,
+        part=part,
+        doc_ids=ids,
+        vectors=vecs,
+        fmt="auto",
+        manifest=False,
+    )
+    entry = {
+        "kind": kind,
+        "model": model,
+        "part": part,
+        "count": int(vecs.shape[0]),
+        "dim": int(vecs.shape[1]),
+    }
+    return f"Saved: {out}", entry
+
+
+def _build_shard(
+    engine_cls: type,
+    engine_kwargs: dict,
+    device: Optional[str],
+    store: EmbeddingStore,
+    jsonl_path: str,
+    *,
+    kind: str,
+    part: str,
+    filter_kind: Optional[str],
+) -> tuple[str, Optional[dict]]:
+    """Embed one JSONL shard and write its part file (pool worker entry point)."""
+    embedded = _embed_shard(
+        engine_cls, engine_kwargs, device, jsonl_path, filter_kind=filter_kind
+    )
+    return _write_shard(
+        store, jsonl_path, embedded, kind=kind, part=part, filter_kind=filter_kind
+    )
+
+
+def _cuda_devices() -> list[str]:
+    try:
+        import torch
+
+        return [f"cuda:{i}" for i in range(torch.cuda.device_count())]
+    except Exception:
+        return []
+
+
+def run_shards(
+    engine_cls: type,
+    jsonl_paths: Sequence[str],
+    *,
+    kind: str,
+    part_prefix: str = "part",
+    filter_kind: Optional[str] = None,
+    engine_kwargs: Optional[dict] = None,
+    num_workers: Optional[int] = None,
+    use_gpus: bool = False,
+) -> None:
+    """
+    Embed each JSONL shard into its own part `{part_prefix}-{i:03d}`.
+
+    With more than one shard and `num_workers` > 1, shards run in a process
+    pool (forkserver/spawn), each worker loading its own engine (round-robin
+    over CUDA devices when `use_gpus` is set) with torch limited to
+    cpu_count // num_workers threads. Part files are written by the workers; the
+    manifest log is only appended here, in shard order, so there is a single
+    writer, and `manifest.json` is finalized once at the end.
+    """
+    engine_kwargs = engine_kwargs or {}
+    store = EmbeddingStore()
+    if num_workers is None:
+        num_workers = max(1, (os.cpu_count() or 2) // 2)
+    num_workers = max(1, min(num_workers, len(jsonl_paths)))
+    devices = _cuda_devices() if use_gpus else []
+
+    jobs = [
+        (
+            engine_cls,
+            engine_kwargs,
+            devices[i % len(devices)] if devices else None,
+            store,
+            jp,
+        )
+        for i, jp in enumerate(jsonl_paths)
+    ]
+    opts = [
+        dict(kind=kind, part=f"{part_prefix}-{i:03d}", filter_kind=filter_kind)
+        for i in range(len(jsonl_paths))
+    ]
+
+    models: set[str] = set()
+
+    def _record(result: tuple[str, Optional[dict]]) -> None:
+        message, entry = result
+        if entry is not None:
+            store.add_to_manifest(**entry)
+            models.add(entry["model"])
+        print(message)
+
+    try:
+        if num_workers == 1:
+            # Shard i's part is written on a thread while shard i + 1 embeds;
+            # waiting on the previous write first keeps the manifest in order.
+            pending: Optional[Future] = None
+            try:
+                with ThreadPoolExecutor(max_workers=1) as writer:
+                    for (cls, kw, device, _, jp), o in zip(jobs, opts):
+                        embedded = _embed_shard(
+                            cls, kw, device, jp, filter_kind=o["filter_kind"]
+                        )
+                        if pending is not None:
+                            _record(pending.result())
+                        pending = writer.submit(_write_shard, store, jp, embedded, **o)
+                    if pending is not None:
+                        _record(pending.result())
+            finally:
+                _engines.clear()
+        else:
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=_pool_context(),
+                initializer=_init_worker,
+                initargs=(max(1, (os.cpu_count() or 1) // num_workers),),
+            ) as ex:
+                futures = [
+                    ex.submit(_build_shard, *job, **o) for job, o in zip(jobs, opts)
+                ]
+                for fut in futures:
+                    _record(fut.result())
+    finally:
+        for model in models:
+            store.finalize_manifest(kind=kind, model=model)
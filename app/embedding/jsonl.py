@@ -0,0 +1,60 @@
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+import orjson
+
+from app.embedding.engine import EmbeddingEngine
+
+
+def iter_jsonl(path: str | Path) -> Iterator[dict]:
+    """
+    Yield one parsed dict per non-empty line of a JSONL file.
+
+    The file is read through a buffered binary handle, so memory stays bounded
+    by the longest line rather than the file size.
+    """
+    p = Path(path)
+    if not p.exists():
+        raise FileNotFoundError(p)
+    with p.open("rb", buffering=1 << 20) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield orjson.loads(line)
+
+
+def embed_jsonl(
+    engine: EmbeddingEngine,
+    path: str | Path,
+    *,
+    kind: Optional[str] = None,
+    batch_size: int = 256,
+) -> tuple[list[str], np.ndarray, int]:
+    """
+    Stream a JSONL file through `engine.embed_batch` in mini-batches.
+
+    Only docs whose `kind` matches are embedded (all docs when `kind` is None).
+    Returns (doc_ids, vectors, number_of_docs_read); only ids and vectors are
+    kept, never the parsed docs themselves.
+    """
+    ids: list[str] = []
+    chunks: list[np.ndarray] = []
+    seen = 0
+
+    docs = iter_jsonl(path)
+    while batch := list(islice(docs, batch_size)):
+        seen += len(batch)
+        if kind is not None:
+            batch = [d for d in batch if d.get("kind") == kind]
+        if not batch:
+            continue
+        chunks.append(engine.embed_batch(batch))
+        ids.extend(d["uid"] for d in batch)
+
+    if not chunks:
+        return ids, np.empty((0, engine.dim), dtype=np.float32), seen
+    if len(chunks) == 1:  # small shard: no concatenate copy
+        return ids, chunks[0], seen
+    return ids, np.concatenate(chunks), seen
@@ -24,6 +24,8 @@ ELEMENTS = [
     "K",
     "Ca",
 ]
+# Built once at import and shared by every engine instance.
+_SYMBOL_TO_IDX: dict[str, int] = {el: i for i, el in enumerate(ELEMENTS)}
 
 
 class SimpleMaterialFingerprint:
@@ -40,14 +42,23 @@ class SimpleMaterialFingerprint:
         self.dim = len(ELEMENTS)
 
     def embed_batch(self, items: Iterable[dict]) -> np.ndarray:
-        vecs = []
-        for d in items:
-            mat = d.get("material") or {}
-            elems = mat.get("elements") or []
-            counts = {e: elems.count(e) for e in set(elems)}
-            v = np.zeros(self.dim, dtype=np.float32)
-            total = float(sum(counts.values()) or 1.0)
-            for i, el in enumerate(ELEMENTS):
-                v[i] = counts.get(el, 0) / total
-            vecs.append(v)
-        return np.stack(vecs) if vecs else np.empty((0, self.dim), dtype=np.float32)
+        items = list(items)
+        n, dim, idx = len(items), self.dim, _SYMBOL_TO_IDX
+        # Flatten every (row, element) hit of the batch, then histogram it with one
+        # bincount over row * dim + element.
+        cells: list[int] = []
+        totals = np.zeros(n, dtype=np.float32)
+        for r, d in enumerate(items):
+            elems = (d.get("material") or {}).get("elements") or []
+            if elems:
+                # Normalized by all elements, including those outside ELEMENTS.
+                totals[r] = len(elems)
+                base = r * dim
+                cells.extend([base + i for e in elems if (i := idx.get(e)) is not None])
+        if not cells:
+            return np.zeros((n, dim), dtype=np.float32)
+        out = np.bincount(cells, minlength=n * dim).astype(np.float32)
+        out = out.reshape(n, dim)
+        rows = totals > 0
+        out[rows] /= totals[rows, None]
+        return out
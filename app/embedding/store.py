@@ -1,19 +1,37 @@
 from pathlib import Path
-from typing import Literal
-import json
+from typing import Literal, Optional
+import os
+import struct
 import numpy as np
+import orjson
 
 
 class EmbeddingStore:
     """
     Persist embedding parts to disk and maintain a small manifest.
 
+    Parts are logged one JSON line each in `manifest.jsonl` (append-only);
+    `finalize_manifest` folds that log into `manifest.json`, which readers use,
+    with an atomic replace.
+
     By default tries to write Parquet if pyarrow is installed, otherwise
-    falls back to compressed .npz.
+    falls back to a raw float32 + zstd blob (.zst), then to uncompressed .npz.
+    `fmt="npy"` writes `{part}.vecs.npy` + `{part}.ids.npy`, which readers can
+    memory-map (`np.load(..., mmap_mode="r")`).
+
+    .zst layout: little-endian uint32 header length, an orjson header
+    {"shape", "dtype", "ids"}, then one zstd frame holding `vectors.tobytes()`.
+
+    `dtype="int8"` stores `round(vectors / scale)` with one symmetric scale per
+    part (max |v| / 127), kept in the part's manifest entry for dequantization.
     """
 
     def __init__(self, root: str = "data/embeddings"):
         self.root = Path(root)
+        # dir -> (manifest.jsonl size it reflects, folded parts). Lets repeated
+        # `save_part` calls finalize without re-reading the whole log each time;
+        # a size mismatch (another writer appended) forces a re-read.
+        self._manifest_cache: dict[Path, tuple[int, dict[str, dict]]] = {}
 
     def _dir(self, kind: str, model: str) -> Path:
         p = self.root / kind / model
@@ -28,11 +46,29 @@ class EmbeddingStore:
         part: str,
         doc_ids: list[str],
         vectors: np.ndarray,
-        fmt: Literal["auto", "parquet", "npz"] = "auto",
+        fmt: Literal["auto", "parquet", "zst", "npz", "npy"] = "auto",
+        dtype: Literal["float32", "float16", "int8"] = "float32",
+        scale: Optional[float] = None,
+        manifest: bool = True,
     ) -> Path:
+        """
+        Write one part. `dtype="float16"` halves the on-disk size; loaders
+        upcast to float32, so cosine / inner-product search is unaffected.
+        `dtype="int8"` quarters it, at a precision cost of `scale / 2` per
+        component; `scale` defaults to `int8_scale(vectors)`.
+        With `manifest=False` only the part file is written and the caller
+        records it later via `add_to_manifest` (e.g. from a single writer),
+        passing the same `scale` for int8 parts.
+        """
         if vectors.ndim != 2:
             raise ValueError("vectors must be a 2D array (N, dim)")
         dim = int(vectors.shape[1])
+        if dtype == "int8":
+            if scale is None:
+                scale = int8_scale(vectors)
+            vectors = quantize_int8(vectors, scale)
+        else:
+            scale = None
 
         d = self._dir(kind, model)
 
@@ -43,47 +79,211 @@ class EmbeddingStore:
 
                 fmt = "parquet"
             except Exception:
-                fmt = "npz"
+                try:
+                    import zstandard  # noqa: F401
+
+                    fmt = "zst"
+                except Exception:
+                    fmt = "npz"
 
         if fmt == "parquet":
             out = d / f"{part}.parquet"
-            self._write_parquet(out, doc_ids, vectors)
+            self._write_parquet(out, doc_ids, vectors, dtype=dtype)
+        elif fmt == "zst":
+            out = d / f"{part}.zst"
+            self._write_zst(out, doc_ids, vectors, dtype=dtype)
+        elif fmt == "npy":
+            out = d / f"{part}.vecs.npy"
+            self._write_npy(out, doc_ids, vectors, dtype=dtype)
         else:
             out = d / f"{part}.npz"
-            self._write_npz(out, doc_ids, vectors)
+            self._write_npz(out, doc_ids, vectors, dtype=dtype)
+
+        if manifest:
+            self._update_manifest(
+                d,
+                kind,
+                model,
+                part,
+                count=int(vectors.shape[0]),
+                dim=dim,
+                dtype=dtype,
+                scale=scale,
+            )
+            self.finalize_manifest(kind=kind, model=model)
+        return out
 
+    def add_to_manifest(
+        self,
+        *,
+        kind: str,
+        model: str,
+        part: str,
+        count: int,
+        dim: int,
+        dtype: str = "float32",
+        scale: Optional[float] = None,
+    ) -> None:
+        """
+        Record a part written with `save_part(..., manifest=False)`.
+        Call `finalize_manifest` once all parts are recorded.
+        """
         self._update_manifest(
-            d, kind, model, part, count=int(vectors.shape[0]), dim=dim
+            self._dir(kind, model),
+            kind,
+            model,
+            part,
+            count=count,
+            dim=dim,
+            dtype=dtype,
+            scale=scale,
         )
-        return out
+
+    def finalize_manifest(self, *, kind: str, model: str) -> Path:
+        """
+        Rebuild `manifest.json` from `manifest.jsonl` and swap it in atomically.
+        A part recorded several times (e.g. a rebuilt shard) keeps its first
+        position and its latest entry.
+        """
+        d = self._dir(kind, model)
+        log = d / "manifest.jsonl"
+        size = log.stat().st_size if log.exists() else 0
+        cached = self._manifest_cache.get(d)
+        if cached is not None and cached[0] == size:
+            parts = cached[1]
+        else:
+            parts = {}
+            if size:
+                with log.open("rb") as f:
+                    for line in f:
+                        if line.strip():
+                            entry = orjson.loads(line)
+                            parts[entry["part"]] = entry
+            self._manifest_cache[d] = (size, parts)
+
+        man = d / "manifest.json"
+        tmp = man.with_suffix(".json.tmp")
+        data = {"kind": kind, "model": model, "parts": list(parts.values())}
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, man)
+        return man
 
     def _write_parquet(
-        self, out: Path, doc_ids: list[str], vectors: np.ndarray
+        self,
+        out: Path,
+        doc_ids: list[str],
+        vectors: np.ndarray,
+        *,
+        dtype: str = "float32",
+        row_group_size: int = 16_384,
     ) -> None:
         import pyarrow as pa
         import pyarrow.parquet as pq
 
+        # Fixed-size list column over the NumPy buffer (zero-copy, no tolist()).
+        flat = pa.array(np.ascontiguousarray(vectors, dtype=dtype).ravel())
         table = pa.table(
             {
-                "doc_id": pa.array(doc_ids, type=pa.string()),
-                "vector": pa.array(vectors.tolist()),  # list<item: float32>
+                "doc_id": pa.array(doc_ids, type=pa.large_string()),
+                "vector": pa.FixedSizeListArray.from_arrays(flat, vectors.shape[1]),
             }
         )
-        pq.write_table(table, out)
+        with pq.ParquetWriter(out, table.schema, compression="zstd") as writer:
+            for start in range(0, max(table.num_rows, 1), row_group_size):
+                writer.write_table(table.slice(start, row_group_size))
 
-    def _write_npz(self, out: Path, doc_ids: list[str], vectors: np.ndarray) -> None:
-        np.savez_compressed(
-            out, ids=np.array(doc_ids, dtype=object), vecs=vectors.astype(np.float32)
+    def _write_zst(
+        self,
+        out: Path,
+        doc_ids: list[str],
+        vectors: np.ndarray,
+        *,
+        dtype: str = "float32",
+    ) -> None:
+        import zstandard
+
+        vecs = np.ascontiguousarray(vectors, dtype=dtype)
+        header = orjson.dumps(
+            {"shape": list(vecs.shape), "dtype": dtype, "ids": list(doc_ids)}
         )
+        frame = zstandard.ZstdCompressor(level=3, threads=-1).compress(vecs.data)
+        with out.open("wb") as f:
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(frame)
+
+    def _write_npz(
+        self,
+        out: Path,
+        doc_ids: list[str],
+        vectors: np.ndarray,
+        *,
+        dtype: str = "float32",
+    ) -> None:
+        # Uncompressed: zlib barely shrinks float vectors and costs a CPU pass.
+        np.savez(
+            out,
+            ids=_encode_ids(doc_ids),
+            vecs=np.ascontiguousarray(vectors, dtype=dtype),
+        )
+
+    def _write_npy(
+        self,
+        out: Path,
+        doc_ids: list[str],
+        vectors: np.ndarray,
+        *,
+        dtype: str = "float32",
+    ) -> None:
+        np.save(out, np.ascontiguousarray(vectors, dtype=dtype), allow_pickle=False)
+        ids_path = out.with_name(out.name.replace(".vecs.npy", ".ids.npy"))
+        np.save(ids_path, _encode_ids(doc_ids), allow_pickle=False)
 
     def _update_manifest(
-        self, dir_path: Path, kind: str, model: str, part: str, *, count: int, dim: int
+        self,
+        dir_path: Path,
+        kind: str,
+        model: str,
+        part: str,
+        *,
+        count: int,
+        dim: int,
+        dtype: str = "float32",
+        scale: Optional[float] = None,
     ) -> None:
+        log = dir_path / "manifest.jsonl"
         man = dir_path / "manifest.json"
-        entry = {"part": part, "count": count, "dim": dim}
-        if man.exists():
-            data = json.loads(man.read_text())
-            data.setdefault("parts", []).append(entry)
-        else:
-            data = {"kind": kind, "model": model, "parts": [entry]}
-        man.write_text(json.dumps(data, indent=2))
+        entry = {"part": part, "count": count, "dim": dim, "dtype": dtype}
+        if scale is not None:
+            entry["scale"] = scale
+        with log.open("ab") as f:
+            start = f.tell()
+            if start == 0 and man.exists():
+                # First append next to a manifest written before the log existed.
+                for old in orjson.loads(man.read_bytes()).get("parts", []):
+                    f.write(orjson.dumps(old) + b"\n")
+            f.write(orjson.dumps(entry) + b"\n")
+            end = f.tell()
+        cached = self._manifest_cache.pop(dir_path, None)
+        if cached is not None and start and cached[0] == start:
+            cached[1][part] = entry
+            self._manifest_cache[dir_path] = (end, cached[1])
+
+
+def int8_scale(vectors: np.ndarray) -> float:
+    """Symmetric int8 scale for a part: max |v| / 127 (1.0 for an all-zero part)."""
+    peak = float(np.max(np.abs(vectors))) if vectors.size else 0.0
+    return peak / 127.0 if peak > 0 else 1.0
+
+
+def quantize_int8(vectors: np.ndarray, scale: float) -> np.ndarray:
+    q = np.rint(np.asarray(vectors, dtype=np.float32) / np.float32(scale))
+    return np.clip(q, -127, 127).astype(np.int8)
+
+
+def _encode_ids(doc_ids: list[str]) -> np.ndarray:
+    """Fixed-width UTF-8 bytes instead of an object array: no pickle on save or
+    load, and UUID-style ids take 36 bytes each."""
+    encoded = [i.encode("utf-8") for i in doc_ids]
+    width = max((len(b) for b in encoded), default=1)
+    return np.array(encoded, dtype=f"S{width}")
@@ -1,6 +1,11 @@
-from typing import Iterable, Optional
+from typing import Iterable, Literal, Optional
 import numpy as np
 
+from app.core.config import settings
+from app.core.logging_factory import LoggerFactory
+
+logger = LoggerFactory.get_logger(__name__)
+
 
 class SbertTextEngine:
     """
@@ -8,12 +13,23 @@ class SbertTextEngine:
 
     - Normalizes embeddings to unit-norm for cosine / inner-product search.
     - Extracts text from the standardized doc: prefer 'text', fallback to 'title'.
+    - `backend` 'onnx'/'openvino' (default MRS_TEXT_BACKEND) runs the model outside
+      PyTorch; `model_file` can select e.g. an int8-quantized ONNX export. Falls back
+      to PyTorch when the backend's extras are not installed.
+    - `batch_size` (default MRS_TEXT_BATCH_SIZE) is the forward-pass size; `encode`
+      already sorts each call's texts by length, so batches carry little padding.
+    - `output_dtype="float16"` returns half-precision vectors (half the memory for
+      large batches; pair with `EmbeddingStore.save_part(dtype="float16")`).
     """
 
     def __init__(
         self,
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
         device: Optional[str] = None,
+        backend: Optional[str] = None,
+        model_file: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        output_dtype: Literal["float32", "float16"] = "float32",
     ):
         try:
             from sentence_transformers import SentenceTransformer
@@ -22,13 +38,29 @@ class SbertTextEngine:
                 "sentence-transformers is required for SbertTextEngine"
             ) from exc
 
-        self.model = SentenceTransformer(model_name, device=device or "cpu")
+        device = device or "cpu"
+        backend = backend or settings.TEXT_BACKEND
+        model_file = model_file if model_file is not None else settings.TEXT_MODEL_FILE
+        self.model = None
+        if backend != "torch":
+            try:
+                self.model = SentenceTransformer(
+                    model_name,
+                    device=device,
+                    backend=backend,
+                    model_kwargs={"file_name": model_file} if model_file else None,
+                )
+            except Exception as exc:
+                logger.warning(
+                    "text_backend_fallback",
+                    extra={"backend": backend, "model": model_name, "error": str(exc)},
+                )
+        if self.model is None:
+            self.model = SentenceTransformer(model_name, device=device)
         self.name = model_name.split("/")[-1]
         self.modality = "text"
-
-        _ = self.model.encode(
-            ["warmup"], convert_to_numpy=True, normalize_embeddings=True
-        )
+        self.batch_size = int(batch_size or settings.TEXT_BATCH_SIZE)
+        self.output_dtype = np.dtype(output_dtype)
         self.dim = int(self.model.get_sentence_embedding_dimension())
 
     def _texts(self, items: Iterable[dict]) -> list[str]:
@@ -41,12 +73,13 @@ class SbertTextEngine:
     def embed_batch(self, items: Iterable[dict]) -> np.ndarray:
         texts = self._texts(items)
         if not texts:
-            return np.empty((0, self.dim), dtype=np.float32)
+            return np.empty((0, self.dim), dtype=self.output_dtype)
         vecs = self.model.encode(
             texts,
             convert_to_numpy=True,
             normalize_embeddings=True,
-            batch_size=64,
+            batch_size=self.batch_size,
             show_progress_bar=False,
-        ).astype(np.float32)
-        return vecs
+        )
+        # No copy when encode already returned `output_dtype` (float32 on torch).
+        return np.ascontiguousarray(vecs, dtype=self.output_dtype)
@@ -1,13 +1,69 @@
+import math
+from itertools import chain
 from typing import Iterable
 import numpy as np
 
+try:
+    import numba
+except Exception:  # pragma: no cover
+    numba = None
+
+# Below this length a direct DFT of the first bins (O(bins * n)) beats rFFT
+# setup and the per-length grouping of the NumPy path.
+NUMBA_MAX_LEN = 256
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _ts_kernel(values, offsets, fft_bins, out):  # pragma: no cover - jitted
+        """Stats + first `fft_bins` DFT magnitudes per ragged row of `values`."""
+        for r in numba.prange(offsets.shape[0] - 1):
+            a, b = offsets[r], offsets[r + 1]
+            n = b - a
+            if n == 0:
+                continue
+            s, mn, mx = 0.0, values[a], values[a]
+            for t in range(a, b):
+                v = values[t]
+                s += v
+                mn = min(mn, v)
+                mx = max(mx, v)
+            mean = s / n
+            ss = 0.0
+            for t in range(a, b):
+                ss += (values[t] - mean) ** 2
+            out[r, 0] = mean
+            out[r, 1] = math.sqrt(ss / n)
+            out[r, 2] = mn
+            out[r, 3] = mx
+
+            # Same bins as rfft(x, n=max(n, 2 * fft_bins))[1 : fft_bins + 1].
+            n_fft = max(n, 2 * fft_bins)
+            for k in range(1, fft_bins + 1):
+                w = 2.0 * math.pi * k / n_fft
+                c, sn = math.cos(w), math.sin(w)
+                pr, pi = 1.0, 0.0  # phasor e^{-iwt}, advanced by rotation
+                re, im = 0.0, 0.0
+                for t in range(a, b):
+                    v = values[t]
+                    re += v * pr
+                    im += v * pi
+                    pr, pi = pr * c + pi * sn, pi * c - pr * sn
+                out[r, 3 + k] = math.sqrt(re * re + im * im)
+
 
 class SimpleTimeseriesEmbedding:
     """
     MVP timeseries embedding: [mean, std, min, max] + first N FFT magnitudes.
 
     Input expected format (standardized doc):
-        {"values": [{"t": <float>, "v": <float>} ..]}
+        {"t": [<float> ..], "v": [<float> ..]}
+    The older point-list layout {"values": [{"t": <float>, "v": <float>} ..]} is
+    still read.
+
+    Batches of short series run through a Numba kernel when numba is installed;
+    otherwise (or for long series) a batched NumPy rFFT is used.
     """
 
     def __init__(self, fft_bins: int = 16):
@@ -17,26 +73,46 @@ class SimpleTimeseriesEmbedding:
         self.dim = 4 + self.fft_bins
 
     def embed_batch(self, items: Iterable[dict]) -> np.ndarray:
-        vecs = []
-        for d in items:
-            vals = [p.get("v", 0.0) for p in d.get("values", [])]
-            if not vals:
-                vecs.append(np.zeros(self.dim, dtype=np.float32))
-                continue
+        vs = [
+            d["v"] if "v" in d else [p.get("v", 0.0) for p in d.get("values", [])]
+            for d in items
+        ]
+        out = np.zeros((len(vs), self.dim), dtype=np.float32)
+        if not vs:
+            return out
+
+        # One flat float32 buffer for the whole batch; rows are views into it
+        # (no per-document array, no concatenate).
+        lengths = np.fromiter(map(len, vs), np.int64, len(vs))
+        offsets = np.zeros(len(vs) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        flat = np.fromiter(chain.from_iterable(vs), np.float32, int(offsets[-1]))
+
+        if numba is not None and lengths.max() < NUMBA_MAX_LEN:
+            _ts_kernel(flat.astype(np.float64), offsets, self.fft_bins, out)
+            return out
+
+        series = [flat[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+        self._embed_numpy(series, out)
+        return out
+
+    def _embed_numpy(self, series: list[np.ndarray], out: np.ndarray) -> None:
+        # Rows of equal length share one batched rFFT; mixing lengths would need
+        # zero-padding, which would change both the stats and the spectrum.
+        by_len: dict[int, list[int]] = {}
+        for i, arr in enumerate(series):
+            if arr.shape[0]:
+                by_len.setdefault(arr.shape[0], []).append(i)
+
+        nb = self.fft_bins
+        for length, rows in by_len.items():
+            arr = np.stack([series[i] for i in rows])
+            n_fft = max(length, nb * 2)
+            mag = np.abs(np.fft.rfft(arr, n=n_fft, axis=1))[:, 1 : nb + 1]
 
-            arr = np.asarray(vals, dtype=np.float32)
-            m, s, mn, mx = (
-                float(arr.mean()),
-                float(arr.std()),
-                float(arr.min()),
-                float(arr.max()),
-            )
-
-            n_fft = max(arr.shape[0], self.fft_bins * 2)
-            mag = np.abs(np.fft.rfft(arr, n=n_fft))[1 : self.fft_bins + 1]
-            if mag.shape[0] < self.fft_bins:
-                mag = np.pad(mag, (0, self.fft_bins - mag.shape[0]))
-
-            feat = np.concatenate([[m, s, mn, mx], mag.astype(np.float32)])
-            vecs.append(feat.astype(np.float32))
-        return np.stack(vecs) if vecs else np.empty((0, self.dim), dtype=np.float32)
+            # Scatter straight into the preallocated output (no per-group block).
+            out[rows, 0] = arr.mean(axis=1)
+            out[rows, 1] = arr.std(axis=1)
+            out[rows, 2] = arr.min(axis=1)
+            out[rows, 3] = arr.max(axis=1)
+            out[rows, 4 : 4 + mag.shape[1]] = mag
@@ -1,12 +1,17 @@
+from functools import lru_cache
 from typing import List, Tuple, Optional, Dict, Any
+import hashlib
 import time
 import numpy as np
-import psycopg
+import orjson
 
-from app.indexing.faiss_index import load_faiss_index
+from app.indexing.faiss_index import faiss, load_faiss_index
 from app.embedding.text_sbert import SbertTextEngine
 from app.indexing.schemas import SearchRequest, SearchResponse, SearchHit
+from app.core.cache import LRUCache
 from app.core.config import settings
+from app.core.db import get_db
+from app.core.registry import Registry
 from app.core.logging_factory import LoggerFactory
 
 logger = LoggerFactory.get_logger(__name__)
@@ -14,16 +19,23 @@ logger = LoggerFactory.get_logger(__name__)
 
 DEFAULT_TEXT_MODEL = "all-MiniLM-L6-v2"
 
+if faiss is not None and settings.FAISS_OMP_THREADS > 0:
+    faiss.omp_set_num_threads(settings.FAISS_OMP_THREADS)
+
 
 class FaissSearchBackend:
     """
     Wrapper around a FAISS index + ids mapping.
+
+    The index is moved to GPU 0 when FAISS was built with CUDA and a device is
+    visible; otherwise it stays on CPU.
     """
 
     def __init__(self, index_dir: str, *, kind: str, model: str):
         self.kind = kind
         self.model = model
         self.index, self.ids = load_faiss_index(index_dir, kind=kind, model=model)
+        self.index = _maybe_to_gpu(self.index)
 
     def search(
         self, query_vec: np.ndarray, top_k: int = 10
@@ -34,26 +46,54 @@ class FaissSearchBackend:
         Returns
         -------
         (idxs, scores)
-          idxs   : int64 indices into ids array (shape (1, top_k))
-          scores : float32 scores (shape (1, top_k))
+          idxs   : int64 indices into ids array (shape (top_k,))
+          scores : float32 scores (shape (top_k,))
         """
-        if query_vec.ndim == 1:
-            query_vec = query_vec[None, :]
-        D, I = self.index.search(query_vec.astype(np.float32), top_k)
+        I, D = self.search_many(query_vec, top_k)
         return I[0], D[0]
 
+    def search_many(
+        self, query_vecs: np.ndarray, top_k: int = 10
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k search for a (B, D) batch of queries in a single FAISS call.
+
+        Returns
+        -------
+        (idxs, scores) with shapes (B, top_k)
+        """
+        if query_vecs.ndim == 1:
+            query_vecs = query_vecs[None, :]
+        D, I = self.index.search(
+            np.ascontiguousarray(query_vecs, dtype=np.float32), top_k
+        )
+        return I, D
+
+
+def _maybe_to_gpu(index):
+    """Clone `index` onto GPU 0 when a CUDA-enabled FAISS sees a device."""
+    get_num_gpus = getattr(faiss, "get_num_gpus", None) if faiss else None
+    if get_num_gpus is None or get_num_gpus() < 1:
+        return index
+    res = faiss.StandardGpuResources()
+    return faiss.index_cpu_to_gpu(res, 0, index)
+
+
+@lru_cache(maxsize=4)
+def _get_text_engine(model_name: str) -> SbertTextEngine:
+    """Load a SentenceTransformer once per process and model name."""
+    return SbertTextEngine(model_name=f"sentence-transformers/{model_name}")
+
 
 def _encode_text_query(query: str, model_name: Optional[str]) -> Tuple[str, np.ndarray]:
     """
-    Encode a free-text query using SbertTextEngine.
+    Encode a free-text query using the cached SbertTextEngine.
 
     Returns
     -------
     (used_model_name, vector)
     """
-    eng = SbertTextEngine(
-        model_name=f"sentence-transformers/{model_name or DEFAULT_TEXT_MODEL}"
-    )
+    eng = _get_text_engine(model_name or DEFAULT_TEXT_MODEL)
     vec = eng.embed_batch([{"text": query}])
     return eng.name, vec[0]
 
@@ -63,6 +103,10 @@ def _fetch_metadata(
 ) -> Dict[str, Dict[str, Any]]:
     """
     Fetch metadata from Postgres for a list of doc_ids and optional filters.
+
+    Runs on the shared connection pool as a prepared, binary-protocol query;
+    the SQL text only varies with which filters are set, so each variant keeps
+    a cached plan per connection.
     """
     if not doc_ids:
         return {}
@@ -71,7 +115,7 @@ def _fetch_metadata(
     f_year_to = filters.get("year_to") if filters else None
     f_method = filters.get("method") if filters else None
 
-    clauses = ["id = ANY(%s)"]
+    clauses = ["id = ANY(%s::uuid[])"]
     params: List[Any] = [doc_ids]
     if f_year_from is not None:
         clauses.append("COALESCE(year, 0) >= %s")
@@ -92,29 +136,35 @@ def _fetch_metadata(
     """
 
     rows: Dict[str, Dict[str, Any]] = {}
-
-    with psycopg.connect(str(settings.POSTGRES_URI)) as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, params)
-            for r in cur.fetchall():
-                doc_id = r[0]
-                rows[doc_id] = {
-                    "doc_id": r[0],
-                    "kind": r[1],
-                    "source": r[2],
-                    "source_id": r[3],
-                    "year": r[4],
-                    "method": r[5],
-                    "title": r[6],
-                }
+    for r in get_db().fetchall(sql, params):
+        doc_id = str(r["id"])
+        rows[doc_id] = {
+            "doc_id": doc_id,
+            "kind": r["kind"],
+            "source": r["source"],
+            "source_id": r["source_id"],
+            "year": r["year"],
+            "method": r["method"],
+            "title": r["title"],
+        }
     return rows
 
 
+def _request_key(req: SearchRequest) -> bytes:
+    """Stable 16-byte digest of a search request (field order independent)."""
+    payload = orjson.dumps(req.model_dump(), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
 class HybridSearchEngine:
     """
     Hybrid search MVP: FAISS retrieval per modality + metadata fetch from Postgres.
 
     For now, one modality per request (text|simulation|timeseries).
+
+    Responses are cached per request for MRS_SEARCH_CACHE_TTL seconds (and
+    dropped when new documents are recorded); query vectors are cached per
+    (model, query) so filter/page changes skip the encoder.
     """
 
     def __init__(
@@ -123,6 +173,12 @@ class HybridSearchEngine:
         self.emb_root = emb_root
         self.index_dir = index_dir
         self._faiss_cache: Dict[Tuple[str, str], FaissSearchBackend] = {}
+        self._result_cache: LRUCache[Tuple[int, bytes], SearchResponse] = LRUCache(
+            maxsize=settings.SEARCH_CACHE_SIZE, ttl=settings.SEARCH_CACHE_TTL
+        )
+        self._qvec_cache: LRUCache[Tuple[str, str], Tuple[str, np.ndarray]] = LRUCache(
+            maxsize=settings.SEARCH_CACHE_SIZE
+        )
 
     def _get_backend(self, *, kind: str, model: str) -> FaissSearchBackend:
         key = (kind, model)
@@ -132,11 +188,44 @@ class HybridSearchEngine:
             )
         return self._faiss_cache[key]
 
+    def warmup(self, *, kind: str = "text", model: str = DEFAULT_TEXT_MODEL) -> None:
+        """
+        Preload the FAISS backend for (kind, model), and the text encoder for
+        'text', so the first request does not pay the load. Missing indexes or
+        models are logged, not raised.
+        """
+        try:
+            self._get_backend(kind=kind, model=model)
+            if kind == "text":
+                _encode_text_query("warmup", model)
+        except (OSError, RuntimeError) as e:
+            logger.warning(
+                "search_warmup_skipped",
+                extra={"kind": kind, "model": model, "error": str(e)},
+            )
+
+    def _encode_query(self, query: str, model: Optional[str]) -> Tuple[str, np.ndarray]:
+        key = (model or DEFAULT_TEXT_MODEL, query)
+        hit = self._qvec_cache.get(key)
+        if hit is None:
+            hit = _encode_text_query(query, model)
+            self._qvec_cache.set(key, hit)
+        return hit
+
     def search(self, req: SearchRequest) -> SearchResponse:
+        cache_key = (Registry.documents_version, _request_key(req))
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        resp = self._search(req)
+        self._result_cache.set(cache_key, resp)
+        return resp
+
+    def _search(self, req: SearchRequest) -> SearchResponse:
         t0 = time.time()
 
         if req.kind == "text":
-            used_model, qvec = _encode_text_query(req.query or "", req.model)
+            used_model, qvec = self._encode_query(req.query or "", req.model)
             model = used_model
         else:
             raise ValueError("Only 'text' search is implemented in MVP")
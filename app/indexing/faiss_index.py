@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Tuple, List, Dict, Any
-import json
+from typing import Tuple, Dict, Any, Literal
+import struct
 import numpy as np
+import orjson
 
 try:
     import faiss
@@ -21,7 +22,7 @@ def _load_manifest(dir_path: Path) -> Dict[str, Any]:
     man = dir_path / "manifest.json"
     if not man.exists():
         raise FileNotFoundError(f"Manifest not found: {man}")
-    return json.loads(man.read_text(encoding="utf-8"))
+    return orjson.loads(man.read_bytes())
 
 
 def _load_part(path: Path) -> Tuple[np.ndarray, np.ndarray]:
@@ -29,21 +30,54 @@ def _load_part(path: Path) -> Tuple[np.ndarray, np.ndarray]:
     Load a single embedding part file.
 
     Supports:
-      - .npz  -> arrays 'ids' (object dtype) and 'vecs' (float32)
-      - .parquet -> columns 'doc_id' (string) and 'vector' (list<float>)
+      - .npz  -> arrays 'ids' (UTF-8 bytes, or pickled objects for older parts)
+                 and 'vecs' (float32 or float16)
+      - .parquet -> columns 'doc_id' (string / large_string) and 'vector' (list<float>)
+      - .zst  -> orjson header {"shape", "dtype", "ids"} + zstd-framed raw vectors
+      - .vecs.npy (+ sibling .ids.npy) -> vectors memory-mapped read-only
     """
+    if path.name.endswith(".vecs.npy"):
+        ids = np.load(path.with_name(path.name.replace(".vecs.npy", ".ids.npy")))
+        if ids.dtype.kind == "S":
+            ids = np.char.decode(ids, "utf-8").astype(object)
+        return ids, np.load(path, mmap_mode="r")
+
     if path.suffix == ".npz":
-        data = np.load(path, allow_pickle=True)
-        ids = data["ids"]
-        vecs = data["vecs"].astype(np.float32, copy=False)
-        return ids, vecs
+        data = np.load(path)
+        try:
+            ids = data["ids"]
+        except ValueError:  # legacy part with pickled object ids
+            ids = np.load(path, allow_pickle=True)["ids"]
+        if ids.dtype.kind == "S":
+            ids = np.char.decode(ids, "utf-8").astype(object)
+        return ids, data["vecs"]
 
     if path.suffix == ".parquet":
+        import pyarrow as pa
         import pyarrow.parquet as pq
 
         table = pq.read_table(path)
-        ids = np.array(table["doc_id"].to_pylist(), dtype=object)
-        vecs = np.asarray(table["vector"].to_pylist(), dtype=np.float32)
+        ids = table["doc_id"].to_numpy()
+        col = table["vector"].combine_chunks()
+        if isinstance(col.type, pa.FixedSizeListType) and col.offset == 0:
+            # Zero-copy view over the child buffer of fixed_size_list<float>.
+            dim = col.type.list_size
+            flat = col.values.to_numpy(zero_copy_only=True)
+            return ids, flat[: len(col) * dim].reshape(len(col), dim)
+        # Legacy variable list<float> parts: flatten in Arrow, still no boxing.
+        flat = col.flatten().to_numpy(zero_copy_only=False)
+        vecs = flat.reshape(len(col), -1) if len(col) else flat.reshape(0, 0)
+        return ids, vecs
+
+    if path.suffix == ".zst":
+        import zstandard
+
+        raw = path.read_bytes()
+        (header_len,) = struct.unpack_from("<I", raw)
+        header = orjson.loads(raw[4 : 4 + header_len])
+        body = zstandard.ZstdDecompressor().decompress(raw[4 + header_len :])
+        ids = np.array(header["ids"], dtype=object)
+        vecs = np.frombuffer(body, dtype=header["dtype"]).reshape(header["shape"])
         return ids, vecs
 
     raise ValueError(f"Unsupported part format: {path.name}")
@@ -64,31 +98,62 @@ def load_embeddings_dir(
     d = Path(root) / kind / model
     man = _load_manifest(d)
     parts = man.get("parts", [])
-    all_ids: List[np.ndarray] = []
-    all_vecs: List[np.ndarray] = []
-
-    for entry in parts:
-        part = entry["part"]
-        npz = d / f"{part}.npz"
-        pq = d / f"{part}.parquet"
-        if npz.exists():
-            ids, vecs = _load_part(npz)
-        elif pq.exists():
-            ids, vecs = _load_part(pq)
-        else:
-            raise FileNotFoundError(f"Part not found: {npz} or {pq}")
-        all_ids.append(ids)
-        all_vecs.append(vecs)
-
-    if not all_ids:
+    if not parts:
         return np.empty((0,), dtype=object), np.empty((0, 0), dtype=np.float32)
 
-    ids = np.concatenate(all_ids, axis=0)
-    vecs = np.vstack(all_vecs).astype(np.float32, copy=False)
-    return ids, vecs
-
+    # One allocation sized from the manifest; parts are copied into their slice
+    # instead of being concatenated (which would double peak memory).
+    total = sum(int(p["count"]) for p in parts)
+    dim = int(parts[0]["dim"])
+    out_ids = np.empty((total,), dtype=object)
+    out_vecs = np.empty((total, dim), dtype=np.float32)
 
-def build_faiss_index(vecs: np.ndarray, metric: str = "ip") -> "faiss.Index":
+    cursor = 0
+    for entry in parts:
+        part = entry["part"]
+        candidates = [
+            d / f"{part}{ext}" for ext in (".npz", ".parquet", ".zst", ".vecs.npy")
+        ]
+        path = next((c for c in candidates if c.exists()), None)
+        if path is None:
+            raise FileNotFoundError(
+                f"Part not found: {' or '.join(map(str, candidates))}"
+            )
+        ids, vecs = _load_part(path)
+        n = len(ids)
+        if n != int(entry["count"]) or (n and vecs.shape[1] != dim):
+            raise ValueError(
+                f"Part {path.name} has shape {vecs.shape}, manifest says "
+                f"({entry['count']}, {dim})"
+            )
+        out_ids[cursor : cursor + n] = ids
+        if n:
+            dst = out_vecs[cursor : cursor + n]
+            np.copyto(dst, vecs, casting="same_kind")
+            if entry.get("dtype") == "int8":
+                dst *= np.float32(entry["scale"])
+        cursor += n
+
+    return out_ids, out_vecs
+
+
+IndexType = Literal["auto", "flat", "sq_fp16", "sq8", "hnsw", "ivfpq"]
+
+HNSW_MIN_VECTORS = 50_000
+IVFPQ_MIN_VECTORS = 1_000_000
+
+
+def _pq_subquantizers(d: int) -> int:
+    """Largest m <= d // 4 that divides d (IVFPQ requires d % m == 0)."""
+    for m in range(max(d // 4, 1), 0, -1):
+        if d % m == 0:
+            return m
+    return 1
+
+
+def build_faiss_index(
+    vecs: np.ndarray, metric: str = "ip", index_type: IndexType = "auto"
+) -> "faiss.Index":
     """
     Build a FAISS index in-memory.
 
@@ -96,6 +161,10 @@ def build_faiss_index(vecs: np.ndarray, metric: str = "ip") -> "faiss.Index":
     ----------
     vecs : (N, D) float32, ideally L2-normalized if using 'ip' (inner product).
     metric: 'ip' for inner product (cosine if normalized) or 'l2'.
+    index_type: 'flat' (exact scan), 'sq_fp16' / 'sq8' (exact scan over
+        float16 / trained per-dim int8 codes, 2x / 4x less memory), 'hnsw'
+        (graph ANN), 'ivfpq' (clustered, PQ-compressed ANN) or 'auto' to pick
+        by N: flat below 50k vectors, hnsw below 1M, ivfpq above.
 
     Returns
     -------
@@ -104,13 +173,45 @@ def build_faiss_index(vecs: np.ndarray, metric: str = "ip") -> "faiss.Index":
     _ensure_faiss()
     if vecs.ndim != 2:
         raise ValueError("vecs must be 2D")
-    d = vecs.shape[1]
-    if metric == "ip":
-        index = faiss.IndexFlatIP(d)
-    elif metric == "l2":
-        index = faiss.IndexFlatL2(d)
-    else:
+    if metric not in ("ip", "l2"):
         raise ValueError("metric must be 'ip' or 'l2'")
+    n, d = vecs.shape
+    faiss_metric = faiss.METRIC_INNER_PRODUCT if metric == "ip" else faiss.METRIC_L2
+
+    if index_type == "auto":
+        if n < HNSW_MIN_VECTORS:
+            index_type = "flat"
+        elif n < IVFPQ_MIN_VECTORS:
+            index_type = "hnsw"
+        else:
+            index_type = "ivfpq"
+
+    if index_type == "flat":
+        index = faiss.IndexFlatIP(d) if metric == "ip" else faiss.IndexFlatL2(d)
+    elif index_type in ("sq_fp16", "sq8"):
+        qtype = (
+            faiss.ScalarQuantizer.QT_fp16
+            if index_type == "sq_fp16"
+            else faiss.ScalarQuantizer.QT_8bit
+        )
+        index = faiss.IndexScalarQuantizer(d, qtype, faiss_metric)
+        index.train(vecs)
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(d, 32, faiss_metric)
+        index.hnsw.efConstruction = 200
+        index.hnsw.efSearch = 64
+    elif index_type == "ivfpq":
+        nlist = max(1, int(4 * np.sqrt(n)))
+        quantizer = faiss.IndexFlatIP(d) if metric == "ip" else faiss.IndexFlatL2(d)
+        index = faiss.IndexIVFPQ(
+            quantizer, d, nlist, _pq_subquantizers(d), 8, faiss_metric
+        )
+        index.train(vecs)
+        index.nprobe = 16  # persisted with the index
+    else:
+        raise ValueError(
+            "index_type must be 'auto', 'flat', 'sq_fp16', 'sq8', 'hnsw' or 'ivfpq'"
+        )
     index.add(vecs)
     return index
 
@@ -160,12 +261,13 @@ def build_from_embeddings(
     kind: str,
     model: str,
     metric: str = "ip",
+    index_type: IndexType = "auto",
 ) -> Path:
     """
     Convenience helper to build & save an index from an embeddings directory.
     """
     ids, vecs = load_embeddings_dir(emb_root, kind, model)
-    index = build_faiss_index(vecs, metric=metric)
+    index = build_faiss_index(vecs, metric=metric, index_type=index_type)
     return save_faiss_index(index, out_dir, kind=kind, model=model, ids=ids)
 
 
@@ -180,6 +282,11 @@ if __name__ == "__main__":  # simple CLI usage
     )
     p.add_argument("--model", required=True)
     p.add_argument("--metric", default="ip", choices=["ip", "l2"])
+    p.add_argument(
+        "--index-type",
+        default="auto",
+        choices=["auto", "flat", "sq_fp16", "sq8", "hnsw", "ivfpq"],
+    )
     args = p.parse_args()
 
     path = build_from_embeddings(
@@ -188,5 +295,6 @@ if __name__ == "__main__":  # simple CLI usage
         kind=args.kind,
         model=args.model,
         metric=args.metric,
+        index_type=args.index_type,
     )
     print("Index saved at:", path)
@@ -1,15 +1,54 @@
 import asyncio
-import json
+import logging
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import Any, Callable, Iterable, List, Optional
 
+import httpx
+import orjson
 import pandas as pd
 import requests
 
 from app.core.logging_factory import LoggerFactory
 from app.core.registry import Registry
+from app.embedding.jsonl import iter_jsonl
+from app.ingestion.http_client import get_async_client, get_session
+
+# Raw API payloads may carry int keys or NumPy scalars from parsed frames.
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+_WRITE_BATCH = 1024
+# Marks an exhausted document iterator in `write_standardized`.
+_NO_DOC = object()
+
+# Disk writes from run_async get their own small pool, so parquet/JSONL dumps
+# never queue behind (or starve) the default executor used for fetches.
+DISK_WORKERS = 2
+_disk_executor: Optional[ThreadPoolExecutor] = None
+_disk_lock = threading.Lock()
+
+
+def get_disk_executor() -> ThreadPoolExecutor:
+    """Return the shared ingestion disk-write executor, creating it on first use."""
+    global _disk_executor
+    with _disk_lock:
+        if _disk_executor is None:
+            _disk_executor = ThreadPoolExecutor(
+                max_workers=DISK_WORKERS, thread_name_prefix="ingestor-disk"
+            )
+        return _disk_executor
+
+
+def shutdown_disk_executor(wait: bool = True) -> None:
+    """Drain and drop the disk-write executor (called from the app lifespan)."""
+    global _disk_executor
+    with _disk_lock:
+        executor, _disk_executor = _disk_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
 
 
 class BaseIngestor(ABC):
@@ -18,9 +57,10 @@ class BaseIngestor(ABC):
 
     Responsibilities
     - Centralized logging and output directory management
-    - HTTP helpers with retries (sync via `http_get_json`, async via `http_get_json_async`)
+    - HTTP helpers with retries (sync via `http_get_json`, async via `http_get_json_async`,
+      which uses the injected `httpx.AsyncClient` or the process-wide pooled one)
     - Canonical pipelines (`run` / `run_async`):
-      fetch → save_raw → parse → save table → (optional) standardize → write_standardized
+      fetch → save_raw → parse → save table → (optional) standardize_df → write_standardized
 
     Configuration
     - `NAME`: short identifier for the ingestor (used in logger name and output folder)
@@ -28,63 +68,107 @@ class BaseIngestor(ABC):
     - `standardize_fn`: callable used to transform parsed records into standardized pivot documents
     - `dump_standardized`: when True, writes a JSONL file with standardized docs
     - `standardized_filename`: output filename for standardized JSONL (default: `standardized.jsonl`)
+    - `page_concurrency`: max in-flight pages in `fetch_pages_async` (default: 10)
+    - `pretty_raw`: indent raw JSON dumps for reading by hand (default: compact)
     """
 
     NAME: str = "base"
+    page_concurrency: int = 10
+    pretty_raw: bool = False
     standardize_fn: Optional[Callable[[List[dict]], Iterable[Any]]] = None
     dump_standardized: bool = True
     standardized_filename: str = "standardized.jsonl"
 
     def __init__(
-        self, out_dir: str = "data/raw", *, registry: Optional[Registry] = None
+        self,
+        out_dir: str = "data/raw",
+        *,
+        registry: Optional[Registry] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the ingestor with a specified output directory.
 
         Args:
             out_dir (str): Base directory where raw and parsed data will be saved.
+            registry (Optional[Registry]): Persistence orchestrator for raw/standardized outputs.
+            http_client (Optional[httpx.AsyncClient]): Shared async client used by
+                `http_get_json_async` (connection reuse across ingestors).
         """
         self.logger = LoggerFactory.get_logger(f"ingestion.{self.NAME}")
         self.out_dir = Path(out_dir) / self.NAME
         self.out_dir.mkdir(parents=True, exist_ok=True)
+        # Filename templates resolved once; per-save cost is a str.format.
+        self._raw_tpl = str(self.out_dir / "raw_{ts}.{sfx}")
+        self._table_tpl = str(self.out_dir / "table_{ts}.{sfx}")
         self.registry: Optional[Registry] = registry
+        self.http_client: Optional[httpx.AsyncClient] = http_client
         self._run_id: Optional[str] = None
         self._last_raw_path: Optional[Path] = None
         self._source_id_hint: str = ""
 
     def to_records(self, df: pd.DataFrame) -> List[dict]:
-        """Convert parsed DataFrame to list of dict records (override if needed)."""
-        return df.to_dict(orient="records")
+        """
+        Convert parsed DataFrame to list of dict records (override if needed).
+        Zips object-dtype column arrays (Python scalars, like `to_dict("records")`)
+        instead of boxing cell by cell.
+        """
+        cols = list(df.columns)
+        arrays = [df[c].to_numpy(dtype=object) for c in cols]
+        dict_, zip_ = dict, zip
+        return [dict_(zip_(cols, row)) for row in zip_(*arrays)]
 
     def standardize(self, records: List[dict]) -> Optional[Iterable[Any]]:
         """
         Hook to convert parsed records into standardized pivot documents.
         Default: if `standardize_fn` is set, delegate to it; otherwise return None.
+        The result may be a lazy iterator: `write_standardized` consumes it once.
         Subclasses may override this method to implement custom logic.
         """
         if self.standardize_fn:
-            return list(self.standardize_fn(records))
+            return self.standardize_fn(records)
         return None
 
-    def write_standardized(self, docs: Iterable[Any]) -> Path:
+    def standardize_df(self, df: pd.DataFrame) -> Optional[Iterable[Any]]:
+        """
+        Hook used by `run` / `run_async` to standardize the parsed DataFrame.
+        Default: `standardize(to_records(df))`; returns None when there is nothing
+        to write. Override to walk the frame directly without building all records.
+        """
+        records = self.to_records(df)
+        return self.standardize(records) if records else None
+
+    def write_standardized(self, docs: Iterable[Any]) -> Optional[Path]:
         """
         Persist standardized documents as JSONL next to other outputs. Supports
-        Pydantic models (model_dump_json / model_dump) or plain dicts.
+        Pydantic models (serialized to bytes by pydantic-core) or plain dicts
+        (orjson); lines are buffered and written `_WRITE_BATCH` records at a time.
+        Returns None, writing no file and registering nothing, when `docs` is empty.
         """
+        it = iter(docs)
+        one_shot = it is docs
+        first = next(it, _NO_DOC)
+        if first is _NO_DOC:
+            self.logger.info("standardized_empty")
+            return None
         out = self.out_dir / self.standardized_filename
-        with out.open("w", encoding="utf-8") as f:
-            for d in docs:
-                if hasattr(d, "model_dump_json"):
-                    f.write(d.model_dump_json() + "\n")
-                elif hasattr(d, "model_dump"):
-                    import json as _json
-
-                    f.write(_json.dumps(d.model_dump()) + "\n")
+        buf = bytearray()
+        with out.open("wb", buffering=1 << 20) as f:
+            for i, d in enumerate(chain((first,), it), 1):
+                if hasattr(d, "__pydantic_serializer__"):
+                    # Same bytes as model_dump_json(), without the str round-trip.
+                    buf += d.__pydantic_serializer__.to_json(d)
                 else:
-                    import json as _json
-
-                    f.write(_json.dumps(d) + "\n")
+                    buf += orjson.dumps(d, option=_ORJSON_OPTS)
+                buf += b"\n"
+                if i % _WRITE_BATCH == 0:
+                    f.write(buf)
+                    buf.clear()
+            f.write(buf)
         if self.registry:
+            # A one-shot iterator is exhausted by now: replay the file just written.
+            if one_shot:
+                docs = iter_jsonl(out)
             try:
                 self.registry.record_docs(docs, local_jsonl=str(out))
             except Exception as e:
@@ -136,6 +220,35 @@ class BaseIngestor(ABC):
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: self.fetch(**kwargs))
 
+    async def fetch_pages_async(self, *, pages: Iterable[int], **kwargs) -> List[Any]:
+        """
+        Fetch several pages concurrently via `fetch_async(page=..., **kwargs)`,
+        at most `page_concurrency` at a time. Each page keeps its own retries.
+
+        Args:
+            pages (Iterable[int]): Page numbers to fetch.
+            **kwargs: Other parameters forwarded to `fetch_async`.
+
+        Returns:
+            List[Any]: Raw page payloads, in the order of `pages`.
+        """
+        sem = asyncio.Semaphore(self.page_concurrency)
+
+        async def _one(page: int) -> Any:
+            async with sem:
+                return await self.fetch_async(page=page, **kwargs)
+
+        return list(await asyncio.gather(*(_one(p) for p in pages)))
+
+    def parse_many(self, raws: List[Any]) -> pd.DataFrame:
+        """
+        Parse several raw pages into one DataFrame. Default: parse each page and
+        concatenate; ingestors with list payloads merge them and parse once.
+        """
+        frames = [self.parse(raw) for raw in raws]
+        frames = [f for f in frames if not f.empty]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
     async def run_async(self, **kwargs) -> pd.DataFrame:
         """
         Asynchronous pipeline: fetch_async -> save_raw -> parse -> save table.
@@ -147,9 +260,11 @@ class BaseIngestor(ABC):
         Returns:
             pd.DataFrame: Parsed structured data.
         """
-        self.logger.info(
-            "start fetch", extra={"params": {k: str(v) for k, v in kwargs.items()}}
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "start fetch",
+                extra={"params": {k: str(v) for k, v in kwargs.items()}},
+            )
         self._source_id_hint = str(
             kwargs.get("source_id")
             or kwargs.get("query")
@@ -158,19 +273,23 @@ class BaseIngestor(ABC):
             or ""
         )
         raw = await self.fetch_async(**kwargs)
-        self.logger.info("fetched", extra={"info": self._brief(raw)})
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("fetched", extra={"info": self._brief(raw)})
 
-        self.save_raw(raw)  # save raw trace
+        loop = asyncio.get_running_loop()
+        disk = get_disk_executor()
+        await loop.run_in_executor(disk, self.save_raw, raw)  # save raw trace
         df = await asyncio.to_thread(self.parse, raw)
         self.logger.info("parsed", extra={"rows": len(df)})
 
-        await asyncio.to_thread(self._save_table, df)
+        await loop.run_in_executor(disk, self._save_table, df)
 
         try:
-            records = await asyncio.to_thread(self.to_records, df)
-            docs = await asyncio.to_thread(self.standardize, records)
-            if docs and self.dump_standardized:
-                await asyncio.to_thread(self.write_standardized, docs)
+            # One thread hop for record conversion + standardization; when docs is
+            # lazy, the documents themselves are built inside write_standardized.
+            docs = await asyncio.to_thread(self.standardize_df, df)
+            if docs is not None and self.dump_standardized:
+                await loop.run_in_executor(disk, self.write_standardized, docs)
         except Exception as e:
             self.logger.warning("standardize_failed", extra={"error": str(e)})
 
@@ -186,9 +305,11 @@ class BaseIngestor(ABC):
         Returns:
             pd.DataFrame: Parsed structured data.
         """
-        self.logger.info(
-            "start fetch", extra={"params": {k: str(v) for k, v in kwargs.items()}}
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "start fetch",
+                extra={"params": {k: str(v) for k, v in kwargs.items()}},
+            )
         self._source_id_hint = str(
             kwargs.get("source_id")
             or kwargs.get("query")
@@ -197,7 +318,8 @@ class BaseIngestor(ABC):
             or ""
         )
         raw = self.fetch(**kwargs)
-        self.logger.info("fetched", extra={"info": self._brief(raw)})
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("fetched", extra={"info": self._brief(raw)})
 
         self.save_raw(raw)  # save raw trace
         df = self.parse(raw)
@@ -206,9 +328,8 @@ class BaseIngestor(ABC):
         self._save_table(df)
 
         try:
-            records = self.to_records(df)
-            docs = self.standardize(records)
-            if docs and self.dump_standardized:
+            docs = self.standardize_df(df)
+            if docs is not None and self.dump_standardized:
                 self.write_standardized(docs)
         except Exception as e:
             self.logger.warning("standardize_failed", extra={"error": str(e)})
@@ -224,7 +345,10 @@ class BaseIngestor(ABC):
         backoff: float = 1.0,
     ) -> dict:
         """
-        Simple helper for HTTP GET returning JSON with retries.
+        Simple helper for HTTP GET returning JSON with retries, on the shared
+        keep-alive `requests.Session` from `app.ingestion.http_client`.
+        Error statuses and connection errors/timeouts are retried; there is no
+        backoff sleep after the last attempt.
 
         Args:
             url (str): URL to request.
@@ -239,15 +363,24 @@ class BaseIngestor(ABC):
         Raises:
             HTTPError: If all retry attempts fail.
         """
+        session = get_session()
         for attempt in range(1, retries + 1):
-            resp = requests.get(url, params=params, headers=headers, timeout=30)
-            if resp.ok:
-                return resp.json()
+            try:
+                resp = session.get(url, params=params, headers=headers, timeout=30)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == retries:
+                    raise
+                status = repr(e)
+            else:
+                if resp.ok:
+                    return orjson.loads(resp.content)
+                status = resp.status_code
             self.logger.warning(
                 "http_get_json failed",
-                extra={"status": resp.status_code, "attempt": attempt, "url": url},
+                extra={"status": status, "attempt": attempt, "url": url},
             )
-            time.sleep(backoff * attempt)
+            if attempt < retries:  # no pointless sleep before giving up
+                time.sleep(backoff * attempt)
         resp.raise_for_status()
         return {}
 
@@ -260,8 +393,10 @@ class BaseIngestor(ABC):
         backoff: float = 1.0,
     ) -> dict:
         """
-        Asynchronous version of http_get_json() which runs the synchronous version in a thread.
-        Replace with an httpx implementation if you want true async I/O.
+        Asynchronous version of http_get_json() on a keep-alive `httpx.AsyncClient`:
+        the injected `http_client`, or the shared one from `app.ingestion.http_client`.
+        Never blocks the event loop (no thread hop, `asyncio.sleep` backoff).
+        Transport errors (connect, read, timeouts) are retried like error statuses.
 
         Args:
             url (str): URL to request.
@@ -272,10 +407,30 @@ class BaseIngestor(ABC):
 
         Returns:
             dict: JSON response parsed as a dictionary.
+
+        Raises:
+            httpx.HTTPStatusError: If all retry attempts fail.
         """
-        return await asyncio.to_thread(
-            self.http_get_json, url, params, headers, retries, backoff
-        )
+        client = self.http_client or get_async_client()
+        for attempt in range(1, retries + 1):
+            try:
+                resp = await client.get(url, params=params, headers=headers)
+            except httpx.TransportError as e:
+                if attempt == retries:
+                    raise
+                status = repr(e)
+            else:
+                if resp.is_success:
+                    return orjson.loads(resp.content)
+                status = resp.status_code
+            self.logger.warning(
+                "http_get_json failed",
+                extra={"status": status, "attempt": attempt, "url": url},
+            )
+            if attempt < retries:
+                await asyncio.sleep(backoff * attempt)
+        resp.raise_for_status()
+        return {}
 
     def save_raw(self, raw: Any, suffix: str = "json") -> Path:
         """
@@ -288,13 +443,11 @@ class BaseIngestor(ABC):
         Returns:
             Path: Path to the saved raw data file.
         """
-        ts = int(time.time() * 1000)
-        path = self.out_dir / f"raw_{ts}.{suffix}"
+        path = Path(self._raw_tpl.format(ts=time.time_ns() // 1_000_000, sfx=suffix))
 
         if isinstance(raw, (dict, list)):
-            path.write_text(
-                json.dumps(raw, ensure_ascii=False, indent=2), encoding="utf-8"
-            )
+            option = _ORJSON_OPTS | (orjson.OPT_INDENT_2 if self.pretty_raw else 0)
+            path.write_bytes(orjson.dumps(raw, option=option))
         elif isinstance(raw, (bytes, bytearray)):
             path.write_bytes(raw)
         else:
@@ -330,12 +483,27 @@ class BaseIngestor(ABC):
         Returns:
             Path: Path to the saved table file.
         """
-        ts = int(time.time() * 1000)
-        path = self.out_dir / f"table_{ts}.{ 'parquet' if fmt=='parquet' else 'csv'}"
+        path = Path(
+            self._table_tpl.format(
+                ts=time.time_ns() // 1_000_000,
+                sfx="parquet" if fmt == "parquet" else "csv",
+            )
+        )
         if fmt == "parquet":
-            df.to_parquet(path, index=False)
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            # zstd + dictionary pages: the text tables are mostly repeated strings.
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(
+                table,
+                path,
+                compression="zstd",
+                compression_level=3,
+                use_dictionary=True,
+            )
         else:
-            df.to_csv(path, index=False)
+            df.to_csv(path, index=False, lineterminator="\n")
         self.logger.info("table_saved", extra={"path": str(path), "rows": len(df)})
         return path
 
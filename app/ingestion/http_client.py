@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_TIMEOUT = 30
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+SESSION_POOL_CONNECTIONS = 10
+SESSION_POOL_MAXSIZE = 20
+
+# One pooled client per event loop: httpx connections are bound to the loop
+# they were opened on, and scripts may call asyncio.run() more than once.
+_async_clients: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"
+) = weakref.WeakKeyDictionary()
+
+
+def new_async_client() -> httpx.AsyncClient:
+    """Build an AsyncClient with the ingestion pool limits and timeout."""
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the keep-alive AsyncClient shared by ingestors on the running loop,
+    creating it on first use.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = new_async_client()
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's shared client (called from the app lifespan)."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide keep-alive `requests.Session` used by the sync
+    `http_get_json`. Retries stay in the caller (per-call `retries`/`backoff`),
+    so the adapter itself never retries.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=SESSION_POOL_CONNECTIONS,
+                    pool_maxsize=SESSION_POOL_MAXSIZE,
+                    max_retries=Retry(total=0, raise_on_status=False),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
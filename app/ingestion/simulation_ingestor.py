@@ -1,12 +1,15 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import httpx
 import pandas as pd
 
 from app.core.config import settings
 from app.ingestion.base import BaseIngestor
-from app.preprocessing.pipeline import preprocess_sim
-from typing import Optional
 from app.core.registry import Registry
+from app.preprocessing.pipeline import iter_sim
+
+# Shared stand-in for missing nested objects (read-only).
+_EMPTY: Dict[str, Any] = {}
 
 
 class MaterialsProjectIngestor(BaseIngestor):
@@ -26,10 +29,11 @@ class MaterialsProjectIngestor(BaseIngestor):
         out_dir: str = "data/raw",
         api_key: Optional[str] = None,
         registry: Optional[Registry] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
-        super().__init__(out_dir=out_dir, registry=registry)
+        super().__init__(out_dir=out_dir, registry=registry, http_client=http_client)
         self.api_key = api_key or settings.MATERIALS_PROJECT_API_KEY
-        self.standardize_fn = preprocess_sim
+        self.standardize_fn = iter_sim
 
     @staticmethod
     def _build_params(
@@ -113,19 +117,32 @@ class MaterialsProjectIngestor(BaseIngestor):
             pd.DataFrame: A DataFrame with columns for material_id, formula, spacegroup, band_gap, and density.
                          If no data is present, returns an empty DataFrame.
         """
-        data = raw.get("data", [])
+        data = raw.get("data") or []
         if not data:
             return pd.DataFrame()
 
-        rows = []
+        # Column lists, not a list of row dicts: skips pandas' dict-to-array pass.
+        ids, formulas, spacegroups, band_gaps, densities = ([] for _ in range(5))
         for item in data:
-            rows.append(
-                {
-                    "material_id": item.get("material_id"),
-                    "formula": item.get("formula_pretty"),
-                    "spacegroup": (item.get("symmetry") or {}).get("symbol"),
-                    "band_gap": (item.get("bandstructure") or {}).get("band_gap"),
-                    "density": item.get("density"),
-                }
-            )
-        return pd.DataFrame(rows)
+            g = item.get
+            ids.append(g("material_id"))
+            formulas.append(g("formula_pretty"))
+            spacegroups.append((g("symmetry") or _EMPTY).get("symbol"))
+            band_gaps.append((g("bandstructure") or _EMPTY).get("band_gap"))
+            densities.append(g("density"))
+        return pd.DataFrame(
+            {
+                "material_id": ids,
+                "formula": formulas,
+                "spacegroup": spacegroups,
+                "band_gap": band_gaps,
+                "density": densities,
+            },
+            copy=False,
+        )
+
+    def parse_many(self, raws: List[dict]) -> pd.DataFrame:
+        """Merge the `data` lists of several pages and parse them in one pass."""
+        return self.parse(
+            {"data": [item for raw in raws for item in raw.get("data", [])]}
+        )
@@ -1,12 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 
 from app.core.config import settings
 from app.ingestion.base import BaseIngestor
-from app.preprocessing.pipeline import preprocess_text
-from typing import Optional
 from app.core.registry import Registry
+from app.preprocessing.pipeline import iter_text
 
 
 class EuropePMCIngestor(BaseIngestor):
@@ -20,7 +19,7 @@ class EuropePMCIngestor(BaseIngestor):
 
     def __init__(self, *, registry: Optional[Registry] = None, **kw):
         super().__init__(registry=registry, **kw)
-        self.standardize_fn = preprocess_text
+        self.standardize_fn = iter_text
 
     @staticmethod
     def _build_params(
@@ -88,21 +87,49 @@ class EuropePMCIngestor(BaseIngestor):
         if not result_list:
             return pd.DataFrame()
 
-        rows = []
+        # Column lists, not a list of row dicts: skips pandas' dict-to-array pass.
+        ids, titles, sources, years, dois, authors, journals = ([] for _ in range(7))
         for r in result_list:
-            rows.append(
-                {
-                    "id": r.get("id"),
-                    "title": r.get("title"),
-                    "source": r.get("source"),
-                    "pub_year": r.get("pubYear"),
-                    "doi": r.get("doi"),
-                    "author_string": r.get("authorString"),
-                    "journal_title": r.get("journalTitle"),
-                    "text": r.get("title") or "",
-                }
-            )
-        return pd.DataFrame(rows)
+            get = r.get
+            ids.append(get("id"))
+            titles.append(get("title"))
+            sources.append(get("source"))
+            years.append(get("pubYear"))
+            dois.append(get("doi"))
+            authors.append(get("authorString"))
+            journals.append(get("journalTitle"))
+        return pd.DataFrame(
+            {
+                "id": ids,
+                "title": titles,
+                "source": sources,
+                "pub_year": years,
+                "doi": dois,
+                "author_string": authors,
+                "journal_title": journals,
+                "text": [t or "" for t in titles],
+            },
+            copy=False,
+        )
+
+    def standardize_df(self, df: pd.DataFrame) -> Optional[Iterable[Any]]:
+        """
+        Feed rows to `standardize` lazily from `itertuples`, so no list of
+        record dicts is built for the page.
+        """
+        if df.empty:
+            return None
+        cols = list(df.columns)
+        dict_, zip_ = dict, zip
+        rows = (dict_(zip_(cols, t)) for t in df.itertuples(index=False, name=None))
+        return self.standardize(rows)
+
+    def parse_many(self, raws: List[dict]) -> pd.DataFrame:
+        """Merge the result lists of several pages and parse them in one pass."""
+        results = [
+            r for raw in raws for r in raw.get("resultList", {}).get("result", [])
+        ]
+        return self.parse({"resultList": {"result": results}})
 
     async def fetch_async(
         self,
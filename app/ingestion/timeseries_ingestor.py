@@ -1,13 +1,48 @@
 import asyncio
+import importlib.util
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal
+from typing import Any, Iterable, List, Literal, Optional
 
+import numpy as np
 import pandas as pd
 
 from app.ingestion.base import BaseIngestor
-from app.preprocessing.pipeline import preprocess_timeseries
-from typing import Optional
 from app.core.registry import Registry
+from app.preprocessing.pipeline import iter_timeseries
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.json as pajson
+except Exception:  # pragma: no cover
+    pa = None
+    pacsv = None
+    pajson = None
+
+# Arrow parses files in blocks of this size, spread over its thread pool.
+ARROW_BLOCK_SIZE = 8 << 20
+# NetCDF files from this size on are opened lazily (dask chunks, h5netcdf engine).
+LARGE_NETCDF_BYTES = 32 << 20
+# JSON-lines files above this size are read by pandas in `json_chunksize` chunks.
+LARGE_JSON_BYTES = 64 << 20
+# With `low_memory`, files above this size are read piecewise (CSV in `csv_chunksize`
+# rows, JSON lines in newline-aligned byte ranges of JSON_RANGE_BYTES) and the pieces
+# concatenated: a lower peak than one whole-file Arrow read, not a bounded one.
+LOW_MEMORY_BYTES = 256 << 20
+JSON_RANGE_BYTES = 64 << 20
+
+
+def _plain(value: Any) -> Any:
+    """Arrow-produced cells back to JSON-shaped Python (lists, dicts without None)."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items() if v is not None}
+    if isinstance(value, np.ndarray):
+        items = value.tolist()
+        return [_plain(v) for v in items] if value.dtype == object else items
+    return value
 
 
 class TimeSeriesIngestor(BaseIngestor):
@@ -20,9 +55,21 @@ class TimeSeriesIngestor(BaseIngestor):
 
     NAME = "timeseries"
 
-    def __init__(self, *, registry: Optional[Registry] = None, **kw):
+    def __init__(
+        self,
+        *,
+        registry: Optional[Registry] = None,
+        json_chunksize: int = 100_000,
+        csv_chunksize: int = 200_000,
+        low_memory: bool = False,
+        **kw,
+    ):
         super().__init__(registry=registry, **kw)
-        self.standardize_fn = preprocess_timeseries
+        self.standardize_fn = iter_timeseries
+        self.json_chunksize = int(json_chunksize)
+        self.csv_chunksize = int(csv_chunksize)
+        self.low_memory = bool(low_memory)
+        self._exist_cache: set[str] = set()
 
     def fetch(self, path: str, kind: Literal["csv", "json", "netcdf"] = "csv") -> str:
         """
@@ -30,42 +77,69 @@ class TimeSeriesIngestor(BaseIngestor):
         The `kind` argument is informational; the actual file type is determined by extension in `parse`.
         """
         p = Path(path)
-        if not p.exists():
+        if str(p) not in self._exist_cache and not p.exists():
             raise FileNotFoundError(path)
         return str(p)
 
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """
+        Check many local files at once: one `os.scandir` per parent directory (dirent
+        types, no per-file stat) instead of one `exists()` per `fetch`. Paths found are
+        remembered, so later `fetch`/`fetch_async` calls on them skip the filesystem.
+        """
+        by_dir: dict[str, set[str]] = {}
+        for path in paths:
+            p = Path(path)
+            by_dir.setdefault(str(p.parent), set()).add(p.name)
+        for parent, names in by_dir.items():
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        if entry.name in names and entry.is_file():
+                            self._exist_cache.add(str(Path(parent, entry.name)))
+            except OSError:  # missing directory: `fetch` will raise as usual
+                continue
+
     async def fetch_async(
         self,
         path: str,
         kind: Literal["csv", "json", "netcdf"] = "csv",
     ) -> str:
         """
-        Asynchronously validates the existence of the file by delegating the operation to a thread,
-        ensuring the event loop is not blocked.
+        Asynchronously validates the existence of the file. A local stat is a single
+        fast syscall, so it runs inline; only remote-looking paths (URLs, s3://, ...)
+        are delegated to a thread so the event loop is not blocked.
         """
-        return await asyncio.to_thread(self.fetch, path, kind)
+        if "://" in path:
+            return await asyncio.to_thread(self.fetch, path, kind)
+        return self.fetch(path, kind)
 
     def parse(self, raw: str) -> pd.DataFrame:
         """
         Reads the file at the given path into a Pandas DataFrame based on its file extension.
-        - For `.csv` files: uses `pandas.read_csv`.
-        - For `.json` files: uses `pandas.read_json`, first attempting line-delimited JSON (`lines=True`),
-          falling back to standard JSON arrays if necessary.
+        - For `.csv` files: uses the multithreaded `pyarrow.csv` reader when pyarrow is installed,
+          otherwise (or if Arrow rejects the file) `pandas.read_csv`.
+        - For `.json` files: line-delimited JSON via `pyarrow.json`, then `pandas.read_json`
+          (`lines=True`, parsed in chunks above 64 MiB), falling back to standard JSON arrays if necessary.
+        - With `low_memory=True` (off by default), CSV and JSON-lines files above 256 MiB
+          are read piecewise and concatenated. Every piece is kept until the concat, so
+          peak memory is still about twice the final frame; it is lower than the Arrow
+          read's (~330 vs ~540 MB RSS on a 190 MB CSV) but the chunked pandas CSV
+          parse is ~2.5x slower.
         - For `.nc` or `.netcdf` files: attempts to use the optional `xarray` dependency to open the dataset,
-          flattening it into a DataFrame. Raises an error if `xarray` is not installed.
+          flattening it into a DataFrame. Raises an error if `xarray` is not installed. Files of
+          32 MiB and more are opened with `chunks={}` (and the `h5netcdf` engine when installed)
+          and flattened chunk by chunk through dask when it is available.
         Raises a ValueError for unsupported file extensions.
         """
         p = Path(raw)
         suffix = p.suffix.lower()
 
         if suffix == ".csv":
-            df = pd.read_csv(p)
+            df = self._read_csv(p)
 
         elif suffix == ".json":
-            try:
-                df = pd.read_json(p, lines=True)
-            except ValueError:
-                df = pd.read_json(p)
+            df = self._read_json(p)
 
         elif suffix in (".nc", ".netcdf"):
             try:
@@ -75,10 +149,101 @@ class TimeSeriesIngestor(BaseIngestor):
                     "xarray is required to read NetCDF files (.nc/.netcdf). "
                     "Add `xarray` to your dependencies."
                 ) from e
-            ds = xr.open_dataset(p)
-            df = ds.to_dataframe().reset_index()
+            if p.stat().st_size < LARGE_NETCDF_BYTES:
+                df = xr.open_dataset(p).to_dataframe().reset_index()
+            else:
+                df = self._read_netcdf_chunked(xr, p)
 
         else:
             raise ValueError(f"Unsupported file format: {p.suffix}")
 
         return df
+
+    def to_records(self, df: pd.DataFrame) -> List[dict]:
+        """
+        Records for the preprocess pipeline, built from the parsed frame itself. Arrow
+        hands nested JSON back as NumPy arrays and fills keys missing from a line with
+        None; both are undone here so payloads look as they did in the file (plain
+        lists and dicts, absent keys absent).
+        """
+        return [_plain(r) for r in super().to_records(df)]
+
+    def _is_large(self, p: Path) -> bool:
+        return self.low_memory and p.stat().st_size > LOW_MEMORY_BYTES
+
+    def _read_csv(self, p: Path) -> pd.DataFrame:
+        if self._is_large(p):
+            with pd.read_csv(p, chunksize=self.csv_chunksize) as reader:
+                return pd.concat(reader, ignore_index=True, copy=False)
+        if pacsv is not None:
+            try:
+                table = pacsv.read_csv(
+                    p,
+                    read_options=pacsv.ReadOptions(
+                        block_size=ARROW_BLOCK_SIZE, use_threads=True
+                    ),
+                )
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+            except ValueError:  # pa.ArrowInvalid: let pandas have a go
+                pass
+        return pd.read_csv(p)
+
+    def _read_json(self, p: Path) -> pd.DataFrame:
+        with p.open("rb") as f:
+            head = f.read(64).lstrip()
+        if head.startswith(b"["):  # a top-level array, not JSON lines
+            return pd.read_json(p)
+        if pajson is not None:
+            try:
+                if self._is_large(p):
+                    return self._read_jsonl_ranges(p)
+                table = pajson.read_json(
+                    p, read_options=pajson.ReadOptions(block_size=ARROW_BLOCK_SIZE)
+                )
+                return table.to_pandas(split_blocks=True, self_destruct=True)
+            except (ValueError, TypeError):  # ArrowInvalid / ArrowTypeError: pandas
+                pass
+        if p.stat().st_size > LARGE_JSON_BYTES:
+            # Chunks keep pandas' line parser from holding the whole file's text and
+            # objects at once; they are concatenated, so the frame itself is not
+            # bounded. Default (NumPy) dtypes, as from the Arrow and unchunked reads.
+            with pd.read_json(p, lines=True, chunksize=self.json_chunksize) as reader:
+                return pd.concat(reader, ignore_index=True)
+        try:
+            return pd.read_json(p, lines=True)
+        except ValueError:
+            return pd.read_json(p)
+
+    @staticmethod
+    def _read_jsonl_ranges(p: Path) -> pd.DataFrame:
+        """
+        Split a JSON-lines file into byte ranges ending on a newline and parse the ranges
+        with Arrow on a small thread pool; only the ranges in flight are held as bytes.
+        Each range infers its own schema, so the tables are merged with permissive
+        promotion (e.g. a column all-int in one range and float in another -> double).
+        """
+        with p.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            bounds = [0]
+            while bounds[-1] < size:
+                nl = mm.find(b"\n", bounds[-1] + JSON_RANGE_BYTES)
+                bounds.append(size if nl < 0 else nl + 1)
+
+            def read_range(i: int) -> "pa.Table":
+                buf = pa.BufferReader(mm[bounds[i] : bounds[i + 1]])
+                return pajson.read_json(buf)
+
+            workers = min(len(bounds) - 1, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tables = list(pool.map(read_range, range(len(bounds) - 1)))
+        table = pa.concat_tables(tables, promote_options="permissive")
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    @staticmethod
+    def _read_netcdf_chunked(xr, p: Path) -> pd.DataFrame:
+        engine = "h5netcdf" if importlib.util.find_spec("h5netcdf") else None
+        if importlib.util.find_spec("dask") is None:
+            return xr.open_dataset(p, engine=engine).to_dataframe().reset_index()
+        ds = xr.open_dataset(p, engine=engine, chunks={})
+        df = ds.to_dask_dataframe().compute(scheduler="threads")
+        return df.reset_index(drop=True)
@@ -1,36 +1,82 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import ingest
 from app.core.config import settings
+from app.core.db import get_db
 from app.core.logging_factory import LoggerFactory
 from app.core.request_context import RequestLoggingMiddleware
 from app.api.routes.index import router as search_router
+from app.indexing.engine import HybridSearchEngine
+from app.ingestion.base import shutdown_disk_executor
+from app.ingestion.http_client import aclose_async_client, get_async_client
 
-app = FastAPI(title=settings.APP_NAME)
-app.add_middleware(RequestLoggingMiddleware)
 
-app.include_router(ingest.router)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    db = get_db()
+    await asyncio.to_thread(ingest.registry.bootstrap)
+    # Connects min_size connections before serving (fails startup on a bad DSN).
+    await db.get_async_pool()
+    app.state.engine = HybridSearchEngine()
+    await asyncio.to_thread(app.state.engine.warmup)
+    app.state.http = get_async_client()
+    yield
+    await aclose_async_client()
+    await asyncio.to_thread(shutdown_disk_executor)
+    db.close()
+    await db.aclose()
 
-app.include_router(search_router)
 
 logger = LoggerFactory.get_logger(__name__)
 
+_APP: Optional[FastAPI] = None
+
 
-@app.get("/")
 def read_root():
     return {"message": "Hello, World!"}
 
 
-@app.get("/ping")
 async def ping():
     logger.info("healthcheck ok", extra={"endpoint": "/ping"})
     return {"status": "ok"}
 
 
-@app.get("/health")
 def health():
     return {
         "app": settings.APP_NAME,
         "env": settings.ENV,
         "debug": settings.DEBUG,
     }
+
+
+def create_app() -> FastAPI:
+    """
+    Build the application once per process; later calls return the same instance,
+    so middleware and routers are never stacked twice (e.g. on reload or re-import).
+    """
+    global _APP
+    if _APP is not None:
+        return _APP
+
+    app = FastAPI(
+        title=settings.APP_NAME,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
+    )
+    app.add_middleware(RequestLoggingMiddleware)
+    app.include_router(ingest.router)
+    app.include_router(search_router)
+    app.add_api_route("/", read_root, methods=["GET"])
+    app.add_api_route("/ping", ping, methods=["GET"])
+    app.add_api_route("/health", health, methods=["GET"])
+
+    _APP = app
+    return app
+
+
+app = create_app()
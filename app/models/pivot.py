@@ -1,7 +1,9 @@
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+
+from app.preprocessing.normalize import intern_element
 
 
 class MaterialIdentity(BaseModel):
@@ -14,8 +16,12 @@ class MaterialIdentity(BaseModel):
     - elements: List of chemical element symbols, e.g., ["O", "Si"].
     - n_elements: Number of distinct elements.
     - material_hash: Stable hash identifier for the material.
+
+    Frozen: the adapters share one instance across every record of a formula.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     formula: str
     canonical_formula: str
     elements: List[str]
@@ -25,7 +31,7 @@ class MaterialIdentity(BaseModel):
     @field_validator("elements")
     @classmethod
     def _upper_sort(cls, v: List[str]) -> List[str]:
-        return sorted([e.capitalize() for e in v])
+        return sorted(map(intern_element, v))
 
 
 class BaseDoc(BaseModel):
@@ -37,14 +43,19 @@ class BaseDoc(BaseModel):
     - source: Data source name, e.g., "europepmc", "materials_project".
     - source_id: Optional external identifier such as DOI or file path.
     - created_at: Timestamp of data acquisition (UTC normalized).
-    - version: Internal preprocessing version, default "v1".
+    - version: Internal preprocessing version, default "v2" (v2: BLAKE2b material hashes).
+
+    Documents are frozen once built (pydantic v2 models keep fields in `__dict__`,
+    so there is no slots layout to switch to).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     uid: str
     source: str
     source_id: Optional[str] = None
     created_at: datetime
-    version: str = "v1"
+    version: str = "v2"
 
 
 class TextDoc(BaseDoc):
@@ -97,16 +108,49 @@ class TimeSeriesDoc(BaseDoc):
     - kind: Literal type discriminator, fixed to "timeseries".
     - modality: Type of timeseries data, e.g., "spectra", "chrono", or "other".
     - units: Units for the data axes, e.g., {"x": "s", "y": "a.u."}.
-    - values: List of data points as dictionaries of float values.
+    - t: Sample times (or x-axis values), parallel to `v`.
+    - v: Sample values (or y-axis values).
     - instrument: Optional instrument used for data acquisition.
     - conditions: Optional experimental or measurement conditions.
     - material: Optional associated material identity.
+
+    Points are stored column-wise (two float lists) rather than as one dict per point.
+    The legacy `values=[{"t": ..., "v": ...}, ...]` input is still accepted, and the
+    `values` property rebuilds that list for older consumers.
     """
 
     kind: Literal["timeseries"] = "timeseries"
     modality: Literal["spectra", "chrono", "other"] = "spectra"
     units: Dict[str, str]
-    values: List[Dict[str, float]]
+    t: List[float]
+    v: List[float]
     instrument: Optional[str] = None
     conditions: Optional[Dict[str, Any]] = None
     material: Optional[MaterialIdentity] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _split_values(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "values" in data and "t" not in data:
+            data = dict(data)
+            points = data.pop("values") or []
+            if not isinstance(points, list):
+                raise ValueError("values must be a list of {'t', 'v'} points")
+            try:
+                data["t"] = [p["t"] for p in points]
+                data["v"] = [p["v"] for p in points]
+            except (KeyError, TypeError) as e:
+                raise ValueError("values must be a list of {'t', 'v'} points") from e
+        return data
+
+    @model_validator(mode="after")
+    def _same_length(self) -> "TimeSeriesDoc":
+        if len(self.t) != len(self.v):
+            raise ValueError(
+                f"t and v differ in length: {len(self.t)} != {len(self.v)}"
+            )
+        return self
+
+    @property
+    def values(self) -> List[Dict[str, float]]:
+        return [{"t": t, "v": v} for t, v in zip(self.t, self.v)]
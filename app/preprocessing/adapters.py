@@ -1,58 +1,121 @@
+import hashlib
+import re
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Any, Dict
-from uuid import NAMESPACE_URL, uuid5
+from typing import Any, Dict, Optional
+from uuid import NAMESPACE_URL
 
 from pydantic import ValidationError
 
 from app.models.pivot import MaterialIdentity, SimulationDoc, TextDoc, TimeSeriesDoc
 from app.preprocessing.normalize import (
     canonicalize_formula,
-    material_hash_from_formula,
+    FORMULA_CACHE_SIZE,
+    material_hash_from_canonical,
     parse_date_any,
-    to_s,
+    TIME_TO_S,
+    unit_entry,
 )
 
 
+# SHA-1 state with the UUID5 namespace already absorbed; `_sha1_prefix` extends it.
+_SHA1_NS_URL = hashlib.sha1(NAMESPACE_URL.bytes, usedforsecurity=False)
+# EuropePMC author strings: "A; B", "A;B", "A  ;  B", ...
+_AUTH_SPLIT = re.compile(r"\s*;\s*")
+
+
+@lru_cache(maxsize=64)
+def _sha1_prefix(namespace: str):
+    """SHA-1 state after NAMESPACE_URL + "<namespace>:" (a handful of sources)."""
+    sha = _SHA1_NS_URL.copy()
+    sha.update(f"{namespace}:".encode("utf-8"))
+    return sha
+
+
 def _mk_uid(namespace: str, external_id: str) -> str:
-    """Create a deterministic UUID5 based on a namespace and external identifier."""
-    return str(uuid5(NAMESPACE_URL, f"{namespace}:{external_id}"))
+    """Create a deterministic UUID5 based on a namespace and external identifier.
 
+    Same value as `uuid5(NAMESPACE_URL, ...)`: the SHA-1 state for the
+    "<namespace>:" prefix is copied rather than rehashed, the version/variant bits
+    are set inline and the canonical 8-4-4-4-12 form is formatted from the hex
+    digest (no UUID object per record)."""
+    sha = _sha1_prefix(namespace).copy()
+    sha.update(str(external_id).encode("utf-8"))
+    digest = sha.digest()
+    b = bytearray(digest[:16])
+    b[6] = (b[6] & 0x0F) | 0x50
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def _material_identity(formula: str) -> MaterialIdentity:
+    """Build (once per formula) the MaterialIdentity shared by every record of that
+    material. Elements come out of `canonicalize_formula` already capitalized and
+    sorted, so the model's validator would be a no-op; instances are not mutated
+    downstream, which makes sharing them safe."""
+    canonical, elements = canonicalize_formula(formula)
+    return MaterialIdentity.model_construct(
+        formula=formula,
+        canonical_formula=canonical,
+        elements=elements,
+        n_elements=len(elements),
+        material_hash=material_hash_from_canonical(canonical),
+    )
 
-def to_textdoc(row: Dict[str, Any], source: str = "europepmc") -> TextDoc:
-    """Map a raw text record (e.g., from EuropePMC) into a TextDoc, including normalization of date, title, and authors."""
-    title = row.get("title") or ""
-    text = row.get("text") or title
-    year = row.get("pub_year") or row.get("year")
-    created_at = parse_date_any(year or datetime.now(timezone.utc))
+
+def to_textdoc(
+    row: Dict[str, Any],
+    source: str = "europepmc",
+    *,
+    now: Optional[datetime] = None,
+) -> TextDoc:
+    """Map a raw text record (e.g., from EuropePMC) into a TextDoc, including normalization of date, title, and authors.
+
+    `now` (UTC) stands in for a missing date; batch callers pass one value for all rows.
+    """
+    get = row.get
+    title = get("title") or ""
+    text = get("text") or title
+    year = get("pub_year") or get("year")
+    created_at = parse_date_any(year) if year else now or datetime.now(timezone.utc)
     material = None
+    authors = get("authors")
+    if authors is None:
+        s = get("author_string")
+        authors = _AUTH_SPLIT.split(s.strip()) if s else None
+    ext_id = get("id") or get("doi")
     try:
         return TextDoc(
-            uid=_mk_uid(source, str(row.get("id") or row.get("doi") or title[:50])),
+            uid=_mk_uid(source, str(ext_id or title[:50])),
             source=source,
-            source_id=str(row.get("id") or row.get("doi") or ""),
+            source_id=str(ext_id or ""),
             created_at=created_at,
             title=title or None,
             text=text,
             year=int(year) if year else None,
-            authors=(
-                row.get("authors") or (row.get("author_string") or "").split("; ")
-                if row.get("author_string")
-                else None
-            ),
-            venue=row.get("venue") or row.get("journal_title"),
+            authors=authors,
+            venue=get("venue") or get("journal_title"),
             material=material,
         )
     except ValidationError:
         raise
 
 
-def to_simdoc(item: Dict[str, Any], source: str = "materials_project") -> SimulationDoc:
+def to_simdoc(
+    item: Dict[str, Any],
+    source: str = "materials_project",
+    *,
+    now: Optional[datetime] = None,
+) -> SimulationDoc:
     """Map a raw simulation record (e.g., from Materials Project) into a SimulationDoc, performing
     canonicalization of chemical formulas and normalizing properties like band gap and density.
+    `now` (UTC) stands in for a missing year.
     """
     formula = item.get("formula") or item.get("formula_pretty") or "X"
-    canonical, elements = canonicalize_formula(formula)
-    mid = item.get("material_id") or canonical
+    material = _material_identity(formula)
+    mid = item.get("material_id") or material.canonical_formula
     props = {}
     if (
         bg := item.get("band_gap") or (item.get("bandstructure") or {}).get("band_gap")
@@ -60,62 +123,57 @@ def to_simdoc(item: Dict[str, Any], source: str = "materials_project") -> Simula
         props["band_gap_eV"] = float(bg)
     if (rho := item.get("density")) is not None:
         props["density_g_cm3"] = float(rho)
-    created_at = parse_date_any(item.get("year") or datetime.now(timezone.utc))
+    year = item.get("year")
+    created_at = parse_date_any(year) if year else now or datetime.now(timezone.utc)
     return SimulationDoc(
         uid=_mk_uid(source, str(mid)),
         source=source,
         source_id=str(mid),
         created_at=created_at,
         method=item.get("method") or item.get("functional"),
-        material=MaterialIdentity(
-            formula=formula,
-            canonical_formula=canonical,
-            elements=elements,
-            n_elements=len(elements),
-            material_hash=material_hash_from_formula(formula),
-        ),
+        material=material,
         properties=props,
         references=item.get("references"),
     )
 
 
 def to_tsdoc(
-    payload: Dict[str, Any], source: str = "local_timeseries"
+    payload: Dict[str, Any],
+    source: str = "local_timeseries",
+    *,
+    now: Optional[datetime] = None,
 ) -> TimeSeriesDoc:
     """Map a raw time series payload (e.g., spectra data) into a TimeSeriesDoc, performing normalization
-    of time units and chemical formulas for the associated material identity."""
+    of time units and chemical formulas for the associated material identity.
+    `now` (UTC) stands in for a missing `created_at`."""
     units = payload.get("units") or {}
     values = payload.get("values") or []
+    # Column-wise points (x/y accepted as aliases for t/v).
     if values and "t_unit" in payload:
-        conv = lambda t: to_s(float(t), payload["t_unit"])
-        values = [
-            {
-                "t": conv(v.get("t", v.get("x", 0))),
-                "v": float(v.get("v", v.get("y", 0))),
-            }
-            for v in values
-        ]
+        mul, div = unit_entry(TIME_TO_S, payload["t_unit"], "time")
         units["t"] = "s"
+        t = [float(p.get("t", p.get("x", 0))) * mul / div for p in values]
+    else:
+        t = [float(p.get("t", p.get("x", 0))) for p in values]
+    v = [float(p.get("v", p.get("y", 0))) for p in values]
     material = None
     if m := payload.get("material", {}).get("formula"):
-        canonical, elements = canonicalize_formula(m)
-        material = MaterialIdentity(
-            formula=m,
-            canonical_formula=canonical,
-            elements=elements,
-            n_elements=len(elements),
-            material_hash=material_hash_from_formula(m),
-        )
-    return TimeSeriesDoc(
+        material = _material_identity(m)
+    # t/v are already float lists: skip re-validating every point (the bulk of
+    # the cost for long series); pipeline.preprocess_timeseries spot-checks batches.
+    return TimeSeriesDoc.model_construct(
         uid=_mk_uid(source, payload.get("path", "unknown")),
         source=source,
         source_id=payload.get("path"),
-        created_at=parse_date_any(
-            payload.get("created_at") or datetime.now(timezone.utc)
+        created_at=(
+            parse_date_any(created)
+            if (created := payload.get("created_at"))
+            else now or datetime.now(timezone.utc)
         ),
         modality=payload.get("modality", "spectra"),
         units=units,
-        values=[{"t": float(v["t"]), "v": float(v["v"])} for v in values],
+        t=t,
+        v=v,
         instrument=payload.get("instrument"),
         conditions=payload.get("conditions"),
         material=material,
@@ -1,9 +1,27 @@
 import hashlib
 import re
+import sys
+from collections import defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 
+# YYYY, YYYY-MM, YYYY-MM-DD (or with "/"); strptime also took 1-digit months/days.
+_date_re = re.compile(r"(\d{4})(?:([-/])(\d{1,2})(?:\2(\d{1,2}))?)?")
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(s: str) -> datetime | None:
+    m = _date_re.fullmatch(s)
+    if m is None:
+        return None
+    try:
+        return datetime(int(m[1]), int(m[3] or 1), int(m[4] or 1), tzinfo=timezone.utc)
+    except ValueError:  # e.g. month 13
+        return None
+
+
 def parse_date_any(s: str | int | float | datetime) -> datetime:
     """Robustly parse various common date/time formats or numeric timestamps into a UTC datetime object.
 
@@ -16,33 +34,52 @@ def parse_date_any(s: str | int | float | datetime) -> datetime:
         return datetime.fromtimestamp(float(s), tz=timezone.utc)
     s = str(s).strip()
 
-    for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y-%m", "%Y/%m", "%Y"):
-        try:
-            dt = datetime.strptime(s, fmt)
-            if fmt == "%Y":
-                dt = dt.replace(month=1, day=1)
-            if fmt in ("%Y-%m", "%Y/%m"):
-                dt = dt.replace(day=1)
-            return dt.replace(tzinfo=timezone.utc)
-        except ValueError:
-            pass
+    # Date-only shapes are at most 10 chars; longer strings carry a time part and
+    # go straight to the C ISO parser (3.11+ reads "Z" itself) without taking a
+    # slot in the `_parse_ymd` cache, which unique timestamps would just churn.
+    if len(s) <= 10 and (dt := _parse_ymd(s)) is not None:
+        return dt
     try:
-        return datetime.fromisoformat(s.replace("Z", "+00:00")).astimezone(timezone.utc)
-    except Exception:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
         return datetime.now(tz=timezone.utc)
+    return dt if dt.tzinfo is timezone.utc else dt.astimezone(timezone.utc)
+
 
+_PERIODIC_TABLE = (
+    "H He Li Be B C N O F Ne Na Mg Al Si P S Cl Ar K Ca Sc Ti V Cr Mn Fe Co Ni Cu "
+    "Zn Ga Ge As Se Br Kr Rb Sr Y Zr Nb Mo Tc Ru Rh Pd Ag Cd In Sn Sb Te I Xe Cs Ba "
+    "La Ce Pr Nd Pm Sm Eu Gd Tb Dy Ho Er Tm Yb Lu Hf Ta W Re Os Ir Pt Au Hg Tl Pb "
+    "Bi Po At Rn Fr Ra Ac Th Pa U Np Pu Am Cm Bk Cf Es Fm Md No Lr Rf Db Sg Bh Hs "
+    "Mt Ds Rg Cn Nh Fl Mc Lv Ts Og D"
+).split()
+# One shared str object per element symbol, so element lists across millions of
+# documents point at ~118 strings instead of holding fresh copies.
+_ELEMENT_INTERN: Dict[str, str] = {e: sys.intern(e) for e in _PERIODIC_TABLE}
+
+
+def intern_element(symbol: str) -> str:
+    """Return the shared, capitalized str object for an element symbol."""
+    hit = _ELEMENT_INTERN.get(symbol)
+    if hit is None:
+        hit = sys.intern(symbol.capitalize())
+    return hit
+
+
+# Distinct formulas kept per cache; a full Materials Project pull has tens of
+# thousands, and 8192 entries would start evicting partway through a run.
+FORMULA_CACHE_SIZE = 65536
 
 _element_re = re.compile(r"([A-Z][a-z]?)(\d*\.?\d*)")
 
 
-def canonicalize_formula(formula: str) -> Tuple[str, List[str]]:
-    """Normalize a chemical formula string by parsing element counts, sorting elements alphabetically,
-    and returning the canonical formula string along with the sorted list of elements.
-    """
-    counts: Dict[str, float] = {}
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def _canonicalize(formula: str) -> Tuple[str, Tuple[str, ...]]:
+    counts: Dict[str, float] = defaultdict(float)
+    # findall hands back (element, count) tuples without a Match object per token.
+    # Spaces are dropped first, so "F e2" reads as Fe2 (not F plus a stray "e").
     for el, num in _element_re.findall(formula.replace(" ", "")):
-        n = float(num) if num else 1.0
-        counts[el] = counts.get(el, 0.0) + n
+        counts[intern_element(el)] += float(num) if num else 1.0
     items = sorted(counts.items(), key=lambda kv: kv[0])
     parts = []
     for el, n in items:
@@ -54,54 +91,101 @@ def canonicalize_formula(formula: str) -> Tuple[str, List[str]]:
         else:
             parts.append(f"{el}{n_val}")
     canonical = "".join(parts)
-    elements = [el for el, _ in items]
+    elements = tuple(el for el, _ in items)
     return canonical, elements
 
 
+def canonicalize_formula(formula: str) -> Tuple[str, List[str]]:
+    """Normalize a chemical formula string by parsing element counts, sorting elements alphabetically,
+    and returning the canonical formula string along with the sorted list of elements.
+
+    Results are memoized per formula (materials repeat a lot across pages)."""
+    canonical, elements = _canonicalize(formula)
+    return canonical, list(elements)
+
+
+def material_hash_from_canonical(canonical: str) -> str:
+    """Hash an already-canonical formula (see `material_hash_from_formula`)."""
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
 def material_hash_from_formula(formula: str) -> str:
-    """Produce a short SHA256-based hash identifier from the canonicalized chemical formula,
-    for use as a material identity key."""
-    canonical, _ = canonicalize_formula(formula)
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+    """Produce a short (16 hex chars) BLAKE2b-based hash identifier from the canonicalized
+    chemical formula, for use as a material identity key."""
+    return material_hash_from_canonical(_canonicalize(formula)[0])
+
+
+# Unit tables, built once at import. Entries are (multiplier, divisor) so that
+# value * m / d reproduces the exact float results of the old per-unit branches;
+# temperatures are (pre, m, d, post) for kelvin = (value + pre) * m / d + post, which
+# keeps the old Fahrenheit evaluation order ((value - 32) * 5 / 9 + 273.15); folding
+# it into one scale and offset would be off by an ulp for about a third of inputs.
+ENERGY_TO_EV: Dict[str, Tuple[float, float]] = {
+    "ev": (1.0, 1.0),
+    "j": (1.0, 1.602176634e-19),
+    "joule": (1.0, 1.602176634e-19),
+    "joules": (1.0, 1.602176634e-19),
+    "kj/mol": (1.0, 96.485),  # approx: 1 eV ≈ 96.485 kJ/mol
+    "kilojoule/mol": (1.0, 96.485),
+}
+
+TEMP_TO_K: Dict[str, Tuple[float, float, float, float]] = {
+    "k": (0.0, 1.0, 1.0, 0.0),
+    "kelvin": (0.0, 1.0, 1.0, 0.0),
+    "c": (0.0, 1.0, 1.0, 273.15),
+    "°c": (0.0, 1.0, 1.0, 273.15),
+    "celsius": (0.0, 1.0, 1.0, 273.15),
+    "f": (-32.0, 5.0, 9.0, 273.15),
+    "°f": (-32.0, 5.0, 9.0, 273.15),
+    "fahrenheit": (-32.0, 5.0, 9.0, 273.15),
+}
+
+TIME_TO_S: Dict[str, Tuple[float, float]] = {
+    "s": (1.0, 1.0),
+    "sec": (1.0, 1.0),
+    "second": (1.0, 1.0),
+    "seconds": (1.0, 1.0),
+    "ms": (1.0, 1e3),
+    "us": (1.0, 1e6),
+    "µs": (1.0, 1e6),
+    "ns": (1.0, 1e9),
+    "min": (60.0, 1.0),
+    "mins": (60.0, 1.0),
+    "minute": (60.0, 1.0),
+    "minutes": (60.0, 1.0),
+    "h": (3600.0, 1.0),
+    "hr": (3600.0, 1.0),
+    "hour": (3600.0, 1.0),
+    "hours": (3600.0, 1.0),
+}
+
+
+def unit_entry(
+    table: Dict[str, Tuple[float, ...]], unit: str, kind: str
+) -> Tuple[float, ...]:
+    """Look up `unit` in a conversion table (exact key first, then lowercased)."""
+    entry = table.get(unit)
+    if entry is None:
+        entry = table.get(unit.lower())
+        if entry is None:
+            raise ValueError(f"Unsupported {kind} unit: {unit}")
+    return entry
 
 
 def to_eV(value: float, unit: str) -> float:
     """Convert a given energy value from supported units (eV, joules, kJ/mol) into electronvolts."""
-    unit = unit.lower()
-    if unit in ("ev",):
-        return value
-    if unit in ("j", "joule", "joules"):
-        return value / 1.602176634e-19
-    if unit in ("kj/mol", "kilojoule/mol"):  # approx: 1 eV ≈ 96.485 kJ/mol
-        return value / 96.485
-    raise ValueError(f"Unsupported energy unit: {unit}")
+    m, d = unit_entry(ENERGY_TO_EV, unit, "energy")
+    return value * m / d
 
 
 def to_K(value: float, unit: str) -> float:
     """Convert a given temperature from supported units (K, °C, °F) into kelvin."""
-    u = unit.lower()
-    if u in ("k", "kelvin"):
-        return value
-    if u in ("c", "°c", "celsius"):
-        return value + 273.15
-    if u in ("f", "°f", "fahrenheit"):
-        return (value - 32) * 5 / 9 + 273.15
-    raise ValueError(f"Unsupported temperature unit: {unit}")
+    pre, m, d, post = unit_entry(TEMP_TO_K, unit, "temperature")
+    return (value + pre) * m / d + post
 
 
 def to_s(value: float, unit: str) -> float:
     """Convert a given time duration from supported units (seconds, ms, µs, ns, minutes, hours) into seconds."""
-    u = unit.lower()
-    if u in ("s", "sec", "second", "seconds"):
-        return value
-    if u in ("ms",):
-        return value / 1e3
-    if u in ("us", "µs"):
-        return value / 1e6
-    if u in ("ns",):
-        return value / 1e9
-    if u in ("min", "mins", "minute", "minutes"):
-        return value * 60
-    if u in ("h", "hr", "hour", "hours"):
-        return value * 3600
-    raise ValueError(f"Unsupported time unit: {unit}")
+    m, d = unit_entry(TIME_TO_S, unit, "time")
+    return value * m / d
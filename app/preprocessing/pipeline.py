@@ -1,18 +1,76 @@
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, TypeVar
+
+from pydantic import BaseModel
+
 from app.preprocessing.adapters import to_textdoc, to_simdoc, to_tsdoc
 from app.models.pivot import TextDoc, SimulationDoc, TimeSeriesDoc
 
+D = TypeVar("D")
+
+
+def _fields(model: BaseModel) -> Dict[str, Any]:
+    """Field values as plain dicts, nested models included (they would otherwise be
+    accepted as-is); the lists are handed over without model_dump's copies."""
+    return {
+        k: _fields(v) if isinstance(v, BaseModel) else v
+        for k, v in model.__dict__.items()
+    }
+
+
+def _validated(doc: D) -> D:
+    """Re-validate a document built with model_construct; raises ValidationError."""
+    if isinstance(doc, BaseModel):
+        return type(doc).model_validate(_fields(doc))
+    return doc
+
+
+def _spot_check(docs: List[D]) -> List[D]:
+    """Fully validate the first and last documents of a batch."""
+    if docs:
+        docs[0] = _validated(docs[0])
+        docs[-1] = _validated(docs[-1])
+    return docs
+
+
+def _spot_check_iter(docs: Iterator[D]) -> Iterator[D]:
+    """Lazy counterpart of `_spot_check`: validates the first document."""
+    for i, doc in enumerate(docs):
+        yield _validated(doc) if i == 0 else doc
+
 
 def preprocess_text(rows: List[Dict[str, Any]]) -> List[TextDoc]:
     """Takes a list of dicts representing raw text records and returns a list of TextDoc objects via to_textdoc."""
-    return [to_textdoc(r) for r in rows]
+    # One timestamp stands in for every missing date of the batch.
+    now = datetime.now(timezone.utc)
+    return [to_textdoc(r, now=now) for r in rows]
 
 
 def preprocess_sim(items: List[Dict[str, Any]]) -> List[SimulationDoc]:
     """Takes a list of dicts representing raw simulation data and returns a list of SimulationDoc objects via to_simdoc."""
-    return [to_simdoc(x) for x in items]
+    now = datetime.now(timezone.utc)
+    return [to_simdoc(x, now=now) for x in items]
 
 
 def preprocess_timeseries(items: List[Dict[str, Any]]) -> List[TimeSeriesDoc]:
     """Takes a list of dicts representing raw time series data and returns a list of TimeSeriesDoc objects via to_tsdoc."""
-    return [to_tsdoc(x) for x in items]
+    now = datetime.now(timezone.utc)
+    return _spot_check([to_tsdoc(x, now=now) for x in items])
+
+
+def iter_text(rows: Iterable[Dict[str, Any]]) -> Iterator[TextDoc]:
+    """Lazy variant of preprocess_text: yields TextDoc objects one row at a time."""
+    now = datetime.now(timezone.utc)
+    return (to_textdoc(r, now=now) for r in rows)
+
+
+def iter_sim(items: Iterable[Dict[str, Any]]) -> Iterator[SimulationDoc]:
+    """Lazy variant of preprocess_sim: yields SimulationDoc objects one item at a time."""
+    now = datetime.now(timezone.utc)
+    return (to_simdoc(x, now=now) for x in items)
+
+
+def iter_timeseries(items: Iterable[Dict[str, Any]]) -> Iterator[TimeSeriesDoc]:
+    """Lazy variant of preprocess_timeseries: yields TimeSeriesDoc objects one item at a time."""
+    now = datetime.now(timezone.utc)
+    return _spot_check_iter(to_tsdoc(x, now=now) for x in items)
@@ -13,8 +13,11 @@ def main() -> None:
     print(f"[simulation] rows: {len(df_sim)}")
 
     ts = TimeSeriesIngestor()
-    df_ts = ts.run(path="data/raw/example_timeseries.csv")
-    print(f"[timeseries] rows: {len(df_ts)}")
+    ts_paths = ["data/raw/example_timeseries.csv"]
+    ts.prefetch(ts_paths)
+    for path in ts_paths:
+        df_ts = ts.run(path=path)
+        print(f"[timeseries] {path} rows: {len(df_ts)}")
 
 
 if __name__ == "__main__":
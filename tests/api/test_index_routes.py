@@ -0,0 +1,163 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import index
+from app.core.db import get_db
+from app.core.registry import Registry
+
+
+class FakeDB:
+    def __init__(self, row=None, rows=()):
+        self.row = row
+        self.rows = list(rows)
+        self.calls = []
+
+    async def afetchone(self, sql, params=None):
+        self.calls.append((sql, params))
+        return self.row
+
+    async def afetchall(self, sql, params=None):
+        self.calls.append((sql, params))
+        return self.rows
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    index._meta_cache.clear()
+    index._material_cache.clear()
+    yield
+    index._meta_cache.clear()
+    index._material_cache.clear()
+
+
+@pytest.fixture
+def make_client():
+    def _make(db):
+        app = FastAPI()
+        app.include_router(index.router)
+        app.dependency_overrides[get_db] = lambda: db
+        return TestClient(app)
+
+    return _make
+
+
+ID_A = "00000000-0000-0000-0000-00000000000a"
+ID_B = "00000000-0000-0000-0000-00000000000b"
+
+
+def test_get_material_ok(make_client):
+    db = FakeDB(row={"id": ID_A, "metadata": {"title": "Si"}})
+    resp = make_client(db).get(f"/search/materials/{ID_A}")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"doc_id": ID_A, "metadata": {"title": "Si"}}
+    assert db.calls[0][1] == (ID_A,)
+
+
+def test_get_material_is_served_from_cache(make_client):
+    db = FakeDB(row={"id": ID_A, "metadata": {}})
+    client = make_client(db)
+
+    client.get(f"/search/materials/{ID_A}")
+    resp = client.get(f"/search/materials/{ID_A.upper()}")
+
+    assert resp.status_code == 200
+    assert len(db.calls) == 1
+
+
+def test_get_material_shares_cache_with_batch_route(make_client):
+    db = FakeDB(row={"id": ID_A, "metadata": {}})
+    client = make_client(db)
+
+    client.get(f"/search/materials/{ID_A.upper()}")
+    resp = client.get(f"/search/materials?ids={ID_A}")
+
+    assert [m["doc_id"] for m in resp.json()] == [ID_A]
+    assert len(db.calls) == 1
+
+
+def test_get_material_not_found(make_client):
+    resp = make_client(FakeDB(row=None)).get(f"/search/materials/{ID_B}")
+    assert resp.status_code == 404
+
+
+def test_get_material_rejects_invalid_id(make_client):
+    db = FakeDB()
+    resp = make_client(db).get("/search/materials/doc-1")
+    assert resp.status_code == 400
+    assert db.calls == []
+
+
+def test_get_materials_batch_keeps_request_order(make_client):
+    db = FakeDB(
+        rows=[
+            {"id": ID_A, "metadata": {"n": "a"}},
+            {"id": ID_B, "metadata": {"n": "b"}},
+        ]
+    )
+    resp = make_client(db).get(f"/search/materials?ids={ID_B}&ids={ID_A}")
+
+    assert resp.status_code == 200
+    assert [m["doc_id"] for m in resp.json()] == [ID_B, ID_A]
+    assert len(db.calls) == 1
+    assert sorted(db.calls[0][1][0]) == [ID_A, ID_B]
+
+
+def test_get_materials_batch_only_queries_cache_misses(make_client):
+    db = FakeDB(rows=[{"id": ID_A, "metadata": {}}])
+    client = make_client(db)
+    client.get(f"/search/materials?ids={ID_A}")
+
+    db.rows = [{"id": ID_B, "metadata": {}}]
+    resp = client.get(f"/search/materials?ids={ID_A}&ids={ID_B}")
+
+    assert [m["doc_id"] for m in resp.json()] == [ID_A, ID_B]
+    assert db.calls[-1][1] == ([ID_B],)
+
+
+def test_get_materials_batch_rejects_invalid_ids(make_client):
+    resp = make_client(FakeDB()).get("/search/materials?ids=not-a-uuid")
+    assert resp.status_code == 400
+
+
+def test_list_metadata_fields(make_client):
+    payload = {"years": [2020, 2021], "methods": ["DFT"]}
+    resp = make_client(FakeDB(row={"payload": payload})).get("/search/metadata")
+
+    assert resp.status_code == 200
+    assert resp.json() == payload
+
+
+def test_list_metadata_fields_empty(make_client):
+    resp = make_client(FakeDB(row=None)).get("/search/metadata")
+    assert resp.json() == {"years": [], "methods": []}
+
+
+def test_list_metadata_fields_is_cached_until_documents_change(
+    make_client, monkeypatch
+):
+    db = FakeDB(row={"payload": {"years": [2020], "methods": []}})
+    client = make_client(db)
+
+    client.get("/search/metadata")
+    client.get("/search/metadata")
+    assert len(db.calls) == 1
+
+    monkeypatch.setattr(Registry, "documents_version", Registry.documents_version + 1)
+    client.get("/search/metadata")
+    assert len(db.calls) == 2
+
+
+def test_search_uses_engine_from_app_state():
+    class FakeEngine:
+        def search(self, req):
+            return {"total": 0, "page": req.page, "size": req.size, "items": []}
+
+    app = FastAPI()
+    app.include_router(index.router)
+    app.state.engine = FakeEngine()
+
+    resp = TestClient(app).post("/search", json={"kind": "text", "query": "si"})
+    assert resp.status_code == 200
+    assert resp.json() == {"total": 0, "page": 1, "size": 10, "items": []}
@@ -1,4 +1,5 @@
 import asyncio
+from contextlib import contextmanager
 from unittest.mock import AsyncMock
 
 import importlib
@@ -8,6 +9,8 @@ import pytest
 from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 
+from app.core.db import PostgresClient
+
 
 @pytest.fixture
 def ingest_module(monkeypatch):
@@ -37,7 +40,12 @@ def ingest_module(monkeypatch):
         def close(self):
             return None
 
+    @contextmanager
+    def dummy_connection(self):
+        yield DummyConn()
+
     monkeypatch.setattr(psycopg, "connect", lambda *a, **k: DummyConn())
+    monkeypatch.setattr(PostgresClient, "connection", dummy_connection)
     return importlib.import_module("app.api.routes.ingest")
 
 
@@ -0,0 +1,16 @@
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+def test_create_app_returns_single_instance():
+    assert main.create_app() is main.create_app() is main.app
+    paths = [r.path for r in main.app.routes]
+    assert len(paths) == len(set(paths))
+    assert len(main.app.user_middleware) == 1
+
+
+def test_health_routes():
+    client = TestClient(main.app)  # no context manager: lifespan is not run
+    assert client.get("/ping").json() == {"status": "ok"}
+    assert client.get("/health").json()["app"]
@@ -0,0 +1,37 @@
+from app.core.cache import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" becomes the LRU entry
+
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_expires_entries(mocker):
+    now = mocker.patch("app.core.cache.time.monotonic", return_value=100.0)
+    cache = LRUCache(maxsize=4, ttl=10)
+    cache.set("k", "v")
+
+    now.return_value = 105.0
+    assert cache.get("k") == "v"
+
+    now.return_value = 111.0
+    assert cache.get("k", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_pop_and_clear():
+    cache = LRUCache(maxsize=4)
+    cache.set(1, "x")
+    cache.set(2, "y")
+    cache.pop(1)
+    assert cache.get(1) is None
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,29 @@
+from app.core.config import Settings, get_settings, settings
+
+
+def test_settings_is_a_cached_singleton():
+    assert get_settings() is get_settings()
+    assert get_settings() is settings
+
+
+def test_single_settings_class_exposes_all_sections():
+    fields = Settings.model_fields.keys()
+    for name in (
+        "APP_NAME",
+        "POSTGRES_URI",
+        "PG_POOL_MAX",
+        "S3_BUCKET",
+        "LOG_FORMAT",
+        "EUROPEPMC_API_URL",
+        "MP_API_URL",
+    ):
+        assert name in fields
+
+
+def test_env_aliases_override_defaults(monkeypatch):
+    monkeypatch.setenv("MRS_PG_POOL_MAX", "42")
+    monkeypatch.setenv("MRS_S3_BUCKET", "other")
+
+    fresh = Settings()
+    assert fresh.PG_POOL_MAX == 42
+    assert fresh.S3_BUCKET == "other"
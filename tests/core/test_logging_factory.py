@@ -9,6 +9,7 @@ from app.core.logging_factory import JsonFormatter, LoggerFactory
 
 
 def _reset_logging_and_factory():
+    LoggerFactory.shutdown()
     root = logging.getLogger()
     root.handlers.clear()
     LoggerFactory._configured = False
@@ -30,6 +31,7 @@ def _set_settings(monkeypatch, **kwargs):
 
 
 def _capture_stderr(capfd):
+    LoggerFactory.shutdown()  # drain the background listener before reading
     out, err = capfd.readouterr()
     lines = [l for l in err.strip().splitlines() if l.strip()]
     return lines[-1] if lines else ""
@@ -72,6 +74,21 @@ def test_timestamp_is_utc_iso8601_with_Z(monkeypatch, capfd):
     assert dt.tzinfo.utcoffset(dt) == timezone.utc.utcoffset(dt)
 
 
+def test_format_time_matches_isoformat_across_seconds(record_factory):
+    formatter = JsonFormatter()
+    for created in (1_700_000_000.0, 1_700_000_000.999, 1_700_000_001.042):
+        rec = record_factory()
+        rec.created = created
+        rec.msecs = int((created - int(created)) * 1000)
+
+        expected = (
+            datetime.fromtimestamp(created, tz=timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z")
+        )
+        assert formatter.formatTime(rec) == expected
+
+
 def test_exc_info_is_serialized_when_present(monkeypatch, capfd):
     _set_settings(monkeypatch, LOG_FORMAT="json", LOG_FILE_ENABLED=False)
 
@@ -123,6 +140,7 @@ def test_rotating_file_handler_creates_log_file(monkeypatch, tmp_path: Path):
 
     logger = LoggerFactory.get_logger("test.file")
     logger.info("to file")
+    LoggerFactory.shutdown()
 
     assert log_file.exists()
     content = log_file.read_text(encoding="utf-8").strip().splitlines()
@@ -151,6 +169,31 @@ def test_config_is_idempotent_no_duplicate_handlers(monkeypatch):
     ), "should not add duplicate handlers on subsequent get_logger()"
 
 
+def test_queue_handler_defers_io_to_listener(monkeypatch):
+    from logging.handlers import QueueHandler
+
+    _set_settings(
+        monkeypatch, LOG_FORMAT="json", LOG_FILE_ENABLED=False, LOG_QUEUE_ENABLED=True
+    )
+    LoggerFactory.get_logger("queued")
+
+    root = logging.getLogger()
+    assert len(root.handlers) == 1
+    assert isinstance(root.handlers[0], QueueHandler)
+    assert LoggerFactory._listener is not None
+
+
+def test_queue_disabled_attaches_handlers_directly(monkeypatch):
+    _set_settings(
+        monkeypatch, LOG_FORMAT="json", LOG_FILE_ENABLED=False, LOG_QUEUE_ENABLED=False
+    )
+    LoggerFactory.get_logger("direct")
+
+    root = logging.getLogger()
+    assert [type(h) for h in root.handlers] == [logging.StreamHandler]
+    assert LoggerFactory._listener is None
+
+
 def test_uvicorn_logs_propagate(monkeypatch):
     _set_settings(monkeypatch, LOG_FORMAT="json", LOG_FILE_ENABLED=False)
 
@@ -192,6 +235,29 @@ def test_jsonformatter_direct_format(record_factory):
     assert payload["stack"]
 
 
+def test_jsonformatter_extras_keep_order_and_non_str_keys(record_factory):
+    rec = record_factory(
+        name="unit.formatter",
+        level=logging.INFO,
+        fn="module.py",
+        lno=1,
+        msg="m",
+        args=(),
+        exc_info=None,
+    )
+    for key in ("zeta", "alpha", "mid"):
+        setattr(rec, key, key)
+    rec.counts = {1: 2}
+    rec._private = "hidden"
+
+    payload = json.loads(JsonFormatter().format(rec))
+
+    extras = [k for k in payload if k in ("zeta", "alpha", "mid", "counts")]
+    assert extras == ["zeta", "alpha", "mid", "counts"]
+    assert payload["counts"] == {"1": 2}
+    assert "_private" not in payload
+
+
 @pytest.fixture
 def record_factory():
     """
@@ -0,0 +1,185 @@
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from app.core.registry import RawAssetSpec, Registry
+from app.models.pivot import TextDoc
+from app.preprocessing.adapters import to_simdoc
+
+
+class FakeDB:
+    def __init__(self):
+        self.executed = []
+        self.executed_many = []
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def executemany(self, sql, rows):
+        self.executed_many.append((sql, list(rows)))
+
+    @contextmanager
+    def transaction(self):
+        yield FakeConn(self)
+
+
+class FakeConn:
+    def __init__(self, db):
+        self.db = db
+
+    @contextmanager
+    def cursor(self):
+        yield FakeCursor(self.db)
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+
+    def execute(self, sql, params=None):
+        self.db.executed.append((sql, params))
+
+    @contextmanager
+    def copy(self, sql):
+        rows = []
+        yield FakeCopy(rows)
+        self.db.executed.append((sql, rows))
+
+
+class FakeCopy:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class FakeS3:
+    def __init__(self):
+        self.uploads = []
+
+        self.keys = 0
+
+    def make_key(self, prefix, filename=None):
+        self.keys += 1
+        return f"{prefix}/{self.keys}"
+
+    def upload_file(self, local_path, key):
+        self.uploads.append((str(local_path), key))
+        return f"s3://bucket/{key}"
+
+    def upload_many(self, items, *, max_workers=8):
+        return [self.upload_file(p, k) for p, k in items]
+
+
+def test_record_raw_single_insert(tmp_path):
+    p = tmp_path / "raw.json"
+    p.write_text("{}", encoding="utf-8")
+    db, s3 = FakeDB(), FakeS3()
+
+    uri = Registry(db, s3).record_raw(
+        run_id=None, source="text", source_id="q", local_path=str(p)
+    )
+
+    assert uri.startswith("s3://bucket/raw/text/")
+    assert len(db.executed) == 1
+    row = db.executed[0][1]
+    assert isinstance(row[0], uuid.UUID)
+    assert row[2:6] == ("text", "q", uri, 2)
+
+
+def test_record_raw_many_batches_one_insert(tmp_path):
+    specs = []
+    for i in range(3):
+        p = tmp_path / f"raw_{i}.json"
+        p.write_text("x" * (i + 1), encoding="utf-8")
+        specs.append(RawAssetSpec(source="simulation", local_path=str(p)))
+    db, s3 = FakeDB(), FakeS3()
+
+    uris = Registry(db, s3).record_raw_many(specs)
+
+    assert len(uris) == 3 and len(s3.uploads) == 3
+    assert len(set(uris)) == 3
+    assert db.executed == []
+    ((sql, rows),) = db.executed_many
+    assert "INSERT INTO raw_assets" in sql
+    assert [r[5] for r in rows] == [1, 2, 3]
+    assert [r[4] for r in rows] == uris
+
+
+def test_record_raw_many_empty_is_noop():
+    db = FakeDB()
+    assert Registry(db, FakeS3()).record_raw_many([]) == []
+    assert db.executed == [] and db.executed_many == []
+
+
+def test_doc_row_reads_material_hash_from_model():
+    doc = to_simdoc({"material_id": "mp-1", "formula": "SiO2", "band_gap": 1.0})
+    row = Registry._doc_row(doc, "s3://b/k")
+    assert row[1] == "simulation"
+    assert row[4] == doc.material.material_hash
+    assert row[6] == doc.method
+
+
+def test_doc_row_from_model_and_mapping():
+    uid = str(uuid.uuid4())
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    doc = TextDoc(uid=uid, source="europepmc", created_at=now, text="t", year=2024)
+
+    row = Registry._doc_row(doc, "s3://b/k")
+    assert row[0] == uuid.UUID(uid)
+    assert row[1:3] == ("text", "europepmc")
+    assert row[5] == 2024 and row[7] == "s3://b/k" and row[8] == now
+    assert row[9] == doc.model_dump_json()
+
+    mapping = {
+        "uid": uid,
+        "kind": "simulation",
+        "source": "mp",
+        "material": {"material_hash": "abc"},
+        "created_at": now,
+    }
+    row = Registry._doc_row(mapping, "s3://b/k")
+    assert row[4] == "abc"
+    assert '"created_at":"2024-01-01T00:00:00+00:00"' in row[9]
+
+
+def _text_doc(i):
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return TextDoc(
+        uid=str(uuid.uuid4()), source="europepmc", created_at=now, text=f"t{i}"
+    )
+
+
+def test_record_docs_stages_copies_then_merges(tmp_path):
+    p = tmp_path / "std.jsonl"
+    p.write_text("", encoding="utf-8")
+    db = FakeDB()
+    docs = [_text_doc(i) for i in range(3)]
+    version = Registry.documents_version
+
+    uri = Registry(db, FakeS3()).record_docs(iter(docs), local_jsonl=str(p))
+
+    assert uri == "s3://bucket/standardized/1"
+    (create, _), (copy_sql, rows), (insert, _) = db.executed
+    assert create.startswith("CREATE TEMP TABLE documents_stage")
+    assert create.endswith("ON COMMIT DROP")
+    assert copy_sql.startswith("COPY documents_stage (")
+    assert copy_sql.endswith("FROM STDIN")
+    assert rows == [Registry._doc_row(d, uri) for d in docs]
+    assert insert.startswith("INSERT INTO documents (")
+    assert "FROM documents_stage" in insert and "ON CONFLICT (id) DO NOTHING" in insert
+    assert Registry.documents_version == version + 1
+
+
+def test_record_docs_empty_skips_merge(tmp_path):
+    p = tmp_path / "std.jsonl"
+    p.write_text("", encoding="utf-8")
+    db = FakeDB()
+    version = Registry.documents_version
+
+    Registry(db, FakeS3()).record_docs(iter(()), local_jsonl=str(p))
+
+    assert [sql.split(" ", 1)[0] for sql, _ in db.executed] == ["CREATE", "COPY"]
+    assert db.executed[1][1] == []
+    assert Registry.documents_version == version
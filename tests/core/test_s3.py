@@ -0,0 +1,24 @@
+from app.core.s3 import S3Client
+
+
+def test_upload_file_uses_multipart_transfer_config(mocker):
+    client = S3Client(bucket="b", endpoint_url="http://localhost:9")
+    s3 = mocker.patch.object(client, "_s3")
+
+    uri = client.upload_file("/tmp/x.parquet", "emb/x.parquet")
+
+    assert uri == "s3://b/emb/x.parquet"
+    cfg = s3.upload_file.call_args.kwargs["Config"]
+    assert cfg.multipart_threshold == 8 * 1024 * 1024
+    assert cfg.max_concurrency == 16
+
+
+def test_upload_many_keeps_input_order(mocker):
+    client = S3Client(bucket="b", endpoint_url="http://localhost:9")
+    s3 = mocker.patch.object(client, "_s3")
+    items = [(f"/tmp/p{i}", f"k{i}") for i in range(5)]
+
+    uris = client.upload_many(items, max_workers=3)
+
+    assert uris == [f"s3://b/k{i}" for i in range(5)]
+    assert s3.upload_file.call_count == 5
@@ -0,0 +1,68 @@
+import json
+
+import orjson
+import pytest
+
+
+def _write(path, items):
+    path.write_text("\n".join(json.dumps(x) for x in items), encoding="utf-8")
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])  # overlapped writer / process pool
+def test_run_shards_writes_manifest_in_order(
+    tmp_path, monkeypatch, capsys, num_workers
+):
+    monkeypatch.chdir(tmp_path)
+    shards = []
+    for i in range(3):
+        p = tmp_path / f"s{i}.jsonl"
+        docs = [
+            {"uid": f"s{i}-{j}", "kind": "simulation", "material": {"elements": ["O"]}}
+            for j in range(i + 1)
+        ]
+        if i == 1:
+            docs = [{"uid": "t", "kind": "text"}]
+        _write(p, docs)
+        shards.append(str(p))
+
+    from app.embedding.build_sim import run
+
+    run(shards, part_prefix="part", num_workers=num_workers)
+
+    model_dir = tmp_path / "data" / "embeddings" / "simulation" / "element-hist-20"
+    man = orjson.loads((model_dir / "manifest.json").read_bytes())
+    assert [(p["part"], p["count"]) for p in man["parts"]] == [
+        ("part-000", 1),
+        ("part-002", 3),
+    ]
+    assert sorted(f.stem for f in model_dir.glob("part-*")) == ["part-000", "part-002"]
+
+    out = capsys.readouterr().out
+    assert "[skip] no simulation docs" in out
+    assert out.count("Saved:") == 2
+
+
+def test_pool_worker_engines_cap_torch_threads(monkeypatch):
+    import sys
+    import types
+
+    from app.embedding import build
+
+    calls = []
+    fake_torch = types.SimpleNamespace(set_num_threads=calls.append)
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setattr(build, "_engines", {})
+    monkeypatch.setattr(build, "_worker_threads", None)
+    monkeypatch.setenv("OMP_NUM_THREADS", "")
+
+    class Engine:
+        def __init__(self, **kw):
+            self.kw = kw
+
+    build._get_engine(Engine, {}, None)
+    assert calls == []  # serial path: torch left alone
+
+    build._engines.clear()
+    build._init_worker(3)
+    build._get_engine(Engine, {}, None)
+    assert calls == [3]
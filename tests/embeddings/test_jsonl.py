@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pytest
+
+from app.embedding.jsonl import embed_jsonl, iter_jsonl
+
+
+class CountingEngine:
+    name = "counting"
+    modality = "simulation"
+    dim = 2
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def embed_batch(self, items):
+        items = list(items)
+        self.batch_sizes.append(len(items))
+        return np.ones((len(items), self.dim), dtype=np.float32)
+
+
+def _write(path, items):
+    path.write_text("\n\n".join(json.dumps(x) for x in items) + "\n", encoding="utf-8")
+
+
+def test_iter_jsonl_skips_blank_lines(tmp_path):
+    p = tmp_path / "x.jsonl"
+    _write(p, [{"uid": "a"}, {"uid": "b"}])
+    assert [d["uid"] for d in iter_jsonl(p)] == ["a", "b"]
+
+
+def test_iter_jsonl_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        next(iter_jsonl(tmp_path / "nope.jsonl"))
+
+
+def test_embed_jsonl_batches_and_filters_kind(tmp_path):
+    p = tmp_path / "x.jsonl"
+    items = [
+        {"uid": f"d{i}", "kind": "simulation" if i % 2 else "text"} for i in range(7)
+    ]
+    _write(p, items)
+    engine = CountingEngine()
+
+    ids, vecs, seen = embed_jsonl(engine, p, kind="simulation", batch_size=3)
+
+    assert seen == 7
+    assert ids == ["d1", "d3", "d5"]
+    assert vecs.shape == (3, 2)
+    assert engine.batch_sizes == [1, 2]
+
+
+def test_embed_jsonl_no_match_returns_empty_matrix(tmp_path):
+    p = tmp_path / "x.jsonl"
+    _write(p, [{"uid": "a", "kind": "text"}])
+
+    ids, vecs, seen = embed_jsonl(CountingEngine(), p, kind="simulation")
+
+    assert (ids, seen) == ([], 1)
+    assert vecs.shape == (0, 2)
+
+
+def test_embed_jsonl_single_batch_returns_engine_output(tmp_path):
+    p = tmp_path / "x.jsonl"
+    _write(p, [{"uid": "a"}, {"uid": "b"}])
+    out = np.zeros((2, 2), dtype=np.float32)
+    engine = CountingEngine()
+    engine.embed_batch = lambda items: out
+
+    ids, vecs, seen = embed_jsonl(engine, p)
+
+    assert (ids, seen) == (["a", "b"], 2)
+    assert vecs is out
@@ -1,5 +1,5 @@
 import numpy as np
-from app.embedding.sim_simple import SimpleMaterialFingerprint
+from app.embedding.sim_simple import ELEMENTS, SimpleMaterialFingerprint
 from app.embedding.ts_simple import SimpleTimeseriesEmbedding
 
 
@@ -21,6 +21,15 @@ def test_simple_material_fingerprint_histogram_normalized():
     assert eng.modality == "simulation"
 
 
+def test_simple_material_fingerprint_counts_unknown_elements_in_total():
+    eng = SimpleMaterialFingerprint()
+    vecs = eng.embed_batch([{"material": {"elements": ["Fe", "O", "O", "H"]}}])
+
+    assert vecs[0, ELEMENTS.index("O")] == 0.5
+    assert vecs[0, ELEMENTS.index("H")] == 0.25
+    assert np.isclose(vecs[0].sum(), 0.75)
+
+
 def test_simple_timeseries_embedding_shapes_and_values():
     eng = SimpleTimeseriesEmbedding(fft_bins=8)
     docs = [
@@ -39,3 +48,45 @@ def test_simple_timeseries_embedding_shapes_and_values():
     assert s >= 0.0
     assert float(vecs[1].sum()) == 0.0
     assert eng.modality == "timeseries"
+
+
+def test_simple_timeseries_embedding_columnar_matches_point_list():
+    eng = SimpleTimeseriesEmbedding(fft_bins=4)
+    points = {"values": [{"t": 0, "v": 1.0}, {"t": 1, "v": 2.0}, {"t": 2, "v": 1.5}]}
+    columns = {"t": [0.0, 1.0, 2.0], "v": [1.0, 2.0, 1.5]}
+    vecs = eng.embed_batch([points, columns])
+    assert np.allclose(vecs[0], vecs[1])
+
+
+def test_simple_timeseries_embedding_rows_independent_of_batch():
+    eng = SimpleTimeseriesEmbedding(fft_bins=4)
+    short = {"values": [{"v": 1.0}, {"v": 3.0}]}
+    long = {"values": [{"v": float(i % 3)} for i in range(20)]}
+
+    batch = eng.embed_batch([short, long, short])
+
+    assert np.allclose(batch[0], eng.embed_batch([short])[0])
+    assert np.allclose(batch[1], eng.embed_batch([long])[0])
+    assert np.allclose(batch[0], batch[2])
+
+
+def test_simple_timeseries_embedding_numba_matches_numpy(monkeypatch):
+    import app.embedding.ts_simple as ts_mod
+
+    if ts_mod.numba is None:
+        import pytest
+
+        pytest.skip("numba not installed")
+
+    rng = np.random.default_rng(0)
+    docs = [
+        {"values": [{"v": float(x)} for x in rng.random(n) * 10]}
+        for n in (0, 1, 3, 17, 40, 40, 200)
+    ]
+    eng = SimpleTimeseriesEmbedding(fft_bins=8)
+    jit = eng.embed_batch(docs)
+
+    monkeypatch.setattr(ts_mod, "numba", None)
+    ref = eng.embed_batch(docs)
+
+    assert np.allclose(jit, ref, rtol=1e-4, atol=1e-4)
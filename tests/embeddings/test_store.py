@@ -1,5 +1,6 @@
 import json
 import numpy as np
+import orjson
 
 
 def test_embedding_store_saves_npz_and_manifest(tmp_path):
@@ -22,8 +23,8 @@ def test_embedding_store_saves_npz_and_manifest(tmp_path):
     assert out.exists()
     assert out.suffix == ".npz"
 
-    data = np.load(out, allow_pickle=True)
-    assert list(data["ids"]) == ids
+    data = np.load(out)  # ids are UTF-8 bytes, no pickle needed
+    assert [b.decode("utf-8") for b in data["ids"]] == ids
     assert data["vecs"].shape == (3, 5)
 
     man = out.parent / "manifest.json"
@@ -34,3 +35,192 @@ def test_embedding_store_saves_npz_and_manifest(tmp_path):
     assert m["parts"][0]["part"] == "part-000"
     assert m["parts"][0]["count"] == 3
     assert m["parts"][0]["dim"] == 5
+
+
+def test_embedding_store_parquet_uses_fixed_size_list_row_groups(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from app.embedding.store import EmbeddingStore
+
+    store = EmbeddingStore(root=tmp_path / "emb")
+    vecs = np.arange(10 * 4, dtype=np.float32).reshape(10, 4)
+    out = store.save_part(
+        kind="text",
+        model="mini",
+        part="part-000",
+        doc_ids=[f"u{i}" for i in range(10)],
+        vectors=vecs,
+        fmt="parquet",
+    )
+    store._write_parquet(out, [f"u{i}" for i in range(10)], vecs, row_group_size=4)
+
+    f = pq.ParquetFile(out)
+    assert f.metadata.num_row_groups == 3
+    assert f.schema_arrow.field("vector").type == pa.list_(pa.float32(), 4)
+    table = f.read()
+    assert np.array_equal(np.stack(table["vector"].to_pylist()), vecs)
+
+
+def test_embedding_store_zst_round_trip(tmp_path):
+    from app.embedding.store import EmbeddingStore
+    from app.indexing.faiss_index import load_embeddings_dir
+
+    store = EmbeddingStore(root=tmp_path / "emb")
+    vecs = np.random.default_rng(0).random((6, 3), dtype=np.float32)
+    out = store.save_part(
+        kind="text",
+        model="mini",
+        part="part-000",
+        doc_ids=[f"u{i}" for i in range(6)],
+        vectors=vecs,
+        fmt="zst",
+    )
+    assert out.suffix == ".zst"
+
+    ids, loaded = load_embeddings_dir(str(tmp_path / "emb"), "text", "mini")
+    assert list(ids) == [f"u{i}" for i in range(6)]
+    assert loaded.dtype == np.float32
+    assert np.array_equal(loaded, vecs)
+
+
+def test_embedding_store_npy_parts_are_memory_mapped(tmp_path):
+    from app.embedding.store import EmbeddingStore
+    from app.indexing.faiss_index import _load_part, load_embeddings_dir
+
+    store = EmbeddingStore(root=tmp_path / "emb")
+    vecs = np.random.default_rng(1).random((4, 3), dtype=np.float32)
+    ids = [f"u{i}" for i in range(4)]
+    out = store.save_part(
+        kind="text", model="mini", part="p0", doc_ids=ids, vectors=vecs, fmt="npy"
+    )
+    assert out.name == "p0.vecs.npy"
+    assert (out.parent / "p0.ids.npy").exists()
+
+    part_ids, part_vecs = _load_part(out)
+    assert isinstance(part_vecs, np.memmap)
+    assert list(part_ids) == ids
+
+    loaded_ids, loaded = load_embeddings_dir(str(tmp_path / "emb"), "text", "mini")
+    assert list(loaded_ids) == ids
+    assert np.array_equal(loaded, vecs)
+
+
+def test_embedding_store_float16_parts_load_as_float32(tmp_path):
+    import pytest
+
+    from app.embedding.store import EmbeddingStore
+    from app.indexing.faiss_index import load_embeddings_dir
+
+    pytest.importorskip("zstandard")
+    store = EmbeddingStore(root=tmp_path / "emb")
+    vecs = np.random.default_rng(1).random((4, 6), dtype=np.float32)
+    for i, fmt in enumerate(("npz", "parquet", "zst")):
+        store.save_part(
+            kind="text",
+            model="mini",
+            part=f"part-{i:03d}",
+            doc_ids=[f"{fmt}{j}" for j in range(4)],
+            vectors=vecs,
+            fmt=fmt,
+            dtype="float16",
+        )
+
+    man = json.loads((tmp_path / "emb" / "text" / "mini" / "manifest.json").read_text())
+    assert {p["dtype"] for p in man["parts"]} == {"float16"}
+
+    ids, loaded = load_embeddings_dir(str(tmp_path / "emb"), "text", "mini")
+    assert loaded.dtype == np.float32 and loaded.shape == (12, 6)
+    assert np.allclose(loaded, np.vstack([vecs] * 3), atol=1e-3)
+
+
+def test_embedding_store_int8_parts_dequantize_with_manifest_scale(tmp_path):
+    import pytest
+
+    from app.embedding.store import EmbeddingStore, int8_scale
+    from app.indexing.faiss_index import load_embeddings_dir
+
+    pytest.importorskip("zstandard")
+    store = EmbeddingStore(root=tmp_path / "emb")
+    vecs = np.random.default_rng(2).standard_normal((5, 8)).astype(np.float32)
+    for i, fmt in enumerate(("npz", "parquet", "zst", "npy")):
+        store.save_part(
+            kind="text",
+            model="mini",
+            part=f"part-{i:03d}",
+            doc_ids=[f"{fmt}{j}" for j in range(5)],
+            vectors=vecs,
+            fmt=fmt,
+            dtype="int8",
+        )
+
+    man = json.loads((tmp_path / "emb" / "text" / "mini" / "manifest.json").read_text())
+    assert {p["dtype"] for p in man["parts"]} == {"int8"}
+    assert man["parts"][0]["scale"] == pytest.approx(int8_scale(vecs))
+
+    _, loaded = load_embeddings_dir(str(tmp_path / "emb"), "text", "mini")
+    assert loaded.dtype == np.float32 and loaded.shape == (20, 8)
+    assert np.allclose(loaded, np.vstack([vecs] * 4), atol=int8_scale(vecs) / 2 + 1e-6)
+
+
+def test_embedding_store_manifest_log_and_atomic_finalize(tmp_path):
+    from app.embedding.store import EmbeddingStore
+
+    store = EmbeddingStore(root=tmp_path / "emb")
+    d = tmp_path / "emb" / "text" / "mini"
+    d.mkdir(parents=True)
+    legacy = {"kind": "text", "model": "mini", "parts": [{"part": "old", "count": 1}]}
+    (d / "manifest.json").write_text(json.dumps(legacy))
+
+    for part, count in (("p0", 2), ("p1", 3), ("p0", 5)):
+        store.add_to_manifest(kind="text", model="mini", part=part, count=count, dim=4)
+
+    assert len((d / "manifest.jsonl").read_text().splitlines()) == 4
+    assert json.loads((d / "manifest.json").read_text()) == legacy
+
+    store.finalize_manifest(kind="text", model="mini")
+
+    m = json.loads((d / "manifest.json").read_text())
+    assert [(p["part"], p["count"]) for p in m["parts"]] == [
+        ("old", 1),
+        ("p0", 5),
+        ("p1", 3),
+    ]
+    assert not list(d.glob("*.tmp"))
+
+
+def test_embedding_store_manifest_cache_tracks_other_writers(tmp_path, mocker):
+    from app.embedding.store import EmbeddingStore
+
+    a = EmbeddingStore(root=tmp_path / "emb")
+    b = EmbeddingStore(root=tmp_path / "emb")
+    vecs = np.ones((1, 2), dtype=np.float32)
+    save = dict(kind="text", model="m", doc_ids=["x"], vectors=vecs, fmt="npz")
+
+    a.save_part(part="p0", **save)
+    a.save_part(part="p1", **save)
+    read = mocker.spy(orjson, "loads")
+    a.save_part(part="p2", **save)  # folded from the cache, log not re-read
+    assert read.call_count == 0
+
+    b.save_part(part="p3", **save)  # another writer appends to the log
+    a.save_part(part="p0", **save)  # size mismatch: a re-reads, keeps p3
+    man = json.loads((tmp_path / "emb" / "text" / "m" / "manifest.json").read_text())
+    assert [p["part"] for p in man["parts"]] == ["p0", "p1", "p2", "p3"]
+
+
+def test_load_part_reads_utf8_and_legacy_object_ids(tmp_path):
+    from app.embedding.store import EmbeddingStore
+    from app.indexing.faiss_index import _load_part
+
+    store = EmbeddingStore(root=tmp_path)
+    vecs = np.ones((2, 3), dtype=np.float32)
+    new = tmp_path / "new.npz"
+    store._write_npz(new, ["a", "é-1"], vecs)
+    legacy = tmp_path / "legacy.npz"
+    np.savez_compressed(legacy, ids=np.array(["a", "é-1"], dtype=object), vecs=vecs)
+
+    for path in (new, legacy):
+        ids, loaded = _load_part(path)
+        assert list(ids) == ["a", "é-1"] and ids.dtype == object
+        assert loaded.shape == (2, 3)
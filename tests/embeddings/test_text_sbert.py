@@ -19,3 +19,74 @@ def test_sbert_text_engine_mocked(mocker):
     assert np.allclose(vecs[0], 1.0)
     assert eng.modality == "text"
     assert isinstance(eng.dim, int) and eng.dim == 384
+
+
+def test_sbert_text_engine_falls_back_to_torch_backend(mocker):
+    fake = types.SimpleNamespace(
+        get_sentence_embedding_dimension=lambda: 8,
+        encode=lambda texts, **kw: np.ones((len(texts), 8), dtype=np.float32),
+    )
+
+    def _st(name, device=None, **kw):
+        if kw.get("backend") == "onnx":
+            raise ImportError("optimum not installed")
+        return fake
+
+    st = mocker.patch("sentence_transformers.SentenceTransformer", side_effect=_st)
+
+    from app.embedding.text_sbert import SbertTextEngine
+
+    eng = SbertTextEngine(backend="onnx", model_file="onnx/model_qint8.onnx")
+
+    assert eng.model is fake and eng.dim == 8
+    assert st.call_args_list[0].kwargs["model_kwargs"] == {
+        "file_name": "onnx/model_qint8.onnx"
+    }
+    assert "backend" not in st.call_args_list[1].kwargs
+
+
+def test_sbert_text_engine_avoids_copy_and_forwards_batch_size(mocker):
+    out = np.ones((2, 4), dtype=np.float32)
+    seen = {}
+
+    def _encode(texts, **kw):
+        seen.update(kw)
+        return out
+
+    fake = types.SimpleNamespace(
+        get_sentence_embedding_dimension=lambda: 4, encode=_encode
+    )
+    mocker.patch("sentence_transformers.SentenceTransformer", return_value=fake)
+
+    from app.embedding.text_sbert import SbertTextEngine
+
+    eng = SbertTextEngine(batch_size=8)
+    vecs = eng.embed_batch([{"text": "a"}, {"text": "b"}])
+
+    assert vecs is out
+    assert seen["batch_size"] == 8
+
+
+def test_batch_size_defaults_to_setting(mocker):
+    fake = types.SimpleNamespace(get_sentence_embedding_dimension=lambda: 4)
+    mocker.patch("sentence_transformers.SentenceTransformer", return_value=fake)
+    mocker.patch("app.embedding.text_sbert.settings.TEXT_BATCH_SIZE", 512)
+
+    from app.embedding.text_sbert import SbertTextEngine
+
+    assert SbertTextEngine().batch_size == 512
+
+
+def test_output_dtype_float16(mocker):
+    fake = types.SimpleNamespace(
+        get_sentence_embedding_dimension=lambda: 4,
+        encode=lambda texts, **kw: np.full((len(texts), 4), 0.5, dtype=np.float32),
+    )
+    mocker.patch("sentence_transformers.SentenceTransformer", return_value=fake)
+
+    from app.embedding.text_sbert import SbertTextEngine
+
+    eng = SbertTextEngine(output_dtype="float16")
+    vecs = eng.embed_batch([{"text": "a"}, {"text": "b"}])
+    assert vecs.dtype == np.float16 and vecs.shape == (2, 4)
+    assert eng.embed_batch([]).dtype == np.float16
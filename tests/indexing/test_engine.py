@@ -0,0 +1,122 @@
+import types
+
+import numpy as np
+import pytest
+
+from app.indexing import engine as engine_mod
+
+
+def test_encode_text_query_loads_model_once(mocker):
+    fake = types.SimpleNamespace(
+        get_sentence_embedding_dimension=lambda: 8,
+        encode=lambda texts, **kw: np.ones((len(texts), 8), dtype=np.float32),
+    )
+    st = mocker.patch("sentence_transformers.SentenceTransformer", return_value=fake)
+    engine_mod._get_text_engine.cache_clear()
+
+    name1, v1 = engine_mod._encode_text_query("hello", None)
+    name2, v2 = engine_mod._encode_text_query("world", engine_mod.DEFAULT_TEXT_MODEL)
+
+    assert name1 == name2 == engine_mod.DEFAULT_TEXT_MODEL
+    assert v1.shape == v2.shape == (8,)
+    assert st.call_count == 1
+    engine_mod._get_text_engine.cache_clear()
+
+
+def test_faiss_backend_search_many_batches_queries():
+    faiss = pytest.importorskip("faiss")
+    vecs = np.eye(4, dtype=np.float32)
+    index = faiss.IndexFlatIP(4)
+    index.add(vecs)
+
+    backend = engine_mod.FaissSearchBackend.__new__(engine_mod.FaissSearchBackend)
+    backend.index, backend.ids = index, np.array(["a", "b", "c", "d"], dtype=object)
+
+    idxs, scores = backend.search_many(vecs[[2, 0]], top_k=1)
+    assert idxs.shape == (2, 1) and list(idxs[:, 0]) == [2, 0]
+
+    idx, score = backend.search(vecs[3], top_k=2)
+    assert idx[0] == 3 and np.isclose(score[0], 1.0)
+
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def fetchall(self, sql, params=None):
+        self.calls.append((sql, params))
+        return self.rows
+
+
+def test_fetch_metadata_uses_pooled_db_and_string_ids(mocker):
+    import uuid
+
+    uid = uuid.UUID("00000000-0000-0000-0000-000000000001")
+    row = {
+        "id": uid,
+        "kind": "text",
+        "source": "s",
+        "source_id": "x",
+        "year": 2020,
+        "method": "DFT",
+        "title": "t",
+    }
+    db = FakeDB([row])
+    mocker.patch.object(engine_mod, "get_db", return_value=db)
+
+    out = engine_mod._fetch_metadata([str(uid)], {"year_from": 2000, "method": "DFT"})
+
+    assert out[str(uid)]["doc_id"] == str(uid)
+    assert out[str(uid)]["method"] == "DFT"
+    sql, params = db.calls[0]
+    assert "ANY(%s::uuid[])" in sql
+    assert params == [[str(uid)], 2000, "DFT"]
+
+
+def test_fetch_metadata_empty_ids_skips_db(mocker):
+    get_db = mocker.patch.object(engine_mod, "get_db")
+    assert engine_mod._fetch_metadata([]) == {}
+    get_db.assert_not_called()
+
+
+def _cached_engine(mocker):
+    from app.indexing.schemas import SearchRequest
+
+    eng = engine_mod.HybridSearchEngine()
+    backend = mocker.Mock(ids=np.array(["a", "b"], dtype=object))
+    backend.search.return_value = (np.array([0, 1]), np.array([0.9, 0.5]))
+    mocker.patch.object(eng, "_get_backend", return_value=backend)
+    encode = mocker.patch.object(
+        engine_mod, "_encode_text_query", return_value=("m", np.ones(4))
+    )
+    fetch = mocker.patch.object(
+        engine_mod,
+        "_fetch_metadata",
+        return_value={"a": {"title": "A"}, "b": {"title": "B"}},
+    )
+    return eng, encode, fetch, SearchRequest
+
+
+def test_search_caches_responses_and_query_vectors(mocker):
+    eng, encode, fetch, SearchRequest = _cached_engine(mocker)
+
+    first = eng.search(SearchRequest(kind="text", query="q"))
+    again = eng.search(SearchRequest(kind="text", query="q"))
+    paged = eng.search(SearchRequest(kind="text", query="q", size=1))
+
+    assert again is first
+    assert [h.doc_id for h in paged.items] == ["a"]
+    assert encode.call_count == 1
+    assert fetch.call_count == 2
+
+
+def test_search_cache_invalidated_by_new_documents(mocker):
+    eng, _, fetch, SearchRequest = _cached_engine(mocker)
+    mocker.patch.object(engine_mod.Registry, "documents_version", 0)
+
+    eng.search(SearchRequest(kind="text", query="q"))
+    engine_mod.Registry.documents_version += 1
+    eng.search(SearchRequest(kind="text", query="q"))
+
+    assert fetch.call_count == 2
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from app.indexing.faiss_index import _pq_subquantizers, build_faiss_index  # noqa: E402
+
+
+def _vecs(n, d, seed=0):
+    v = np.random.default_rng(seed).random((n, d), dtype=np.float32)
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+def test_build_faiss_index_auto_is_flat_for_small_n():
+    index = build_faiss_index(_vecs(100, 8))
+    assert isinstance(index, faiss.IndexFlatIP)
+    assert index.ntotal == 100
+
+
+def test_build_faiss_index_hnsw_finds_exact_match():
+    vecs = _vecs(500, 16)
+    index = build_faiss_index(vecs, index_type="hnsw")
+
+    assert isinstance(index, faiss.IndexHNSWFlat)
+    assert index.metric_type == faiss.METRIC_INNER_PRODUCT
+    _, idx = index.search(vecs[42:43], 1)
+    assert idx[0, 0] == 42
+
+
+def test_build_faiss_index_ivfpq_trains_and_sets_nprobe():
+    index = build_faiss_index(_vecs(3000, 16), metric="l2", index_type="ivfpq")
+
+    assert isinstance(index, faiss.IndexIVFPQ)
+    assert index.is_trained and index.ntotal == 3000
+    assert index.nprobe == 16
+
+
+def test_build_faiss_index_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        build_faiss_index(_vecs(10, 4), index_type="lsh")
+
+
+def test_pq_subquantizers_divides_dim():
+    assert _pq_subquantizers(384) == 96
+    assert 20 % _pq_subquantizers(20) == 0
+
+
+def test_load_embeddings_dir_fills_preallocated_output(tmp_path):
+    from app.embedding.store import EmbeddingStore
+    from app.indexing.faiss_index import load_embeddings_dir
+
+    store = EmbeddingStore(root=tmp_path)
+    a, b = _vecs(3, 4, seed=1), _vecs(5, 4, seed=2)
+    for part, vecs, fmt in (("p0", a, "npz"), ("p1", b, "parquet")):
+        ids = [f"{part}-{i}" for i in range(len(vecs))]
+        store.save_part(
+            kind="text", model="m", part=part, doc_ids=ids, vectors=vecs, fmt=fmt
+        )
+
+    ids, vecs = load_embeddings_dir(str(tmp_path), "text", "m")
+
+    assert vecs.dtype == np.float32 and vecs.flags.c_contiguous
+    assert np.array_equal(vecs, np.vstack([a, b]))
+    assert list(ids[:1]) + list(ids[-1:]) == ["p0-0", "p1-4"]
+
+
+def test_load_embeddings_dir_rejects_manifest_mismatch(tmp_path):
+    import orjson
+
+    from app.embedding.store import EmbeddingStore
+    from app.indexing.faiss_index import load_embeddings_dir
+
+    store = EmbeddingStore(root=tmp_path)
+    store.save_part(
+        kind="text", model="m", part="p0", doc_ids=["x"], vectors=_vecs(1, 4)
+    )
+    man = tmp_path / "text" / "m" / "manifest.json"
+    data = orjson.loads(man.read_bytes())
+    data["parts"][0]["count"] = 2
+    man.write_bytes(orjson.dumps(data))
+
+    with pytest.raises(ValueError):
+        load_embeddings_dir(str(tmp_path), "text", "m")
+
+
+@pytest.mark.parametrize("index_type", ["sq_fp16", "sq8"])
+def test_build_faiss_index_scalar_quantized(index_type):
+    vecs = _vecs(300, 16)
+    index = build_faiss_index(vecs, index_type=index_type)
+
+    assert isinstance(index, faiss.IndexScalarQuantizer)
+    assert index.metric_type == faiss.METRIC_INNER_PRODUCT
+    _, idx = index.search(vecs[7:8], 1)
+    assert idx[0, 0] == 7
+
+
+def test_load_part_parquet_fixed_size_and_legacy_lists(tmp_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from app.indexing.faiss_index import _load_part
+
+    vecs = _vecs(5, 3)
+    fixed = pa.FixedSizeListArray.from_arrays(pa.array(vecs.ravel()), 3)
+    legacy = pa.array(vecs.astype(np.float64).tolist())
+    for name, col in (("fixed", fixed), ("legacy", legacy)):
+        path = tmp_path / f"{name}.parquet"
+        pq.write_table(
+            pa.table({"doc_id": [str(i) for i in range(5)], "vector": col}), path
+        )
+
+        ids, loaded = _load_part(path)
+        assert list(ids) == ["0", "1", "2", "3", "4"]
+        assert loaded.shape == (5, 3)
+        assert np.allclose(loaded, vecs)
@@ -2,11 +2,13 @@ import asyncio
 import json
 from pathlib import Path
 
+import httpx
 import pandas as pd
 import pytest
 import requests
 
 from app.ingestion.base import BaseIngestor
+from app.ingestion.http_client import get_session
 
 
 class DummyIngestor(BaseIngestor):
@@ -59,8 +61,9 @@ class FakeResp:
         self._payload = payload or {}
         self._exc = exc
 
-    def json(self):
-        return self._payload
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
 
     def raise_for_status(self):
         if self._exc:
@@ -78,6 +81,13 @@ def test_save_raw_writes_json_file(ing: DummyIngestor, tmp_path: Path, mock_logg
     mock_logger.info.assert_any_call("raw_saved", extra={"path": str(p)})
 
 
+def test_save_raw_compact_unless_pretty(ing: DummyIngestor):
+    raw = {"a": [1, 2]}
+    assert ing.save_raw(raw).read_bytes() == b'{"a":[1,2]}'
+    ing.pretty_raw = True
+    assert b"\n" in ing.save_raw(raw).read_bytes()
+
+
 def test_save_raw_writes_bytes_and_text(ing: DummyIngestor):
     p1 = ing.save_raw(b"hello", suffix="bin")
     assert p1.read_bytes() == b"hello"
@@ -85,6 +95,62 @@ def test_save_raw_writes_bytes_and_text(ing: DummyIngestor):
     assert p2.read_text(encoding="utf-8") == "bonjour"
 
 
+def test_save_raw_keeps_unicode_and_non_str_keys(ing: DummyIngestor):
+    p = ing.save_raw({"title": "Fe₂O₃", 3: "x"}, suffix="json")
+    assert "Fe₂O₃" in p.read_text(encoding="utf-8")
+    assert json.loads(p.read_bytes()) == {"title": "Fe₂O₃", "3": "x"}
+
+
+def test_write_standardized_mixed_docs(ing: DummyIngestor, mocker):
+    from pydantic import BaseModel
+
+    from app.ingestion import base
+
+    class Doc(BaseModel):
+        id: str
+
+    mocker.patch.object(base, "_WRITE_BATCH", 2)
+    docs = [{"id": "a", "v": 1}, Doc(id="b"), {"id": "c"}]
+    p = ing.write_standardized(docs)
+    lines = p.read_bytes().splitlines()
+    assert [json.loads(x)["id"] for x in lines] == ["a", "b", "c"]
+
+
+def test_to_records_matches_pandas(ing: DummyIngestor):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None], "c": [0.5, float("nan")]})
+    out = ing.to_records(df)
+    assert out[0] == {"a": 1, "b": "x", "c": 0.5}
+    assert type(out[0]["a"]) is int
+    assert out[1]["b"] is None and out[1]["c"] != out[1]["c"]
+    assert ing.to_records(pd.DataFrame()) == []
+
+
+def test_write_standardized_replays_generator_for_registry(ing: DummyIngestor, mocker):
+    registry = mocker.Mock()
+    seen = []
+    registry.record_docs.side_effect = lambda docs, local_jsonl: seen.extend(docs)
+    ing.registry = registry
+
+    ing.write_standardized(({"uid": str(i)} for i in range(3)))
+    assert seen == [{"uid": "0"}, {"uid": "1"}, {"uid": "2"}]
+
+
+def test_write_standardized_skips_empty_docs(ing: DummyIngestor, mocker):
+    ing.registry = mocker.Mock()
+    assert ing.write_standardized(iter([])) is None
+    assert ing.write_standardized([]) is None
+    assert not (ing.out_dir / ing.standardized_filename).exists()
+    ing.registry.record_docs.assert_not_called()
+
+
+def test_run_streams_lazy_standardize(mocker, ing: DummyIngestor):
+    mocker.patch.object(ing, "_save_table")
+    ing.standardize_fn = lambda records: ({"x": r["x"]} for r in records)
+    ing.run()
+    lines = (ing.out_dir / ing.standardized_filename).read_bytes().splitlines()
+    assert [json.loads(x)["x"] for x in lines] == [1, 2, 3]
+
+
 def test_save_table_csv_writes_file(ing: DummyIngestor, mock_logger):
     df = pd.DataFrame({"a": [1, 2]})
     p = ing._save_table(df, fmt="csv")
@@ -93,6 +159,16 @@ def test_save_table_csv_writes_file(ing: DummyIngestor, mock_logger):
     mock_logger.info.assert_any_call("table_saved", extra={"path": str(p), "rows": 2})
 
 
+def test_save_table_parquet_uses_zstd(ing: DummyIngestor):
+    import pyarrow.parquet as pq
+
+    df = pd.DataFrame({"a": [1, 2], "s": ["x", "x"]})
+    p = ing._save_table(df)
+    assert p.suffix == ".parquet"
+    assert pq.ParquetFile(p).metadata.row_group(0).column(1).compression == "ZSTD"
+    pd.testing.assert_frame_equal(pd.read_parquet(p), df)
+
+
 def test_run_pipeline_calls_fetch_parse_and_saves_table(mocker, ing: DummyIngestor):
     fake_path = ing.out_dir / "table.csv"
     mocker.patch.object(ing, "_save_table", return_value=fake_path)
@@ -103,6 +179,18 @@ def test_run_pipeline_calls_fetch_parse_and_saves_table(mocker, ing: DummyIngest
     assert ing.parse_calls == 1
 
 
+def test_run_skips_fetch_logs_when_info_disabled(
+    mocker, ing: DummyIngestor, mock_logger
+):
+    mocker.patch.object(ing, "_save_table")
+    brief = mocker.patch.object(DummyIngestor, "_brief")
+    mock_logger.isEnabledFor.return_value = False
+    ing.run(example=1)
+    brief.assert_not_called()
+    logged = [c.args[0] for c in mock_logger.info.call_args_list]
+    assert "start fetch" not in logged and "fetched" not in logged
+
+
 def test_run_async_pipeline_uses_threads(mocker, ing: DummyIngestor):
     fake_path = ing.out_dir / "table.csv"
     mocker.patch.object(ing, "_save_table", return_value=fake_path)
@@ -113,13 +201,31 @@ def test_run_async_pipeline_uses_threads(mocker, ing: DummyIngestor):
     assert ing.parse_calls == 1
 
 
+def test_run_async_writes_on_disk_executor(mocker, ing: DummyIngestor):
+    import threading
+
+    from app.ingestion import base
+
+    threads = {}
+    mocker.patch.object(
+        ing,
+        "_save_table",
+        side_effect=lambda df: threads.setdefault("table", threading.current_thread()),
+    )
+    asyncio.run(ing.run_async(example=1))
+    assert threads["table"].name.startswith("ingestor-disk")
+
+    base.shutdown_disk_executor()
+    assert base.get_disk_executor() is not None  # recreated lazily
+
+
 def test_http_get_json_retries_then_succeeds(mocker, ing: DummyIngestor):
     seq = [
         FakeResp(False, 500),
         FakeResp(False, 502),
         FakeResp(True, 200, {"ok": True}),
     ]
-    get = mocker.patch("app.ingestion.base.requests.get", side_effect=seq)
+    get = mocker.patch.object(get_session(), "get", side_effect=seq)
 
     out = ing.http_get_json(
         "http://example/api", params={"q": 1}, headers={"X": "a"}, retries=3, backoff=0
@@ -131,18 +237,103 @@ def test_http_get_json_retries_then_succeeds(mocker, ing: DummyIngestor):
 def test_http_get_json_raises_after_retries(mocker, ing: DummyIngestor):
     err = requests.HTTPError("upstream down")
     seq = [FakeResp(False, 500, exc=err)] * 3
-    get = mocker.patch("app.ingestion.base.requests.get", side_effect=seq)
+    get = mocker.patch.object(get_session(), "get", side_effect=seq)
 
     with pytest.raises(requests.HTTPError):
         ing.http_get_json("http://x", retries=3, backoff=0)
     assert get.call_count == 3
 
 
-def test_http_get_json_async_runs_in_thread(mocker, ing: DummyIngestor):
-    mock = mocker.patch.object(ing, "http_get_json", return_value={"ok": 1})
-    out = asyncio.run(ing.http_get_json_async("http://x"))
-    assert out == {"ok": 1}
-    mock.assert_called_once()
+def test_http_get_json_retries_connection_errors_without_final_sleep(
+    mocker, ing: DummyIngestor
+):
+    sleep = mocker.patch("app.ingestion.base.time.sleep")
+    seq = [requests.ConnectionError("reset"), FakeResp(True, 200, {"ok": 1})]
+    mocker.patch.object(get_session(), "get", side_effect=seq)
+    assert ing.http_get_json("http://x", retries=2, backoff=1) == {"ok": 1}
+    assert sleep.call_count == 1
+
+    mocker.patch.object(
+        get_session(), "get", side_effect=[requests.Timeout("slow")] * 2
+    )
+    with pytest.raises(requests.Timeout):
+        ing.http_get_json("http://x", retries=2, backoff=1)
+    assert sleep.call_count == 2
+
+
+def test_get_session_is_shared_and_pooled():
+    session = get_session()
+    assert get_session() is session
+    adapter = session.get_adapter("https://example.org")
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == 0
+
+
+def test_http_get_json_async_defaults_to_pooled_client(mocker, ing: DummyIngestor):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": 1}))
+    sync = mocker.patch.object(ing, "http_get_json")
+
+    async def go():
+        from app.ingestion import http_client
+
+        client = httpx.AsyncClient(transport=transport)
+        mocker.patch.object(http_client, "new_async_client", return_value=client)
+        out = await ing.http_get_json_async("http://x")
+        assert http_client.get_async_client() is client
+        await http_client.aclose_async_client()
+        return out
+
+    assert asyncio.run(go()) == {"ok": 1}
+    sync.assert_not_called()
+
+
+def test_http_get_json_async_uses_shared_client(ing: DummyIngestor):
+    statuses = iter([503, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["q"] == "1"
+        status = next(statuses)
+        return httpx.Response(status, json={"ok": status == 200})
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            ing.http_client = c
+            return await ing.http_get_json_async(
+                "http://x/api", params={"q": 1}, retries=3, backoff=0
+            )
+
+    assert asyncio.run(go()) == {"ok": True}
+
+
+def test_http_get_json_async_shared_client_raises_after_retries(ing: DummyIngestor):
+    transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+    async def go():
+        async with httpx.AsyncClient(transport=transport) as c:
+            ing.http_client = c
+            await ing.http_get_json_async("http://x/api", retries=2, backoff=0)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(go())
+
+
+def test_http_get_json_async_retries_transport_errors(mocker, ing: DummyIngestor):
+    sleep = mocker.patch("app.ingestion.base.asyncio.sleep", new=mocker.AsyncMock())
+    outcomes = iter([httpx.ConnectError("refused"), httpx.Response(200, json=[1])])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        out = next(outcomes)
+        if isinstance(out, Exception):
+            raise out
+        return out
+
+    async def go():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as c:
+            ing.http_client = c
+            return await ing.http_get_json_async("http://x", retries=2, backoff=1)
+
+    assert asyncio.run(go()) == [1]
+    assert sleep.await_count == 1
 
 
 def test_brief_variants():
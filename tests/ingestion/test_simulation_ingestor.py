@@ -127,3 +127,26 @@ def test_parse_empty_returns_empty_dataframe(mp_ingestor):
     df = mp_ingestor.parse({"data": []})
     assert isinstance(df, pd.DataFrame)
     assert df.empty
+
+
+def test_fetch_pages_async_gathers_in_order_with_cap(mocker, mp_ingestor):
+    mp_ingestor.page_concurrency = 2
+    active = peak = 0
+
+    async def fake_fetch(page, **kw):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return {
+            "data": [{"material_id": f"mp-{page}", "formula_pretty": kw["formula"]}]
+        }
+
+    mocker.patch.object(mp_ingestor, "fetch_async", side_effect=fake_fetch)
+    raws = asyncio.run(mp_ingestor.fetch_pages_async(pages=range(1, 6), formula="Si"))
+    assert peak == 2
+
+    df = mp_ingestor.parse_many(raws)
+    assert list(df["material_id"]) == [f"mp-{i}" for i in range(1, 6)]
+    assert set(df["formula"]) == {"Si"}
@@ -134,3 +134,27 @@ def test_parse_builds_dataframe_with_expected_columns(ing):
 def test_parse_empty_returns_empty_dataframe(ing):
     assert ing.parse({"resultList": {"result": []}}).empty
     assert ing.parse({}).empty
+
+
+def test_standardize_df_streams_textdocs(ing):
+    df = ing.parse(
+        {
+            "resultList": {
+                "result": [
+                    {
+                        "id": "1",
+                        "title": "A",
+                        "pubYear": "2020",
+                        "authorString": "X; Y",
+                    },
+                    {"id": "2", "title": "B"},
+                ]
+            }
+        }
+    )
+    docs = ing.standardize_df(df)
+    assert not isinstance(docs, list)
+    docs = list(docs)
+    assert [d.source_id for d in docs] == ["1", "2"]
+    assert docs[0].year == 2020 and docs[0].authors == ["X", "Y"]
+    assert ing.standardize_df(ing.parse({})) is None
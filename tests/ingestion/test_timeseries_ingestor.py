@@ -28,6 +28,21 @@ def test_fetch_missing_raises(ts: TimeSeriesIngestor, tmp_path: Path):
         ts.fetch(str(p))
 
 
+def test_prefetch_skips_per_file_exists(
+    monkeypatch, ts: TimeSeriesIngestor, tmp_path: Path
+):
+    a = tmp_path / "a.csv"
+    a.write_text("t,v\n0,1\n", encoding="utf-8")
+    missing = tmp_path / "b.csv"
+    ts.prefetch([str(a), str(missing), str(tmp_path / "nodir" / "c.csv")])
+
+    monkeypatch.setattr(Path, "exists", lambda self: False)
+    assert ts.fetch(str(a)) == str(a)
+    assert asyncio.run(ts.fetch_async(str(a))) == str(a)
+    with pytest.raises(FileNotFoundError):
+        ts.fetch(str(missing))
+
+
 def test_fetch_async_validates_path(ts: TimeSeriesIngestor, tmp_path: Path):
     p = tmp_path / "sig.json"
     p.write_text(json.dumps([{"t": 0, "v": 1}, {"t": 1, "v": 2}]), encoding="utf-8")
@@ -55,6 +70,108 @@ def test_parse_json_lines(ts: TimeSeriesIngestor, tmp_path: Path):
     assert df["v"].tolist() == [1, 2]
 
 
+def test_parse_json_array_falls_back_to_pandas(ts: TimeSeriesIngestor, tmp_path: Path):
+    p = tmp_path / "arr.json"
+    p.write_text(json.dumps([{"t": 0, "v": 1}, {"t": 1, "v": 2}]), encoding="utf-8")
+    df = ts.parse(str(p))
+    assert df["v"].tolist() == [1, 2]
+
+
+def test_parse_csv_without_pyarrow(monkeypatch, ts: TimeSeriesIngestor, tmp_path: Path):
+    from app.ingestion import timeseries_ingestor
+
+    monkeypatch.setattr(timeseries_ingestor, "pacsv", None)
+    p = tmp_path / "a.csv"
+    p.write_text("t,amp\n0,0.1\n1,0.2\n", encoding="utf-8")
+    assert ts.parse(str(p))["amp"].tolist() == [0.1, 0.2]
+
+
+def test_parse_large_json_lines_in_chunks(monkeypatch, tmp_path: Path):
+    from app.ingestion import timeseries_ingestor
+
+    monkeypatch.setattr(timeseries_ingestor, "pajson", None)
+    monkeypatch.setattr(timeseries_ingestor, "LARGE_JSON_BYTES", 0)
+    ts = TimeSeriesIngestor(out_dir=str(tmp_path), json_chunksize=2)
+    p = tmp_path / "big.json"
+    p.write_text(
+        "".join(f'{{"t":{i},"v":{i * 2}}}\n' for i in range(5)), encoding="utf-8"
+    )
+    df = ts.parse(str(p))
+    assert df["v"].tolist() == [0, 2, 4, 6, 8]
+    assert df.index.tolist() == list(range(5))
+    monkeypatch.setattr(timeseries_ingestor, "LARGE_JSON_BYTES", 1 << 30)
+    assert df.dtypes.equals(ts.parse(str(p)).dtypes)  # same dtypes either way
+
+
+def test_parse_low_memory_reads_piecewise(monkeypatch, tmp_path: Path):
+    from app.ingestion import timeseries_ingestor
+
+    monkeypatch.setattr(timeseries_ingestor, "LOW_MEMORY_BYTES", 0)
+    monkeypatch.setattr(timeseries_ingestor, "JSON_RANGE_BYTES", 16)
+    assert TimeSeriesIngestor(out_dir=str(tmp_path)).low_memory is False
+    ts = TimeSeriesIngestor(out_dir=str(tmp_path), csv_chunksize=2, low_memory=True)
+
+    c = tmp_path / "big.csv"
+    c.write_text(
+        "t,v\n" + "".join(f"{i},{i * 2}\n" for i in range(5)), encoding="utf-8"
+    )
+    assert ts.parse(str(c))["v"].tolist() == [0, 2, 4, 6, 8]
+
+    j = tmp_path / "big.json"
+    j.write_text("".join(f'{{"t":{i},"v":{i}}}\n' for i in range(7)), encoding="utf-8")
+    df = ts.parse(str(j))
+    assert df["t"].tolist() == list(range(7))
+
+
+def test_parse_json_ranges_merge_int_and_float(monkeypatch, tmp_path: Path):
+    from app.ingestion import timeseries_ingestor
+
+    monkeypatch.setattr(timeseries_ingestor, "LOW_MEMORY_BYTES", 0)
+    monkeypatch.setattr(timeseries_ingestor, "JSON_RANGE_BYTES", 16)
+    ts = TimeSeriesIngestor(out_dir=str(tmp_path), low_memory=True)
+    read_ranges = []
+    orig = TimeSeriesIngestor._read_jsonl_ranges
+    monkeypatch.setattr(
+        TimeSeriesIngestor,
+        "_read_jsonl_ranges",
+        staticmethod(lambda p: read_ranges.append(p) or orig(p)),
+    )
+
+    j = tmp_path / "mixed.json"
+    rows = [f'{{"t":{i},"v":{i}}}' for i in range(4)]  # int64 ranges ...
+    rows += [f'{{"t":{i},"v":{i}.5}}' for i in range(4, 8)]  # ... then double
+    j.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    df = ts.parse(str(j))
+    assert read_ranges  # the ranged Arrow path did the read
+    assert df["v"].tolist() == [0, 1, 2, 3, 4.5, 5.5, 6.5, 7.5]
+
+    # Ranges Arrow cannot merge at all (string vs number): pandas reads the file.
+    k = tmp_path / "clash.json"
+    k.write_text('{"v":"a"}\n' * 3 + '{"v":1}\n' * 3, encoding="utf-8")
+    assert ts.parse(str(k))["v"].tolist() == ["a"] * 3 + [1] * 3
+
+
+def test_standardize_json_payloads_from_parsed_frame(
+    ts: TimeSeriesIngestor, tmp_path: Path
+):
+    p = tmp_path / "payloads.json"
+    lines = [
+        {"path": "s0.csv", "t_unit": "ms", "values": [{"t": 10, "v": 0}]},
+        {"path": "s1.csv", "values": [{"t": 1, "v": 1}], "material": {"formula": "Si"}},
+    ]
+    p.write_bytes(b"\n".join(json.dumps(x).encode() for x in lines) + b"\n\n")
+
+    df = ts.parse(str(p))
+    assert ts.to_records(df) == lines  # nested arrays and Arrow's None fill undone
+    other = tmp_path / "other.json"
+    other.write_text('{"path": "x.csv", "values": []}\n', encoding="utf-8")
+    ts.parse(str(other))  # a parse in between does not affect `df`'s documents
+    docs = list(ts.standardize_df(df))
+    assert [d.source_id for d in docs] == ["s0.csv", "s1.csv"]
+    assert docs[0].values == [{"t": 0.01, "v": 0.0}]
+    assert docs[1].material.canonical_formula == "Si"
+
+
 def test_parse_netcdf_uses_xarray_if_available(
     monkeypatch, ts: TimeSeriesIngestor, tmp_path: Path
 ):
@@ -75,6 +192,44 @@ def test_parse_netcdf_uses_xarray_if_available(
     assert df["a"].tolist() == [1, 2]
 
 
+def test_parse_large_netcdf_opens_chunked(
+    monkeypatch, ts: TimeSeriesIngestor, tmp_path: Path
+):
+    from app.ingestion import timeseries_ingestor
+
+    p = tmp_path / "big.nc"
+    p.write_bytes(b"\x00")
+    calls = {}
+
+    class DummyDask:
+        def compute(self, scheduler):
+            calls["scheduler"] = scheduler
+            return pd.DataFrame({"i": [10, 11], "a": [1, 2]}, index=[0, 0])
+
+    class DummyDS:
+        def to_dask_dataframe(self):
+            return DummyDask()
+
+    def open_dataset(path, engine=None, chunks=None):
+        calls.update(engine=engine, chunks=chunks)
+        return DummyDS()
+
+    monkeypatch.setattr(timeseries_ingestor, "LARGE_NETCDF_BYTES", 0)
+    monkeypatch.setattr(
+        timeseries_ingestor.importlib.util, "find_spec", lambda name: object()
+    )
+    monkeypatch.setitem(
+        __import__("sys").modules,
+        "xarray",
+        SimpleNamespace(open_dataset=open_dataset),
+    )
+
+    df = ts.parse(str(p))
+    assert calls == {"engine": "h5netcdf", "chunks": {}, "scheduler": "threads"}
+    assert df.index.tolist() == [0, 1]
+    assert list(df.columns) == ["i", "a"]
+
+
 def test_parse_netcdf_raises_if_xarray_missing(
     monkeypatch, ts: TimeSeriesIngestor, tmp_path: Path
 ):
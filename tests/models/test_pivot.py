@@ -29,6 +29,22 @@ def test_material_identity_capitalizes_and_sorts_elements():
     assert mi.canonical_formula == "O2Si"
 
 
+def test_pivot_models_are_frozen():
+    mi = MaterialIdentity(
+        formula="SiO2",
+        canonical_formula="O2Si",
+        elements=["O", "Si"],
+        n_elements=2,
+        material_hash="abc123",
+    )
+    with pytest.raises(ValidationError):
+        mi.material_hash = "other"
+
+    td = TextDoc(uid="u", source="s", created_at=now_utc(), text="t")
+    with pytest.raises(ValidationError):
+        td.title = "changed"
+
+
 def test_material_identity_invalid_elements_type_raises():
     with pytest.raises(ValidationError):
         MaterialIdentity(
@@ -48,7 +64,7 @@ def test_textdoc_minimal_fields_and_defaults():
         text="hello",
     )
     assert td.kind == "text"
-    assert td.version == "v1"
+    assert td.version == "v2"
     assert td.title is None
     assert td.year is None
     assert td.material is None
@@ -67,7 +83,7 @@ def test_textdoc_serialization_contains_expected_fields():
     assert data["kind"] == "text"
     assert data["text"] == "content"
     assert data["title"] == "Title"
-    assert data["version"] == "v1"
+    assert data["version"] == "v2"
 
 
 def test_simulationdoc_requires_material():
@@ -116,6 +132,24 @@ def test_timeseriesdoc_defaults_and_types():
     assert ts.values[1]["v"] == 2.0
 
 
+def test_timeseriesdoc_is_columnar():
+    ts = TimeSeriesDoc(
+        uid="t4",
+        source="local",
+        created_at=now_utc(),
+        units={},
+        values=[{"t": 0.0, "v": 1.0}, {"t": 1.0, "v": 2.0}],
+    )
+    dumped = ts.model_dump()
+    assert dumped["t"] == [0.0, 1.0] and dumped["v"] == [1.0, 2.0]
+    assert "values" not in dumped
+    assert TimeSeriesDoc.model_validate(dumped) == ts
+    with pytest.raises(ValidationError):
+        TimeSeriesDoc(
+            uid="t5", source="local", created_at=now_utc(), units={}, t=[0.0], v=[]
+        )
+
+
 def test_timeseriesdoc_invalid_units_type_raises():
     with pytest.raises(ValidationError):
         TimeSeriesDoc(
@@ -17,6 +17,15 @@ def test_mk_uid_is_deterministic():
     assert UUID(u1).version == 5
 
 
+def test_mk_uid_matches_uuid5():
+    from uuid import NAMESPACE_URL, uuid5
+
+    for ext in ("ext-1", "10.1/é", ""):
+        assert _mk_uid("europepmc", ext) == str(
+            uuid5(NAMESPACE_URL, f"europepmc:{ext}")
+        )
+
+
 def test_to_textdoc_minimal_maps_fields_and_year():
     row = {
         "id": "EPMC-1",
@@ -46,6 +55,15 @@ def test_to_textdoc_parses_authors_and_venue():
     assert doc.venue == "J. Energy"
 
 
+def test_to_textdoc_authors_list_wins_and_ragged_author_string():
+    doc = to_textdoc({"id": "3", "title": "t", "authors": ["Roe R"]})
+    assert doc.authors == ["Roe R"]
+    doc = to_textdoc(
+        {"id": "4", "title": "t", "author_string": "Doe J;Smith A  ;  Li W"}
+    )
+    assert doc.authors == ["Doe J", "Smith A", "Li W"]
+
+
 def test_to_simdoc_maps_properties_and_material_identity():
     item = {
         "material_id": "mp-149",
@@ -100,9 +118,28 @@ def test_to_tsdoc_with_material_identity():
     assert sorted(doc.material.elements) == ["O", "Si"]
 
 
+def test_material_identity_shared_per_formula():
+    a = to_simdoc({"material_id": "mp-1", "formula_pretty": "SiO2"})
+    b = to_tsdoc({"path": "p.csv", "material": {"formula": "SiO2"}})
+    assert a.material is b.material
+    assert a.material.elements == ["O", "Si"]
+    assert (
+        a.material.model_dump()
+        == type(a.material)(**a.material.model_dump()).model_dump()
+    )
+
+
 def test_to_tsdoc_defaults_when_minimal():
     payload = {"path": "a.csv", "values": []}
     doc = to_tsdoc(payload)
     assert doc.modality == "spectra"
     assert isinstance(doc.values, list)
     assert doc.values == []
+
+
+def test_to_tsdoc_x_y_keys_and_bad_unit():
+    payload = {"path": "a.csv", "t_unit": "min", "values": [{"x": "2", "y": 3}]}
+    doc = to_tsdoc(payload)
+    assert doc.values == [{"t": 120.0, "v": 3.0}]
+    with pytest.raises(ValueError):
+        to_tsdoc({**payload, "t_unit": "fortnight"})
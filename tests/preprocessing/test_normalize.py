@@ -1,3 +1,5 @@
+import hashlib
+import random
 from datetime import datetime, timezone, timedelta
 
 import pytest
@@ -5,10 +7,12 @@ import pytest
 from app.preprocessing.normalize import (
     parse_date_any,
     canonicalize_formula,
+    intern_element,
     material_hash_from_formula,
     to_eV,
     to_K,
     to_s,
+    _parse_ymd,
 )
 
 
@@ -30,6 +34,25 @@ def test_parse_date_any_parses_various_formats():
     assert d3.year == 2024 and d3.month == 1 and d3.day == 1
 
 
+def test_parse_date_any_short_dates_and_invalid_fall_through():
+    assert parse_date_any("2024-3-5") == datetime(2024, 3, 5, tzinfo=timezone.utc)
+    assert parse_date_any("2024-03-15T10:00:00Z") == datetime(
+        2024, 3, 15, 10, tzinfo=timezone.utc
+    )
+    before = datetime.now(timezone.utc)
+    assert parse_date_any("2024-13-01") >= before  # invalid month: "now" fallback
+    assert parse_date_any("2024-01/05") >= before  # mixed separators
+
+
+def test_parse_date_any_timestamps_skip_the_date_cache():
+    _parse_ymd.cache_clear()
+    assert parse_date_any("2024-03-15T10:00:00+02:00") == datetime(
+        2024, 3, 15, 8, tzinfo=timezone.utc
+    )
+    assert parse_date_any("2024-03-15T10:00:00Z").tzinfo is timezone.utc
+    assert _parse_ymd.cache_info().currsize == 0
+
+
 def test_parse_date_any_parses_timestamps_seconds_and_ms():
     ts = 1_700_000_000
     d_s = parse_date_any(ts)
@@ -78,6 +101,7 @@ def test_material_hash_is_stable_and_short():
     assert h1 == h2
     assert isinstance(h1, str) and len(h1) == 16
     assert h1 != material_hash_from_formula("Si")
+    assert h1 == hashlib.blake2b(b"O2Si", digest_size=8).hexdigest()
 
 
 def test_to_eV_supported_units():
@@ -99,6 +123,15 @@ def test_to_K_supported_units():
     assert to_K(32, "F") == pytest.approx(273.15)
 
 
+def test_to_K_matches_the_per_unit_formulas_exactly():
+    rng = random.Random(0)
+    for _ in range(2000):
+        v = rng.uniform(-500.0, 5000.0)
+        assert to_K(v, "F") == (v - 32) * 5 / 9 + 273.15
+        assert to_K(v, "C") == v + 273.15
+        assert to_K(v, "K") == v
+
+
 def test_to_K_unsupported_raises():
     with pytest.raises(ValueError):
         to_K(100, "Rankine")
@@ -116,3 +149,22 @@ def test_to_s_supported_units():
 def test_to_s_unsupported_raises():
     with pytest.raises(ValueError):
         to_s(1.0, "day")
+
+
+def test_canonicalize_formula_cached_result_is_not_shared():
+    _, elems = canonicalize_formula("NaCl")
+    elems.append("X")
+    assert canonicalize_formula("NaCl")[1] == ["Cl", "Na"]
+    assert material_hash_from_formula("NaCl") == material_hash_from_formula("ClNa")
+
+
+def test_canonicalize_formula_ignores_whitespace():
+    assert canonicalize_formula(" Fe 2 O3 ") == canonicalize_formula("Fe2O3")
+    assert canonicalize_formula("F e2") == ("Fe2", ["Fe"])
+
+
+def test_element_symbols_are_interned():
+    _, a = canonicalize_formula("SiO2")
+    _, b = canonicalize_formula("O3Si2")
+    assert a[0] is b[0] and a[1] is b[1]
+    assert intern_element("".join(["s", "i"])) is a[1]
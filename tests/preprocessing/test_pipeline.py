@@ -2,6 +2,8 @@ from app.preprocessing.pipeline import (
     preprocess_text,
     preprocess_sim,
     preprocess_timeseries,
+    iter_text,
+    iter_timeseries,
 )
 
 
@@ -79,3 +81,50 @@ def test_preprocess_timeseries_empty_returns_empty_list(mocker):
     out = preprocess_timeseries([])
     assert out == []
     to_tsdoc.assert_not_called()
+
+
+def test_iter_text_is_lazy(mocker):
+    to_textdoc = mocker.patch(
+        "app.preprocessing.pipeline.to_textdoc", side_effect=lambda r, **kw: r["id"]
+    )
+    it = iter_text([{"id": "1"}, {"id": "2"}])
+    to_textdoc.assert_not_called()
+    assert list(it) == ["1", "2"]
+
+
+def test_preprocess_spot_checks_constructed_docs():
+    import pytest
+    from pydantic import ValidationError
+
+    good = {"path": "a.csv", "values": [{"t": 0, "v": 1}], "units": {"y": "a.u."}}
+    bad = {**good, "units": {"y": 1}}  # Dict[str, str]
+    with pytest.raises(ValidationError):
+        preprocess_timeseries([bad, good])
+    with pytest.raises(ValidationError):
+        preprocess_timeseries([good, bad])
+    with pytest.raises(ValidationError):
+        list(iter_timeseries([bad]))
+    assert preprocess_timeseries([good])[0].values == [{"t": 0.0, "v": 1.0}]
+
+
+def test_spot_check_revalidates_nested_material():
+    import pytest
+    from pydantic import ValidationError
+
+    from app.models.pivot import MaterialIdentity
+    from app.preprocessing.adapters import to_tsdoc
+    from app.preprocessing.pipeline import _validated
+
+    doc = to_tsdoc({"path": "a.csv", "values": [{"t": 0, "v": 1}], "units": {}})
+    assert _validated(doc).t == [0.0]
+    bad = MaterialIdentity.model_construct(
+        formula="X", canonical_formula="X", elements=["X"], n_elements="many"
+    )
+    with pytest.raises(ValidationError):
+        _validated(doc.model_copy(update={"material": bad}))
+
+
+def test_preprocess_sim_shares_one_now_per_batch():
+    docs = preprocess_sim([{"material_id": "mp-1"}, {"material_id": "mp-2"}])
+    assert docs[0].created_at is docs[1].created_at
+    assert docs[0].created_at.tzinfo is not None